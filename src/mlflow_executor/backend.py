@@ -1,5 +1,24 @@
+from __future__ import annotations
+
 import abc
-from typing import Any, Protocol
+import asyncio
+import time
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, FIRST_EXCEPTION
+from typing import Any, Iterable, Protocol
+
+from mlflow_executor import exceptions, streaming
+
+#: Seconds between checks when promises can only be polled.
+POLL_INTERVAL = 0.05
+
+
+def _raised(promise: Promise) -> bool:
+    """Returns True if the finished ``promise`` raised an exception."""
+    try:
+        promise.result(timeout=0)
+    except Exception:
+        return True
+    return False
 
 
 class Runner(Protocol):
@@ -20,9 +39,95 @@ class Promise(abc.ABC):
     """
 
     @abc.abstractmethod
-    def result(self) -> Any:
-        """Returns the result of the call that the future represents."""
-        pass
+    def result(self, timeout: float | None = None) -> Any:
+        """Returns the result of the call that the future represents.
+
+        Parameters
+        ----------
+        timeout : float, default=None
+            Seconds to wait for the result. If None, waits forever.
+
+        Raises
+        ------
+        TimeoutError if the call did not finish within ``timeout`` seconds.
+        """
+
+    @abc.abstractmethod
+    def done(self) -> bool:
+        """Returns True if the call was cancelled or finished executing."""
+
+    def cancel(self) -> bool:
+        """Attempts to cancel the call.
+
+        Derived classes should override this method when their backend
+        supports cancellation. The default implementation does nothing.
+
+        Returns
+        -------
+        requested : bool
+            True if cancellation was requested.
+        """
+        return False
+
+    def __await__(self):
+        """Awaits the result without blocking the event loop.
+
+        Derived classes should override this method when their backend has
+        native asyncio support. The default implementation waits for
+        :meth:`result` in the loop's default thread pool.
+        """
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(None, self.result).__await__()
+
+    @classmethod
+    def wait(
+        cls,
+        promises: Iterable[Promise],
+        timeout: float | None = None,
+        return_when: str = ALL_COMPLETED,
+    ) -> tuple[set[Promise], set[Promise]]:
+        """Waits for the given promises to complete.
+
+        Derived classes should override this method with the native
+        multiplexing primitive of their backend. The default implementation
+        polls :meth:`done` every :data:`POLL_INTERVAL` seconds.
+
+        Parameters
+        ----------
+        promises : iterable of Promise
+            Promises to wait for.
+
+        timeout : float, default=None
+            Maximum number of seconds to wait. If None, waits forever.
+
+        return_when : str {"FIRST_COMPLETED", "FIRST_EXCEPTION", \
+                "ALL_COMPLETED"}, default="ALL_COMPLETED"
+            When this function should return.
+
+        Returns
+        -------
+        done, not_done : tuple of sets
+            Finished and unfinished promises.
+        """
+        promises = set(promises)
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            done = {p for p in promises if p.done()}
+            not_done = promises - done
+
+            if not not_done:
+                break
+            if return_when == FIRST_COMPLETED and done:
+                break
+            if return_when == FIRST_EXCEPTION and any(map(_raised, done)):
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+
+            time.sleep(POLL_INTERVAL)
+
+        return done, not_done
 
 
 class BackendExecutor(abc.ABC):
@@ -38,6 +143,15 @@ class BackendExecutor(abc.ABC):
     def start(self) -> None:
         """Backend executors might need things to get started."""
 
+    def shutdown(self, wait: bool = True) -> None:
+        """Backend executors might need to release their resources.
+
+        Parameters
+        ----------
+        wait : bool, default=True
+            If True, blocks until all pending tasks are done.
+        """
+
     @abc.abstractmethod
     def run(self, runner: Runner) -> Promise:
         """Runs task.
@@ -48,6 +162,42 @@ class BackendExecutor(abc.ABC):
             Object with :meth:`execute`.
         """
 
+    def run_many(self, runners: Iterable[Runner]) -> list[Promise]:
+        """Runs many tasks at once.
+
+        Backends able to submit work in batches should override this method.
+        The default implementation calls :meth:`run` for each runner.
+
+        Parameters
+        ----------
+        runners : iterable of Runner
+            Objects with :meth:`run`.
+
+        Returns
+        -------
+        promises : list of Promise
+            One promise per runner, in the same order.
+        """
+        return [self.run(runner) for runner in runners]
+
+    def open_channel(
+        self, max_size: int = streaming.BUFFER_SIZE
+    ) -> streaming.Channel:
+        """Returns a channel to stream task output from the workers.
+
+        Backends able to stream should override this method.
+
+        Parameters
+        ----------
+        max_size : int, default=BUFFER_SIZE
+            Maximum number of buffered events.
+
+        Raises
+        ------
+        StreamingNotSupported by default.
+        """
+        raise exceptions.StreamingNotSupported(backend=type(self).__name__)
+
 
 def is_backend(backend: BackendExecutor):
     if not isinstance(backend, BackendExecutor):
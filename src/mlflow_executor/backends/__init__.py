@@ -1,7 +1,40 @@
-from mlflow_executor.backends.local import LocalBackend
-from mlflow_executor.backends.ray import RayBackend
+from typing import TYPE_CHECKING
+
+from mlflow_executor.imports import lazy_attributes
+
+if TYPE_CHECKING:
+    from mlflow_executor.backends.celery import CeleryBackend
+    from mlflow_executor.backends.database import DatabaseBackend
+    from mlflow_executor.backends.local import (
+        LocalBackend,
+        ProcessPoolBackend,
+        get_default_backend,
+        shutdown_default_backend,
+    )
+    from mlflow_executor.backends.ray import RayBackend
+    from mlflow_executor.backends.scheduling import SchedulingBackend
+
+__getattr__ = lazy_attributes(
+    __name__,
+    {
+        "CeleryBackend": "mlflow_executor.backends.celery",
+        "DatabaseBackend": "mlflow_executor.backends.database",
+        "LocalBackend": "mlflow_executor.backends.local",
+        "ProcessPoolBackend": "mlflow_executor.backends.local",
+        "RayBackend": "mlflow_executor.backends.ray",
+        "SchedulingBackend": "mlflow_executor.backends.scheduling",
+        "get_default_backend": "mlflow_executor.backends.local",
+        "shutdown_default_backend": "mlflow_executor.backends.local",
+    },
+)
 
 __all__ = [
+    "CeleryBackend",
+    "DatabaseBackend",
     "LocalBackend",
+    "ProcessPoolBackend",
     "RayBackend",
+    "SchedulingBackend",
+    "get_default_backend",
+    "shutdown_default_backend",
 ]
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
-from celery import Celery
+import fnmatch
+from concurrent.futures import ALL_COMPLETED
+from typing import Any, Iterable
+
+from celery import Celery, Signature, group
+from celery import exceptions as celery_exceptions
 from celery.result import AsyncResult as CeleryAsyncResult
+from celery.result import ResultSet
 
 from mlflow_executor import backend, settings
 
@@ -17,18 +23,233 @@ def execute_task(runner):
     return runner.run()
 
 
-class CeleryFutureBridge(backend.FutureBridge):
+@celery_app.task(name="run_celery_task")
+def execute_registered_task(
+    name: str,
+    args: list,
+    kwargs: dict,
+    task_id: str | None = None,
+    timeout: float | None = None,
+    retry_policy=None,
+    submitted_at: float | None = None,
+    profiler: dict | None = None,
+    priority: int = 0,
+    resources: list[str] | None = None,
+    callbacks: list | None = None,
+):
+    """Creates and runs the registered task ``name``.
+
+    Only the task name and arguments travel through the broker. The task
+    itself is created by the worker's tasks factory.
+    """
+    from mlflow_executor import profiling, task
+    from mlflow_executor.execution.runner import TaskRunner
+
+    runner = TaskRunner(
+        task.factory.create(name),
+        args=tuple(args),
+        kwargs=kwargs,
+        task_id=task_id,
+        timeout=timeout,
+        retry_policy=retry_policy,
+        priority=priority,
+        resources=resources,
+        profiler=profiling.Profiler(**profiler) if profiler else None,
+        callbacks=callbacks or (),
+    )
+    runner.timings.submitted_at = submitted_at or runner.timings.submitted_at
+    return runner.run()
+
+
+class CeleryPromise(backend.Promise):
     """Wrapper for Celery async result."""
 
     def __init__(self, celery_async_result: CeleryAsyncResult):
         self.celery_async_result = celery_async_result
 
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}: {self.get_id()}>"
+
     def get_id(self) -> str:
         return self.celery_async_result.id
 
     def get_state(self) -> str:
         return self.celery_async_result.state
 
+    def result(self, timeout: float | None = None) -> Any:
+        try:
+            return self.celery_async_result.get(
+                timeout=timeout, disable_sync_subtasks=False
+            )
+        except celery_exceptions.TimeoutError as exc:
+            raise TimeoutError(str(exc)) from exc
+
+    def done(self) -> bool:
+        return self.celery_async_result.ready()
+
+    def cancel(self) -> bool:
+        # SIGINT raises KeyboardInterrupt inside the worker process, which
+        # lets the running task clean up (e.g., kill the MLflow run).
+        self.celery_async_result.revoke(terminate=True, signal="SIGINT")
+        return True
+
     @classmethod
-    def from_id(cls, id: str) -> CeleryFutureBridge:
-        return cls(CeleryAsyncResult(id=id))
+    def wait(
+        cls,
+        promises: Iterable[CeleryPromise],
+        timeout: float | None = None,
+        return_when: str = ALL_COMPLETED,
+    ) -> tuple[set[CeleryPromise], set[CeleryPromise]]:
+        promises = list(promises)
+        if return_when != ALL_COMPLETED:
+            return super().wait(promises, timeout, return_when)
+
+        # Result backends supporting native joins (e.g., Redis) wait for
+        # all results at once instead of polling each of them.
+        results = ResultSet([p.celery_async_result for p in promises])
+        join = results.join_native
+        if not results.supports_native_join:
+            join = results.join
+
+        try:
+            join(timeout=timeout, propagate=False)
+        except celery_exceptions.TimeoutError:
+            pass
+
+        done = {p for p in promises if p.done()}
+        return done, set(promises) - done
+
+    @classmethod
+    def from_id(cls, id: str) -> CeleryPromise:
+        return cls(CeleryAsyncResult(id=id, app=celery_app))
+
+
+class CeleryBackend(backend.BackendExecutor):
+    """Celery executor.
+
+    :class:`TaskRunner` objects are sent as the task name and arguments
+    only, so messages stay small and can use compact serializers such as
+    msgpack. Other runners are pickled whole. Per-call retry policies and
+    callbacks are objects, so runners with them need the "pickle"
+    serializer. Pickled messages must be accepted by workers, see the
+    ``accept_content`` setting.
+
+    Workers are started with::
+
+        celery -A mlflow_executor.backends.celery worker -Q training
+            --include my.registries
+
+    Parameters
+    ----------
+    queue : str, default=None
+        Queue of tasks not matching any route. If None, the
+        ``task_default_queue`` setting is used.
+
+    routes : dict, str -> str, default=None
+        Queue per task name. Keys may be glob patterns, e.g.,
+        ``{"mlflow_executor.tasks.mlflow.*": "training"}``.
+
+    serializer : str, default=None
+        Serializer of task messages. If None, the ``task_serializer``
+        setting is used.
+
+    compression : str, default=None
+        Compression of task messages (e.g., "gzip"). If None, the
+        ``task_compression`` setting is used.
+
+    app : Celery, default=None
+        Celery application. If None, the one configured from
+        :class:`CelerySettings` is used.
+    """
+
+    def __init__(
+        self,
+        queue: str | None = None,
+        routes: dict[str, str] | None = None,
+        serializer: str | None = None,
+        compression: str | None = None,
+        app: Celery | None = None,
+    ):
+        self.app = app or celery_app
+        self.queue = queue or self.app.conf.task_default_queue
+        self.routes = routes or {}
+        self.serializer = serializer or self.app.conf.task_serializer
+        self.compression = compression or self.app.conf.task_compression
+
+    def run(self, runner: backend.Runner) -> CeleryPromise:
+        return CeleryPromise(self.signature(runner).apply_async())
+
+    def run_many(
+        self, runners: Iterable[backend.Runner]
+    ) -> list[CeleryPromise]:
+        # A group publishes every message through a single producer.
+        signatures = [self.signature(runner) for runner in runners]
+        if not signatures:
+            return []
+
+        group_result = group(signatures).apply_async()
+        return [CeleryPromise(result) for result in group_result.results]
+
+    def signature(self, runner: backend.Runner) -> Signature:
+        """Returns the Celery signature running ``runner`` on a worker."""
+        name = getattr(getattr(runner, "task", None), "name", None)
+        options = {
+            "queue": self.get_queue(name),
+            "compression": self.compression,
+        }
+
+        if name is None:
+            self.check_pickle_accepted()
+            return self.app.signature(
+                execute_task.name,
+                args=(runner,),
+                serializer="pickle",
+                **options,
+            )
+
+        if self.serializer != "pickle" and (
+            runner.retry_policy is not None or runner.callbacks
+        ):
+            raise ValueError(
+                "Per-call retry policies and callbacks can only be sent with "
+                f"the 'pickle' serializer, but got '{self.serializer}'."
+            )
+        if self.serializer == "pickle":
+            self.check_pickle_accepted()
+
+        return self.app.signature(
+            execute_registered_task.name,
+            args=(name, list(runner.args), runner.kwargs),
+            kwargs={
+                "task_id": runner.task_id,
+                "timeout": runner.token.timeout,
+                "retry_policy": runner.retry_policy,
+                "submitted_at": runner.timings.submitted_at,
+                "profiler": runner.profiler and vars(runner.profiler),
+                "priority": runner.priority,
+                "resources": runner.resources,
+                "callbacks": runner.callbacks or None,
+            },
+            task_id=runner.task_id,
+            serializer=self.serializer,
+            **options,
+        )
+
+    def check_pickle_accepted(self) -> None:
+        """Raises ValueError if workers reject pickled messages.
+
+        Workers would reject them and their promises never resolve.
+        """
+        if "pickle" not in self.app.conf.accept_content:
+            raise ValueError(
+                "Pickled messages are rejected by workers. Add 'pickle' to "
+                "the accept_content setting."
+            )
+
+    def get_queue(self, name: str | None) -> str:
+        """Returns the queue tasks with the given name are routed to."""
+        if name is not None:
+            for pattern, queue in self.routes.items():
+                if fnmatch.fnmatchcase(name, pattern):
+                    return queue
+        return self.queue
@@ -0,0 +1,504 @@
+from __future__ import annotations
+
+import argparse
+import importlib
+import logging
+import pickle
+import socket
+import threading
+import time
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, Iterable
+
+from kombu.utils.uuid import uuid
+from sqlalchemy import Row, and_, or_, select, update
+
+from mlflow_executor import backend, exceptions
+from mlflow_executor.db.base import sessionfactory
+from mlflow_executor.db.engine import get_engine
+from mlflow_executor.db.models import TaskJob
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatus(Enum):
+    """Job status.
+
+    Attributes
+    ----------
+    QUEUED. Job is waiting for a worker.
+    RUNNING. Job was claimed by a worker.
+    SUCCEEDED. Job has completed succesfully.
+    FAILED. An error occurred with the job.
+    CANCELLED. Job was cancelled.
+    """
+
+    QUEUED = 0
+    RUNNING = 1
+    SUCCEEDED = 2
+    FAILED = 3
+    CANCELLED = 4
+
+
+FINISHED = (
+    JobStatus.SUCCEEDED.value,
+    JobStatus.FAILED.value,
+    JobStatus.CANCELLED.value,
+)
+
+
+def _claimable(now: datetime):
+    """Condition matching queued jobs and jobs of dead workers."""
+    return or_(
+        TaskJob.status == JobStatus.QUEUED.value,
+        and_(
+            TaskJob.status == JobStatus.RUNNING.value,
+            TaskJob.visible_at < now,
+        ),
+    )
+
+
+class DatabasePromise(backend.Promise):
+    """Promise of a job stored in the ``task_job`` table.
+
+    Parameters
+    ----------
+    job_id : str
+        Id of the job.
+
+    poll_interval : float, default=0.5
+        Seconds between status reads while waiting.
+    """
+
+    def __init__(self, job_id: str, poll_interval: float = 0.5) -> None:
+        self.job_id = job_id
+        self.poll_interval = poll_interval
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}: {self.job_id}>"
+
+    def result(self, timeout: float | None = None) -> Any:
+        done, _ = self.wait([self], timeout)
+        if not done:
+            raise TimeoutError(f"Job '{self.job_id}' is not finished.")
+
+        with sessionfactory() as session:
+            job = session.get(TaskJob, self.job_id)
+            if job.status == JobStatus.SUCCEEDED.value:
+                return job.result
+            raise job.error
+
+    def done(self) -> bool:
+        with sessionfactory() as session:
+            status = session.scalar(
+                select(TaskJob.status).where(TaskJob.id == self.job_id)
+            )
+        return status in FINISHED
+
+    def cancel(self) -> bool:
+        """Cancels the job.
+
+        Queued jobs are cancelled right away. Running jobs are flagged and
+        the worker running them cancels the runner on its next heartbeat.
+        """
+        with sessionfactory() as session:
+            cancelled = session.execute(
+                update(TaskJob)
+                .where(
+                    TaskJob.id == self.job_id,
+                    TaskJob.status == JobStatus.QUEUED.value,
+                )
+                .values(
+                    status=JobStatus.CANCELLED.value,
+                    error=exceptions.TaskCancelled(),
+                    finished_at=datetime.now(),
+                )
+            ).rowcount
+            if not cancelled:
+                cancelled = session.execute(
+                    update(TaskJob)
+                    .where(
+                        TaskJob.id == self.job_id,
+                        TaskJob.status == JobStatus.RUNNING.value,
+                    )
+                    .values(cancel_requested=True)
+                ).rowcount
+            session.commit()
+
+        return bool(cancelled)
+
+    @classmethod
+    def wait(
+        cls,
+        promises: Iterable[DatabasePromise],
+        timeout: float | None = None,
+        return_when: str = ALL_COMPLETED,
+    ) -> tuple[set[DatabasePromise], set[DatabasePromise]]:
+        # A single status query per poll for all the promises.
+        promises = {p.job_id: p for p in promises}
+        poll_interval = min(
+            (p.poll_interval for p in promises.values()), default=0
+        )
+        deadline = None if timeout is None else time.monotonic() + timeout
+        done, not_done = set(), set(promises)
+
+        while True:
+            with sessionfactory() as session:
+                rows = session.execute(
+                    select(TaskJob.id, TaskJob.status).where(
+                        TaskJob.id.in_(not_done)
+                    )
+                ).all()
+
+            failed = False
+            for job_id, status in rows:
+                if status in FINISHED:
+                    done.add(job_id)
+                    not_done.discard(job_id)
+                    failed |= status != JobStatus.SUCCEEDED.value
+
+            if (
+                not not_done
+                or (return_when == FIRST_COMPLETED and done)
+                or (return_when != ALL_COMPLETED and failed)
+            ):
+                break
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                time.sleep(min(poll_interval, remaining))
+            else:
+                time.sleep(poll_interval)
+
+        return (
+            {promises[i] for i in done},
+            {promises[i] for i in not_done},
+        )
+
+
+class DatabaseBackend(backend.BackendExecutor):
+    """Durable job queue stored in the configured SQL database.
+
+    :meth:`run` stores the pickled runner in the ``task_job`` table and
+    :class:`DatabaseWorker` processes, on this or any other host connected
+    to the same database, claim and run it. Jobs survive the submitting
+    process and are re-queued when the worker running them dies.
+
+    Workers are started with::
+
+        mlflow-executor-db-worker --include my.registries
+
+    Parameters
+    ----------
+    queue : str, default="default"
+        Name of the queue jobs are sent to.
+
+    visibility_timeout : float, default=300.0
+        Seconds a claimed job stays invisible to other workers without a
+        heartbeat of the worker running it. Jobs of workers which stopped
+        heartbeating are claimed again.
+
+    max_attempts : int, default=3
+        Maximum number of claims of a job. A job abandoned this many times
+        fails with :class:`JobAbandoned`.
+
+    poll_interval : float, default=0.5
+        Seconds between status reads of the promises.
+    """
+
+    def __init__(
+        self,
+        queue: str = "default",
+        visibility_timeout: float = 300.0,
+        max_attempts: int = 3,
+        poll_interval: float = 0.5,
+    ):
+        self.queue = queue
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self._started = False
+
+    def start(self) -> None:
+        """Creates the ``task_job`` table if it does not exist."""
+        if not self._started:
+            TaskJob.__table__.create(get_engine(), checkfirst=True)
+            self._started = True
+
+    def run(self, runner: backend.Runner) -> DatabasePromise:
+        return self.run_many([runner])[0]
+
+    def run_many(self, runners: list[backend.Runner]) -> list[DatabasePromise]:
+        # All the jobs are inserted in a single transaction.
+        self.start()
+        jobs = [self._create_job(runner) for runner in runners]
+        ids = [job.id for job in jobs]
+        with sessionfactory() as session:
+            session.add_all(jobs)
+            session.commit()
+
+        return [DatabasePromise(i, self.poll_interval) for i in ids]
+
+    def _create_job(self, runner: backend.Runner) -> TaskJob:
+        return TaskJob(
+            id=uuid(),
+            queue=self.queue,
+            priority=getattr(runner, "priority", 0),
+            status=JobStatus.QUEUED.value,
+            runner=runner,
+            attempts=0,
+            max_attempts=self.max_attempts,
+            visibility_timeout=self.visibility_timeout,
+            cancel_requested=False,
+        )
+
+
+class DatabaseWorker:
+    """Claims and runs jobs of :class:`DatabaseBackend` queues.
+
+    Jobs are claimed with ``SELECT ... FOR UPDATE SKIP LOCKED`` so workers
+    never wait for each other. On databases without row locks (e.g.,
+    SQLite), the claim is a conditional update which only one worker wins.
+    While a job runs, a heartbeat thread extends its visibility timeout and
+    forwards cancellation requests to the runner.
+
+    Parameters
+    ----------
+    queues : list of str, default=("default",)
+        Queues to claim jobs from.
+
+    poll_interval : float, default=1.0
+        Seconds to wait when the queues are empty.
+
+    worker_id : str, default=None
+        Worker identifier. If None, "<hostname>:<uuid>" is used.
+    """
+
+    def __init__(
+        self,
+        queues: Iterable[str] = ("default",),
+        poll_interval: float = 1.0,
+        worker_id: str | None = None,
+    ):
+        self.queues = list(queues)
+        self.poll_interval = poll_interval
+        self.worker_id = worker_id or f"{socket.gethostname()}:{uuid()[:8]}"
+        self._stop = threading.Event()
+
+    def run(self, burst: bool = False) -> None:
+        """Runs jobs until :meth:`stop` is called.
+
+        Parameters
+        ----------
+        burst : bool, default=False
+            If True, returns as soon as the queues are empty.
+        """
+        self._stop.clear()
+        TaskJob.__table__.create(get_engine(), checkfirst=True)
+
+        while not self._stop.is_set():
+            job = self.claim()
+            if job is None:
+                if burst:
+                    return
+                self._stop.wait(self.poll_interval)
+                continue
+
+            self.process(job)
+
+    def stop(self) -> None:
+        """Stops the worker after the job being run, if any."""
+        self._stop.set()
+
+    def claim(self) -> TaskJob | None:
+        """Claims the next job, if any.
+
+        The job row is claimed without reading its pickled columns. Jobs
+        whose runner cannot be unpickled by this worker (e.g., their task
+        is not registered) fail with the unpickling error.
+
+        Returns
+        -------
+        job : TaskJob or None
+            Detached claimed job.
+        """
+        while True:
+            now = datetime.now()
+            with sessionfactory() as session:
+                row = session.execute(
+                    select(
+                        TaskJob.id,
+                        TaskJob.attempts,
+                        TaskJob.max_attempts,
+                        TaskJob.visibility_timeout,
+                    )
+                    .where(TaskJob.queue.in_(self.queues), _claimable(now))
+                    .order_by(TaskJob.priority.desc(), TaskJob.created_at)
+                    .limit(1)
+                    .with_for_update(skip_locked=True)
+                ).one_or_none()
+                if row is None:
+                    return None
+
+                visible_at = now + timedelta(seconds=row.visibility_timeout)
+                claimed = session.execute(
+                    update(TaskJob)
+                    .where(
+                        TaskJob.id == row.id,
+                        TaskJob.attempts == row.attempts,
+                        _claimable(now),
+                    )
+                    .values(
+                        status=JobStatus.RUNNING.value,
+                        attempts=row.attempts + 1,
+                        worker_id=self.worker_id,
+                        visible_at=visible_at,
+                        started_at=now,
+                    )
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+                if not claimed:
+                    # Another worker won the race.
+                    session.rollback()
+                    continue
+
+                session.commit()
+
+            if row.attempts + 1 > row.max_attempts:
+                error = exceptions.JobAbandoned(
+                    job_id=row.id, attempts=row.max_attempts
+                )
+                self._finish(row, JobStatus.FAILED, error=error)
+                continue
+
+            try:
+                with sessionfactory() as session:
+                    job = session.get(TaskJob, row.id)
+            except Exception as exc:
+                logger.exception("Could not load job %s.", row.id)
+                self._finish(row, JobStatus.FAILED, error=self._picklable(exc))
+                continue
+
+            return job
+
+    def process(self, job: TaskJob) -> None:
+        """Runs the claimed job and stores its outcome."""
+        logger.info("Running job %s (attempt %s).", job.id, job.attempts)
+        finished = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat, args=(job, finished), daemon=True
+        )
+        heartbeat.start()
+
+        try:
+            retval = job.runner.run()
+        except BaseException as exc:
+            status = JobStatus.FAILED
+            if isinstance(exc, exceptions.TaskCancelled):
+                status = JobStatus.CANCELLED
+            self._finish(job, status, error=self._picklable(exc))
+        else:
+            try:
+                pickle.dumps(retval)
+            except Exception as exc:
+                self._finish(job, JobStatus.FAILED, error=self._picklable(exc))
+            else:
+                self._finish(job, JobStatus.SUCCEEDED, result=retval)
+        finally:
+            finished.set()
+            heartbeat.join()
+
+    def _heartbeat(self, job: TaskJob, finished: threading.Event) -> None:
+        interval = job.visibility_timeout / 3
+        while not finished.wait(interval):
+            visible_at = datetime.now() + timedelta(
+                seconds=job.visibility_timeout
+            )
+            with sessionfactory() as session:
+                owned = session.execute(
+                    update(TaskJob)
+                    .where(
+                        TaskJob.id == job.id,
+                        TaskJob.worker_id == self.worker_id,
+                        TaskJob.status == JobStatus.RUNNING.value,
+                    )
+                    .values(visible_at=visible_at)
+                ).rowcount
+                cancel_requested = session.scalar(
+                    select(TaskJob.cancel_requested).where(
+                        TaskJob.id == job.id
+                    )
+                )
+                session.commit()
+
+            # Either cancelled or taken over by another worker after
+            # missing heartbeats. In both cases, this run is not needed.
+            if cancel_requested or not owned:
+                cancel = getattr(job.runner, "cancel", None)
+                if cancel is not None:
+                    cancel()
+                return
+
+    def _finish(
+        self,
+        job: TaskJob | Row,
+        status: JobStatus,
+        result: Any = None,
+        error: BaseException | None = None,
+    ) -> None:
+        with sessionfactory() as session:
+            session.execute(
+                update(TaskJob)
+                .where(
+                    TaskJob.id == job.id,
+                    TaskJob.worker_id == self.worker_id,
+                    TaskJob.status == JobStatus.RUNNING.value,
+                )
+                .values(
+                    status=status.value,
+                    result=result,
+                    error=error,
+                    finished_at=datetime.now(),
+                )
+            )
+            session.commit()
+
+    @staticmethod
+    def _picklable(exc: BaseException) -> BaseException:
+        try:
+            pickle.loads(pickle.dumps(exc))
+        except Exception:
+            return RuntimeError(repr(exc))
+        return exc
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Starts a :class:`DatabaseWorker`."""
+    parser = argparse.ArgumentParser(description="Database backend worker.")
+    parser.add_argument(
+        "-Q", "--queue", action="append", dest="queues", default=None
+    )
+    parser.add_argument(
+        "-I",
+        "--include",
+        action="append",
+        default=[],
+        help="Modules imported before starting, e.g., the one including "
+        "the task registries into the tasks factory.",
+    )
+    parser.add_argument("--poll-interval", type=float, default=1.0)
+    parser.add_argument("--burst", action="store_true")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    for name in args.include:
+        importlib.import_module(name)
+
+    worker = DatabaseWorker(
+        queues=args.queues or ("default",), poll_interval=args.poll_interval
+    )
+    worker.run(burst=args.burst)
@@ -1,40 +1,394 @@
-from concurrent.futures import Future, ThreadPoolExecutor
-from typing import Any
+from __future__ import annotations
 
-from mlflow_executor import backend
+import asyncio
+import importlib
+import multiprocessing
+import multiprocessing.util
+import os
+import sys
+import threading
+from concurrent.futures import (
+    ALL_COMPLETED,
+    CancelledError,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from concurrent.futures import wait as wait_futures
+from typing import Any, Iterable, Literal
 
+from mlflow_executor import backend, exceptions, streaming
+
+#: Modules imported by each worker process when warm start is enabled.
+WARM_START_MODULES = ("mlflow", "mlflow.projects", "mlflow_executor.task")
+
+_default_backend: LocalBackend | None = None
+_default_backend_lock = threading.Lock()
+
+
+def _run(runner: backend.Runner) -> Any:
+    """Runs given task."""
+    return runner.run()
 
-def _run(
-    fn,
-    args: tuple = (),
-    kwargs: dict | None = None,
-    max_workers: int | None = None,
-) -> Future:
-    if kwargs is None:
-        kwargs = {}
 
-    executor = ThreadPoolExecutor(max_workers=max_workers)
-    return executor.submit(fn, *args, **kwargs)
+def _import_modules(modules: tuple[str, ...]) -> None:
+    """Imports the given modules in the current process."""
+    for name in modules:
+        importlib.import_module(name)
 
 
 class LocalPromise(backend.Promise):
-    def __init__(self, future: Future) -> None:
+    def __init__(
+        self, future: Future, runner: backend.Runner | None = None
+    ) -> None:
         self.future = future
+        self.runner = runner
+
+    def result(self, timeout: float | None = None) -> Any:
+        try:
+            return self.future.result(timeout=timeout)
+        except CancelledError:
+            raise exceptions.TaskCancelled() from None
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def cancel(self) -> bool:
+        # Pending calls are dropped without taking a worker. Runners living
+        # in this process (e.g. :class:`TaskRunner`) can also be cancelled
+        # while running.
+        if self.future.cancel():
+            return True
+
+        cancel = getattr(self.runner, "cancel", None)
+        if cancel is None:
+            return False
+
+        cancel()
+        return True
 
-    def result(self) -> Any:
-        return self.future.result()
+    def __await__(self):
+        return self._result_async().__await__()
+
+    async def _result_async(self) -> Any:
+        try:
+            return await asyncio.wrap_future(self.future)
+        except asyncio.CancelledError:
+            if self.future.cancelled():
+                raise exceptions.TaskCancelled() from None
+            raise
+
+    @classmethod
+    def wait(
+        cls,
+        promises: Iterable[LocalPromise],
+        timeout: float | None = None,
+        return_when: str = ALL_COMPLETED,
+    ) -> tuple[set[LocalPromise], set[LocalPromise]]:
+        promises = {p.future: p for p in promises}
+        done, not_done = wait_futures(promises, timeout, return_when)
+        return {promises[f] for f in done}, {promises[f] for f in not_done}
 
 
 class LocalBackend(backend.BackendExecutor):
     """Local executor.
 
     The local executor uses the built-in :class:`ThreadPoolExecutor` located
-    in the ``concurrent`` python package.
+    in the ``concurrent`` python package. A single pool is owned by the
+    backend and reused for every :meth:`run` call.
+
+    Parameters
+    ----------
+    max_workers : int, default=None
+        Maximum number of threads running tasks concurrently. If None, the
+        :class:`ThreadPoolExecutor` default is used.
+
+    max_queue_size : int, default=None
+        Maximum number of submitted tasks waiting for a free worker. If None,
+        the submission queue is unbounded.
+
+    on_full : str {"block", "reject"}, default="block"
+        Behaviour when the submission queue is full. "block" waits until a
+        slot is released while "reject" raises :class:`BackendQueueFull`.
     """
 
-    def __init__(self, max_workers: int | None = None):
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_queue_size: int | None = None,
+        on_full: Literal["block", "reject"] = "block",
+    ):
+        if on_full not in ("block", "reject"):
+            raise ValueError(
+                "`on_full` param can either be 'block' or 'reject', "
+                f"but got '{on_full}'."
+            )
+
         self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.on_full = on_full
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._slots: threading.BoundedSemaphore | None = None
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of submitted tasks waiting for a free worker."""
+        return self._queued
+
+    @property
+    def active_workers(self) -> int:
+        """Number of workers currently running a task."""
+        return self._active
+
+    def start(self) -> ThreadPoolExecutor:
+        """Starts the worker pool if it is not running already.
+
+        Returns
+        -------
+        executor : ThreadPoolExecutor
+            The running worker pool.
+        """
+        return self._start()[0]
+
+    def _start(
+        self,
+    ) -> tuple[ThreadPoolExecutor, threading.BoundedSemaphore | None]:
+        # The pool and its slots are read together, so a concurrent
+        # shutdown cannot leave :meth:`run` with a missing pool.
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers
+                )
+                if self.max_queue_size is not None:
+                    capacity = (
+                        self._executor._max_workers + self.max_queue_size
+                    )
+                    self._slots = threading.BoundedSemaphore(capacity)
+            return self._executor, self._slots
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shuts down the worker pool.
+
+        Parameters
+        ----------
+        wait : bool, default=True
+            If True, blocks until all pending tasks are done.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._slots = None
+
+        if executor is not None:
+            executor.shutdown(wait=wait)
 
     def run(self, runner: backend.Runner) -> LocalPromise:
-        future = _run(fn=runner.run, max_workers=self.max_workers)
+        """Runs ``runner`` on the worker pool.
+
+        Raises
+        ------
+        RuntimeError if the backend is shut down while submitting.
+        """
+        executor, slots = self._start()
+        self._acquire_slot(slots)
+
+        with self._lock:
+            self._queued += 1
+
+        try:
+            future = executor.submit(self._run, runner)
+        except BaseException:
+            self._release_slot(slots, queued=True)
+            raise
+
+        future.add_done_callback(
+            lambda f: self._release_slot(slots, queued=f.cancelled())
+        )
+        return LocalPromise(future, runner)
+
+    def open_channel(
+        self, max_size: int = streaming.BUFFER_SIZE
+    ) -> streaming.LocalChannel:
+        return streaming.LocalChannel(max_size)
+
+    def _run(self, runner: backend.Runner) -> Any:
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+
+        try:
+            return runner.run()
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def _acquire_slot(self, slots: threading.BoundedSemaphore | None) -> None:
+        if slots is None:
+            return
+
+        if not slots.acquire(blocking=self.on_full == "block"):
+            raise exceptions.BackendQueueFull(size=self.max_queue_size)
+
+    def _release_slot(
+        self, slots: threading.BoundedSemaphore | None, queued: bool = False
+    ) -> None:
+        if queued:
+            with self._lock:
+                self._queued -= 1
+
+        if slots is not None:
+            slots.release()
+
+
+class ProcessPoolBackend(backend.BackendExecutor):
+    """Process pool executor.
+
+    Runs tasks in worker processes using the built-in
+    :class:`ProcessPoolExecutor`, so CPU bound tasks are not serialized by
+    the GIL. Runners are pickled to the workers; registered tasks only send
+    their name (see :meth:`Task.__reduce__`).
+
+    Parameters
+    ----------
+    max_workers : int, default=None
+        Maximum number of worker processes. If None, the number of
+        processors on the machine is used.
+
+    max_tasks_per_child : int, default=None
+        Number of tasks a worker process runs before it is replaced with a
+        fresh one. Use it to contain memory growth. Requires python >= 3.11.
+
+    warm_start : bool, default=False
+        If True, worker processes import ``mlflow`` and the tasks factory
+        when started, so the first task does not pay the import cost.
+
+    mp_context : str, default=None
+        Multiprocessing start method, e.g. "spawn" or "forkserver".
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_tasks_per_child: int | None = None,
+        warm_start: bool = False,
+        mp_context: str | None = None,
+    ):
+        if max_tasks_per_child is not None and sys.version_info < (3, 11):
+            raise ValueError("`max_tasks_per_child` requires python >= 3.11.")
+
+        self.max_workers = max_workers
+        self.max_tasks_per_child = max_tasks_per_child
+        self.warm_start = warm_start
+        self.mp_context = mp_context
+
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def start(self) -> ProcessPoolExecutor:
+        """Starts the worker processes if they are not running already.
+
+        Returns
+        -------
+        executor : ProcessPoolExecutor
+            The running worker processes.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._create_executor()
+            return self._executor
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shuts down the worker processes.
+
+        Parameters
+        ----------
+        wait : bool, default=True
+            If True, blocks until all pending tasks are done.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def run(self, runner: backend.Runner) -> LocalPromise:
+        """Runs ``runner`` in a worker process.
+
+        Raises
+        ------
+        RuntimeError if the backend is shut down while submitting.
+        """
+        future = self.start().submit(_run, runner)
         return LocalPromise(future)
+
+    def run_many(
+        self, runners: Iterable[backend.Runner]
+    ) -> list[LocalPromise]:
+        executor = self.start()
+        futures = [executor.submit(_run, runner) for runner in runners]
+        return [LocalPromise(future) for future in futures]
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        kwargs = {}
+        if self.max_tasks_per_child is not None:
+            kwargs["max_tasks_per_child"] = self.max_tasks_per_child
+
+        if self.warm_start:
+            kwargs["initializer"] = _import_modules
+            kwargs["initargs"] = (WARM_START_MODULES,)
+
+        mp_context = None
+        if self.mp_context is not None:
+            mp_context = multiprocessing.get_context(self.mp_context)
+
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers, mp_context=mp_context, **kwargs
+        )
+
+
+def get_default_backend() -> LocalBackend:
+    """Returns the default backend of this process.
+
+    Used by every call which is not given a ``backend``. It is a single
+    :class:`LocalBackend`, shared by all those calls, so the default
+    :class:`ThreadPoolExecutor` size caps how many of them run at once.
+    Pass a backend to run more. It is shut down on exit.
+    """
+    global _default_backend
+
+    if _default_backend is None:
+        with _default_backend_lock:
+            if _default_backend is None:
+                _default_backend = LocalBackend()
+                multiprocessing.util.Finalize(
+                    None, shutdown_default_backend, exitpriority=10
+                )
+    return _default_backend
+
+
+def shutdown_default_backend(wait: bool = True) -> None:
+    """Shuts down the default backend of this process, if any.
+
+    The next :func:`get_default_backend` call creates a new one.
+    """
+    global _default_backend
+
+    with _default_backend_lock:
+        default, _default_backend = _default_backend, None
+    if default is not None:
+        default.shutdown(wait=wait)
+
+
+def _reset_after_fork() -> None:
+    # The pool threads do not survive fork. Children create their own.
+    global _default_backend, _default_backend_lock
+
+    _default_backend = None
+    _default_backend_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
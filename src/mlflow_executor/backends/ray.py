@@ -1,25 +1,266 @@
-from typing import Any
+from __future__ import annotations
+
+import copy
+import time
+from concurrent.futures import ALL_COMPLETED, FIRST_EXCEPTION
+from typing import Any, Iterable
 
 import ray
+from ray.util.queue import Queue
+from ray.util.scheduling_strategies import PlacementGroupSchedulingStrategy
+
+from mlflow_executor import backend, streaming
+
+#: Options turned into a :class:`PlacementGroupSchedulingStrategy`.
+PLACEMENT_GROUP_OPTIONS = (
+    "placement_group",
+    "placement_group_bundle_index",
+    "placement_group_capture_child_tasks",
+)
+
+
+class _RefArg:
+    """Placeholder of an object ref passed as a top-level argument."""
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+
+
+def _split_refs(
+    runner: backend.Runner,
+) -> tuple[backend.Runner, list[ray.ObjectRef]]:
+    """Replaces the object refs in the runner arguments by placeholders.
+
+    Refs passed as top-level arguments of a remote function are resolved by
+    Ray from the object store (zero-copy for numpy based data) instead of
+    being serialized with the runner.
+    """
+    args = getattr(runner, "args", ())
+    kwargs = getattr(runner, "kwargs", {})
+    refs = []
+
+    def replace(value):
+        if isinstance(value, ray.ObjectRef):
+            refs.append(value)
+            return _RefArg(len(refs) - 1)
+        return value
+
+    args = tuple(replace(v) for v in args)
+    kwargs = {k: replace(v) for k, v in kwargs.items()}
+    if not refs:
+        return runner, refs
+
+    # The caller's runner is left untouched.
+    runner = copy.copy(runner)
+    runner.args = args
+    runner.kwargs = kwargs
+    return runner, refs
+
 
-from mlflow_executor import backend
+def _fill_refs(runner: backend.Runner, values: tuple) -> None:
+    """Replaces the placeholders in the runner arguments by values."""
+
+    def fill(value):
+        return values[value.index] if isinstance(value, _RefArg) else value
+
+    runner.args = tuple(fill(v) for v in runner.args)
+    runner.kwargs = {k: fill(v) for k, v in runner.kwargs.items()}
 
 
 @ray.remote
-def _run(runner: backend.Runner):
+def _run(runner: backend.Runner, *values):
     """Runs given task."""
+    if values:
+        _fill_refs(runner, values)
     return runner.run()
 
 
+def _wait_first_exception(
+    refs: list[ray.ObjectRef], timeout: float | None = None
+) -> tuple[list[ray.ObjectRef], list[ray.ObjectRef]]:
+    """Waits until any of ``refs`` fails or all of them finish."""
+    deadline = None if timeout is None else time.monotonic() + timeout
+    ready, pending = [], refs
+
+    while pending:
+        remaining = None
+        if deadline is not None:
+            remaining = max(deadline - time.monotonic(), 0)
+
+        finished, pending = ray.wait(pending, num_returns=1, timeout=remaining)
+        if not finished:
+            break
+
+        ready.extend(finished)
+        try:
+            ray.get(finished)
+        except Exception:
+            break
+
+    return ready, pending
+
+
 class RayPromise(backend.Promise):
     def __init__(self, future: ray.ObjectRef):
         self.future = future
 
-    def result(self) -> Any:
-        return ray.get(self.future)
+    def result(self, timeout: float | None = None) -> Any:
+        return ray.get(self.future, timeout=timeout)
+
+    def done(self) -> bool:
+        ready, _ = ray.wait([self.future], timeout=0)
+        return bool(ready)
+
+    def cancel(self) -> bool:
+        # Raises KeyboardInterrupt inside the running task.
+        ray.cancel(self.future)
+        return True
+
+    def __await__(self):
+        return self.future.__await__()
+
+    @classmethod
+    def wait(
+        cls,
+        promises: Iterable[RayPromise],
+        timeout: float | None = None,
+        return_when: str = ALL_COMPLETED,
+    ) -> tuple[set[RayPromise], set[RayPromise]]:
+        promises = {p.future: p for p in promises}
+        if not promises:
+            return set(), set()
+
+        if return_when == FIRST_EXCEPTION:
+            ready, pending = _wait_first_exception(list(promises), timeout)
+        else:
+            num_returns = len(promises) if return_when == ALL_COMPLETED else 1
+            ready, pending = ray.wait(
+                list(promises), num_returns=num_returns, timeout=timeout
+            )
+
+        return {promises[r] for r in ready}, {promises[r] for r in pending}
 
 
 class RayBackend(backend.BackendExecutor):
-    def run(self, runner: backend.BackendExecutor) -> RayPromise:
-        future = _run.remote(runner)
-        return RayPromise(future)
+    """Ray executor.
+
+    Each runner is a Ray task. Resources default to Ray's (one CPU per
+    task), so reserve the cores of multi-core trainings with ``num_cpus``,
+    either for every runner here or per runner through ``backend_options``
+    (see :meth:`TasksExecutor.execute`), which take precedence.
+
+    Large inputs should be put in the object store once with ``ray.put``
+    and passed as task arguments. Object refs given as (top-level) task
+    arguments are resolved by Ray on the worker, so runners sharing them do
+    not serialize the data again.
+
+    Parameters
+    ----------
+    num_cpus : float, default=None
+        CPUs reserved per task.
+
+    num_gpus : float, default=None
+        GPUs reserved per task.
+
+    memory : int, default=None
+        Bytes of memory reserved per task.
+
+    resources : dict, str -> float, default=None
+        Custom resources reserved per task.
+
+    max_retries : int, default=None
+        Times a task is retried when its worker dies.
+
+    **options
+        Other Ray task options (e.g., ``placement_group``,
+        ``placement_group_bundle_index``, ``runtime_env``).
+    """
+
+    def __init__(
+        self,
+        num_cpus: float | None = None,
+        num_gpus: float | None = None,
+        memory: int | None = None,
+        resources: dict[str, float] | None = None,
+        max_retries: int | None = None,
+        **options,
+    ):
+        self.options = {
+            "num_cpus": num_cpus,
+            "num_gpus": num_gpus,
+            "memory": memory,
+            "resources": resources,
+            "max_retries": max_retries,
+            **options,
+        }
+
+    def get_options(self, runner: backend.Runner) -> dict:
+        """Returns the Ray options of the given runner."""
+        options = {k: v for k, v in self.options.items() if v is not None}
+        options.update(getattr(runner, "backend_options", None) or {})
+
+        if options.get("placement_group") is not None:
+            options["scheduling_strategy"] = PlacementGroupSchedulingStrategy(
+                placement_group=options.pop("placement_group"),
+                placement_group_bundle_index=options.pop(
+                    "placement_group_bundle_index", -1
+                ),
+                placement_group_capture_child_tasks=options.pop(
+                    "placement_group_capture_child_tasks", None
+                ),
+            )
+
+        return {
+            k: v
+            for k, v in options.items()
+            if k not in PLACEMENT_GROUP_OPTIONS
+        }
+
+    def run(self, runner: backend.Runner) -> RayPromise:
+        return self.run_many([runner])[0]
+
+    def run_many(self, runners: Iterable[backend.Runner]) -> list[RayPromise]:
+        # Ray submits remote calls one by one, but runners sharing the same
+        # options (e.g., those of TasksExecutor.map) share the remote
+        # function, whose options are only validated once.
+        remotes: list[tuple[dict, Any]] = []
+        promises = []
+        for runner in runners:
+            options = self.get_options(runner)
+            remote = next((r for o, r in remotes if o == options), None)
+            if remote is None:
+                remote = _run.options(**options) if options else _run
+                remotes.append((options, remote))
+
+            runner, refs = _split_refs(runner)
+            promises.append(RayPromise(remote.remote(runner, *refs)))
+        return promises
+
+    def open_channel(
+        self, max_size: int = streaming.BUFFER_SIZE
+    ) -> RayChannel:
+        return RayChannel(max_size)
+
+
+class RayChannel(streaming.Channel):
+    """Stream channel backed by a :class:`ray.util.queue.Queue` actor.
+
+    The actor does not reserve CPUs and is released once the channel is
+    garbage collected by the caller.
+
+    Parameters
+    ----------
+    max_size : int, default=BUFFER_SIZE
+        Maximum number of buffered events.
+    """
+
+    def __init__(self, max_size: int = streaming.BUFFER_SIZE) -> None:
+        self.queue = Queue(max_size, actor_options={"num_cpus": 0})
+
+    def put(
+        self, event: streaming.StreamEvent, timeout: float | None = None
+    ) -> None:
+        self.queue.put(event, timeout=timeout)
+
+    def get(self, timeout: float | None = None) -> streaming.StreamEvent:
+        return self.queue.get(timeout=timeout)
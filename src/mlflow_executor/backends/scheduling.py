@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future
+
+from mlflow_executor import backend, streaming
+from mlflow_executor.backends.local import LocalPromise
+
+
+class ScheduledPromise(LocalPromise):
+    """Promise of a runner waiting in (or dispatched by) the scheduler."""
+
+    def __init__(self, future: Future, runner: backend.Runner) -> None:
+        super().__init__(future, runner)
+        self.backend_promise: backend.Promise | None = None
+
+    def cancel(self) -> bool:
+        if self.backend_promise is not None:
+            return self.backend_promise.cancel()
+        return super().cancel()
+
+
+class SchedulingBackend(backend.BackendExecutor):
+    """Priority and concurrency limits in front of another backend.
+
+    Runners wait in an in-process priority queue and are dispatched to the
+    wrapped backend as soon as the resources they use are available. Higher
+    priority runners are dispatched first; lower priority runners only use
+    the capacity left.
+
+    Runners declare their scheduling hints through the ``priority`` (int,
+    default 0) and ``resources`` (list of names, default empty) attributes
+    (see :meth:`TasksExecutor.execute`). Each resource name takes one unit
+    of the matching limit.
+
+    Parameters
+    ----------
+    backend : BackendExecutor
+        Backend the runners are dispatched to.
+
+    limits : dict, str -> int, default=None
+        Maximum number of concurrent runners per resource name. Names ending
+        with "*" apply to each resource starting with the given prefix, e.g.,
+        ``{"gpu": 4, "experiment:*": 2}``.
+
+    max_running : int, default=None
+        Maximum number of concurrent runners overall.
+
+    poll_interval : float, default=0.1
+        Seconds the dispatcher waits for completions before checking for
+        new submissions.
+    """
+
+    def __init__(
+        self,
+        backend: backend.BackendExecutor,
+        limits: dict[str, int] | None = None,
+        max_running: int | None = None,
+        poll_interval: float = 0.1,
+    ):
+        self.backend = backend
+        self.limits = limits or {}
+        self.max_running = max_running
+        self.poll_interval = poll_interval
+
+        self._pending: list[tuple] = []
+        self._running: dict[backend.Promise, tuple] = {}
+        self._usage: Counter[str] = Counter()
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._changed = False
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of runners waiting to be dispatched."""
+        return len(self._pending)
+
+    @property
+    def running(self) -> int:
+        """Number of dispatched runners not finished yet."""
+        return len(self._running)
+
+    @property
+    def usage(self) -> dict[str, int]:
+        """Units in use per resource name."""
+        with self._cond:
+            return dict(self._usage)
+
+    def start(self) -> None:
+        """Starts the dispatcher thread if it is not running already."""
+        with self._cond:
+            if self._thread is not None:
+                return
+
+            self._closed = False
+            self._thread = threading.Thread(target=self._loop, daemon=True)
+            self._thread.start()
+
+    def shutdown(
+        self, wait: bool = True, shutdown_backend: bool = False
+    ) -> None:
+        """Stops the dispatcher.
+
+        Runners still queued are cancelled, so their promises raise
+        :class:`TaskCancelled`. Dispatched runners keep running on the
+        wrapped backend.
+
+        Parameters
+        ----------
+        wait : bool, default=True
+            If True, blocks until all dispatched runners are done.
+
+        shutdown_backend : bool, default=False
+            If True, also shuts down the wrapped backend.
+        """
+        with self._cond:
+            thread, self._thread = self._thread, None
+            self._closed = True
+            for *_, promise, _ in self._pending:
+                promise.future.cancel()
+            self._pending.clear()
+            self._cond.notify_all()
+
+        if thread is not None and wait:
+            thread.join()
+
+        if shutdown_backend:
+            self.backend.shutdown(wait=wait)
+
+    def run(self, runner: backend.Runner) -> ScheduledPromise:
+        self.start()
+        promise = ScheduledPromise(Future(), runner)
+        priority = getattr(runner, "priority", 0)
+        resources = tuple(getattr(runner, "resources", None) or ())
+
+        with self._cond:
+            entry = (-priority, next(self._counter), promise, resources)
+            heapq.heappush(self._pending, entry)
+            self._changed = True
+            self._cond.notify_all()
+
+        return promise
+
+    def open_channel(
+        self, max_size: int = streaming.BUFFER_SIZE
+    ) -> streaming.Channel:
+        return self.backend.open_channel(max_size)
+
+    def _loop(self) -> None:
+        while True:
+            with self._cond:
+                batch = self._take()
+
+                if not batch and not self._running:
+                    if self._closed and not self._pending:
+                        return
+                    self._cond.wait(self.poll_interval)
+                    continue
+
+            # Submissions may block (e.g., on a full backend queue), so they
+            # happen outside the condition.
+            self._submit(batch)
+
+            with self._cond:
+                running = list(self._running)
+            if not running:
+                continue
+
+            promise_types = {type(p) for p in running}
+            promise_cls = backend.Promise
+            if len(promise_types) == 1:
+                promise_cls = promise_types.pop()
+
+            done, _ = promise_cls.wait(
+                running, self.poll_interval, FIRST_COMPLETED
+            )
+
+            with self._cond:
+                for backend_promise in done:
+                    self._complete(backend_promise)
+
+    def _take(self) -> list[tuple]:
+        """Pops the runners to dispatch, reserving their resources.
+
+        Runners are popped in priority order until ``max_running`` is
+        reached. Runners whose resources are in use are pushed back. The
+        queue is only scanned again after a submission or a completion.
+        """
+        if not self._changed:
+            return []
+        self._changed = False
+
+        batch, blocked = [], []
+        while self._pending:
+            if self.max_running is not None:
+                if len(self._running) + len(batch) >= self.max_running:
+                    break
+
+            entry = heapq.heappop(self._pending)
+            *_, promise, resources = entry
+            if not self._available(resources):
+                blocked.append(entry)
+                continue
+
+            if promise.future.set_running_or_notify_cancel():
+                self._usage.update(resources)
+                batch.append((promise, resources))
+
+        for entry in blocked:
+            heapq.heappush(self._pending, entry)
+
+        return batch
+
+    def _submit(self, batch: list[tuple]) -> None:
+        """Runs the taken runners on the wrapped backend in one batch."""
+        if not batch:
+            return
+
+        try:
+            backend_promises = self.backend.run_many(
+                [promise.runner for promise, _ in batch]
+            )
+        except BaseException as exc:
+            with self._cond:
+                for promise, resources in batch:
+                    self._usage.subtract(resources)
+                    promise.future.set_exception(exc)
+                self._changed = True
+            return
+
+        with self._cond:
+            for (promise, resources), backend_promise in zip(
+                batch, backend_promises
+            ):
+                promise.backend_promise = backend_promise
+                self._running[backend_promise] = (promise, resources)
+
+    def _complete(self, backend_promise: backend.Promise) -> None:
+        promise, resources = self._running.pop(backend_promise)
+        self._usage.subtract(resources)
+        self._changed = True
+
+        try:
+            retval = backend_promise.result(timeout=0)
+        except BaseException as exc:
+            promise.future.set_exception(exc)
+        else:
+            promise.future.set_result(retval)
+
+    def _available(self, resources: tuple[str, ...]) -> bool:
+        for name in resources:
+            limit = self._get_limit(name)
+            if limit is not None and self._usage[name] >= limit:
+                return False
+        return True
+
+    def _get_limit(self, name: str) -> int | None:
+        if name in self.limits:
+            return self.limits[name]
+
+        for key, limit in self.limits.items():
+            if key.endswith("*") and name.startswith(key[:-1]):
+                return limit
+
+        return None
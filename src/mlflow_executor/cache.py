@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import abc
+import hashlib
+import json
+import time
+from typing import Any
+
+from mlflow_executor import backend
+
+
+def make_key(name: str, args: tuple = (), kwargs: dict | None = None) -> str:
+    """Returns a stable hash identifying a task call.
+
+    Parameters
+    ----------
+    name : str
+        Name of the task.
+
+    args : tuple, default=()
+        Task positional arguments.
+
+    kwargs : dict, default=None
+        Task key-word arguments. Order does not matter.
+
+    Raises
+    ------
+    TypeError if an argument is not JSON serializable. Their ``repr`` may
+    hold memory addresses or lose information, so it cannot identify them.
+    Pass an explicit ``cache_key`` for such calls instead.
+    """
+    call = {"name": name, "args": list(args), "kwargs": kwargs or {}}
+    try:
+        data = json.dumps(call, sort_keys=True)
+    except TypeError as exc:
+        raise TypeError(
+            f"Cannot make the key of a '{name}' call: {exc}. Pass an "
+            "explicit `cache_key`."
+        ) from None
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+class ResultStore(abc.ABC):
+    """Base class to inherit for concrete result stores.
+
+    . note::
+        This class should not be used directly. Use derived classes instead.
+    """
+
+    @abc.abstractmethod
+    def get(self, key: str, default: Any = None) -> Any:
+        """Returns the value stored under ``key``.
+
+        Returns ``default`` if the key is missing or expired, so stored None
+        values can be told apart from misses.
+        """
+
+    @abc.abstractmethod
+    def set(self, key: str, value: Any, expires_at: float | None = None):
+        """Stores ``value`` under ``key``.
+
+        Parameters
+        ----------
+        expires_at : float, default=None
+            Unix timestamp after which the value is considered missing.
+        """
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """Deletes ``key`` if present."""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Deletes all keys."""
+
+
+class CachedPromise(backend.Promise):
+    """Already resolved promise returned on cache hits."""
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def result(self, timeout: float | None = None) -> Any:
+        return self.value
+
+    def done(self) -> bool:
+        return True
+
+
+class ResultCache:
+    """Memoizes task results.
+
+    Parameters
+    ----------
+    store : ResultStore
+        Where results are stored.
+
+    ttl : float, default=None
+        Seconds a result stays valid. If None, results never expire.
+    """
+
+    def __init__(self, store: ResultStore, ttl: float | None = None):
+        self.store = store
+        self.ttl = ttl
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Returns the cached result for ``key`` or ``default``."""
+        return self.store.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        """Caches ``value`` under ``key``."""
+        expires_at = None if self.ttl is None else time.time() + self.ttl
+        self.store.set(key, value, expires_at)
+
+    def invalidate(
+        self, name: str, args: tuple = (), kwargs: dict | None = None
+    ) -> None:
+        """Drops the cached result of the given task call."""
+        self.store.delete(make_key(name, args, kwargs))
+
+    def clear(self) -> None:
+        """Drops all cached results."""
+        self.store.clear()
@@ -0,0 +1,17 @@
+from typing import TYPE_CHECKING
+
+from mlflow_executor.imports import lazy_attributes
+
+if TYPE_CHECKING:
+    from mlflow_executor.caches.db import DatabaseStore
+    from mlflow_executor.caches.memory import LRUStore
+
+__getattr__ = lazy_attributes(
+    __name__,
+    {
+        "DatabaseStore": "mlflow_executor.caches.db",
+        "LRUStore": "mlflow_executor.caches.memory",
+    },
+)
+
+__all__ = ["DatabaseStore", "LRUStore"]
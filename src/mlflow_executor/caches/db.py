@@ -0,0 +1,62 @@
+from datetime import datetime
+from typing import Any
+
+from mlflow_executor.cache import ResultStore
+from mlflow_executor.db.base import sessionfactory
+from mlflow_executor.db.engine import get_engine
+from mlflow_executor.db.models import TaskResult
+
+
+class DatabaseStore(ResultStore):
+    """Stores results in the ``task_result`` table.
+
+    Shared by every process connected to the configured database. The table
+    is created on first use if it does not exist.
+    """
+
+    def __init__(self) -> None:
+        self._created = False
+
+    def create_table(self) -> None:
+        """Creates the ``task_result`` table if it does not exist."""
+        if not self._created:
+            TaskResult.__table__.create(get_engine(), checkfirst=True)
+            self._created = True
+
+    def get(self, key: str, default: Any = None) -> Any:
+        self.create_table()
+        with sessionfactory() as session:
+            result = session.get(TaskResult, key)
+            if result is None:
+                return default
+
+            if result.expires_at is not None:
+                if datetime.now() >= result.expires_at:
+                    session.delete(result)
+                    session.commit()
+                    return default
+
+            return result.value
+
+    def set(self, key: str, value: Any, expires_at: float | None = None):
+        self.create_table()
+        if expires_at is not None:
+            expires_at = datetime.fromtimestamp(expires_at)
+
+        with sessionfactory() as session:
+            session.merge(
+                TaskResult(key=key, value=value, expires_at=expires_at)
+            )
+            session.commit()
+
+    def delete(self, key: str) -> None:
+        self.create_table()
+        with sessionfactory() as session:
+            session.query(TaskResult).filter_by(key=key).delete()
+            session.commit()
+
+    def clear(self) -> None:
+        self.create_table()
+        with sessionfactory() as session:
+            session.query(TaskResult).delete()
+            session.commit()
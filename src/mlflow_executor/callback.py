@@ -1,4 +1,9 @@
-from typing import Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from mlflow_executor.events import Event
 
 
 class Callback:
@@ -7,10 +12,18 @@ class Callback:
     All custom callbacks should inherit from this class. The subclass
     may override any of the ``on_...`` methods.
 
+    Callbacks are called from the background thread of the event bus (see
+    :class:`EventBus`), so they do not slow tasks down and their failures
+    are only logged. Set ``blocking = True`` to be called on the task thread
+    instead, before the task result is available.
+
     . note::
         This class should not be used directly. Use derived classes instead.
     """
 
+    #: Whether the callback is called on the task thread.
+    blocking: bool = False
+
     def on_begin(self, task_id: str) -> None:
         """Called at the beginning of running."""
 
@@ -19,3 +32,15 @@ class Callback:
 
     def on_failure(self, exc: Any, task_id: str) -> None:
         """Called when task fails."""
+
+    def on_retry(self, exc: Any, attempt: int, task_id: str) -> None:
+        """Called when a failed attempt is going to be retried."""
+
+    def on_batch(self, events: list[Event]) -> None:
+        """Called with the pending events of any task, in order.
+
+        Override it to handle events in bulk (e.g., a single database
+        commit). The ``on_...`` methods are then not called.
+        """
+        for event in events:
+            event.dispatch(self)
@@ -1,3 +1,12 @@
-from mlflow_executor.callbacks.db import DatabaseCallback
+from typing import TYPE_CHECKING
+
+from mlflow_executor.imports import lazy_attributes
+
+if TYPE_CHECKING:
+    from mlflow_executor.callbacks.db import DatabaseCallback
+
+__getattr__ = lazy_attributes(
+    __name__, {"DatabaseCallback": "mlflow_executor.callbacks.db"}
+)
 
 __all__ = ["DatabaseCallback"]
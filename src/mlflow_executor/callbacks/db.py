@@ -1,11 +1,30 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing.util
+import os
+import threading
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import insert, select, update
 
 from mlflow_executor.callback import Callback
-from mlflow_executor.db.base import sessionfactory
+from mlflow_executor.db.base import session_scope
 from mlflow_executor.db.models import TaskExecution
 
+if TYPE_CHECKING:
+    from mlflow_executor.events import Event
+
+logger = logging.getLogger(__name__)
+
+#: Seconds the status writer of a process is given to flush on exit.
+EXIT_TIMEOUT = 10.0
+
+_writer: StatusWriter | None = None
+_writer_lock = threading.Lock()
+
 
 class TaskStatus(Enum):
     """Task status.
@@ -24,19 +43,246 @@ class TaskStatus(Enum):
     FAILED = 3
 
 
+_EVENT_STATUSES = {
+    "on_begin": TaskStatus.RUNNING,
+    "on_success": TaskStatus.COMPLETED,
+    "on_failure": TaskStatus.FAILED,
+}
+
+
+def write_executions(
+    executions: dict[str, dict[str, Any]], chunk_size: int = 500
+) -> None:
+    """Upserts task executions in bulk.
+
+    Existing rows are updated by primary key and missing ones inserted,
+    with a single query of each kind per chunk and a single commit.
+
+    Parameters
+    ----------
+    executions : dict, str -> dict
+        Column values of the executions to write, by ``task_id``.
+
+    chunk_size : int, default=500
+        Maximum number of executions per query.
+    """
+    task_ids = list(executions)
+    with session_scope() as session:
+        for i in range(0, len(task_ids), chunk_size):
+            chunk = task_ids[i : i + chunk_size]
+            existing = dict(
+                session.execute(
+                    select(TaskExecution.task_id, TaskExecution.id).where(
+                        TaskExecution.task_id.in_(chunk)
+                    )
+                ).all()
+            )
+
+            updates = [
+                {"id": existing[task_id], **executions[task_id]}
+                for task_id in chunk
+                if task_id in existing
+            ]
+            inserts = [
+                {"task_id": task_id, **executions[task_id]}
+                for task_id in chunk
+                if task_id not in existing
+            ]
+            if updates:
+                session.execute(update(TaskExecution), updates)
+            if inserts:
+                session.execute(insert(TaskExecution), inserts)
+
+
+class StatusWriter:
+    """Write-behind buffer of task execution updates.
+
+    Updates are merged per task in memory and written by a background
+    thread with :func:`write_executions` every ``batch_size`` updates or
+    ``flush_interval`` seconds, whichever comes first. A task which begins
+    and finishes between two flushes costs a single row write.
+
+    Write failures are logged and counted (see :attr:`failures`), and the
+    updates are discarded.
+
+    Parameters
+    ----------
+    batch_size : int, default=500
+        Updates triggering a flush.
+
+    flush_interval : float, default=1.0
+        Maximum seconds an update stays buffered.
+
+    max_size : int, default=10000
+        Maximum number of buffered tasks. Adding updates of other tasks
+        waits for the next flush when it is reached (backpressure).
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_size: int = 10000,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_size = max_size
+
+        self.written = 0
+        self.failures = 0
+
+        self._buffer: dict[str, dict[str, Any]] = {}
+        self._updates = 0
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+        self._finalizer: multiprocessing.util.Finalize | None = None
+        self._condition = threading.Condition()
+        # Serializes writes so updates of a task are written in order.
+        self._write_lock = threading.Lock()
+
+    def add(self, task_id: str, values: dict[str, Any]) -> None:
+        """Buffers the update of the execution of task ``task_id``."""
+        self.start()
+        with self._condition:
+            if task_id not in self._buffer and self._full():
+                # Flush now rather than after the flush interval.
+                self._condition.notify_all()
+            self._condition.wait_for(
+                lambda: task_id in self._buffer or not self._full()
+            )
+            self._buffer.setdefault(task_id, {}).update(values)
+            self._updates += 1
+            if self._updates >= self.batch_size or self._full():
+                self._condition.notify_all()
+
+    def pending(self) -> int:
+        """Returns the number of buffered tasks."""
+        return len(self._buffer)
+
+    def start(self) -> None:
+        """Starts the flushing thread if it is not running already."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        with self._condition:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopped = False
+                self._thread = threading.Thread(
+                    target=self._loop, name="StatusWriter", daemon=True
+                )
+                self._thread.start()
+
+            if self._finalizer is None:
+                # Runs after the event bus delivered its pending events
+                # (lower exit priority).
+                self._finalizer = multiprocessing.util.Finalize(
+                    None,
+                    self.shutdown,
+                    kwargs={"timeout": EXIT_TIMEOUT},
+                    exitpriority=5,
+                )
+
+    def flush(self) -> None:
+        """Writes the buffered updates on the calling thread."""
+        with self._write_lock:
+            with self._condition:
+                executions, self._buffer = self._buffer, {}
+                self._updates = 0
+                self._condition.notify_all()
+
+            if not executions:
+                return
+
+            try:
+                write_executions(executions)
+            except Exception:
+                self.failures += len(executions)
+                logger.exception(
+                    "Could not write %d task executions.", len(executions)
+                )
+            else:
+                self.written += len(executions)
+
+    def shutdown(self, timeout: float | None = None) -> None:
+        """Stops the flushing thread and writes the buffered updates."""
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            with self._condition:
+                self._stopped = True
+                self._condition.notify_all()
+            thread.join(timeout)
+        self.flush()
+
+    def _full(self) -> bool:
+        return len(self._buffer) >= self.max_size
+
+    def _loop(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._stopped
+                    or self._updates >= self.batch_size
+                    or self._full(),
+                    self.flush_interval,
+                )
+                if self._stopped:
+                    return
+            self.flush()
+
+
+def get_status_writer() -> StatusWriter:
+    """Returns the status writer of this process.
+
+    It is created on first use from the ``DB_STATUS_`` settings.
+    """
+    global _writer
+
+    if _writer is None:
+        from mlflow_executor import settings
+
+        with _writer_lock:
+            if _writer is None:
+                conf = settings.conf.get_status_settings()
+                _writer = StatusWriter(
+                    conf.batch_size, conf.flush_interval, conf.max_size
+                )
+    return _writer
+
+
+def _reset_after_fork() -> None:
+    # The flushing thread does not survive fork, and updates buffered by
+    # the parent are written by the parent. Children start their own.
+    global _writer, _writer_lock
+
+    _writer = None
+    _writer_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
 class DatabaseCallback(Callback):
-    def get_or_create_execution(self, task_id) -> TaskExecution:
-        return TaskExecution.get_or_create(self.session, task_id=task_id)
+    """Tracks task executions in the ``task_execution`` table.
 
-    def on_begin(self, task_id: str) -> None:
-        # Make new child process use its own database session.
-        self.session = sessionfactory()
+    Parameters
+    ----------
+    buffered : bool, default=False
+        If True, status transitions are buffered by the status writer of
+        the process (see :class:`StatusWriter`) and written in bulk,
+        instead of a transaction per transition. The table then lags
+        behind by up to the ``DB_STATUS_FLUSH_INTERVAL`` setting.
+    """
+
+    def __init__(self, buffered: bool = False) -> None:
+        self.buffered = buffered
+        # Start times of the running tasks, which may share the callback.
+        self.start_times: dict[str, datetime] = {}
 
-        self.start_time = datetime.now()
-        execution = self.get_or_create_execution(task_id)
-        execution.start_time = self.start_time
-        execution.status = TaskStatus.RUNNING.value
-        self.session.commit()
+    def get_or_create_execution(self, session, task_id) -> TaskExecution:
+        return TaskExecution.get_or_create(session, task_id=task_id)
+
+    def on_begin(self, task_id: str) -> None:
+        self.begin(task_id, datetime.now())
 
     def on_failure(self, exc: Any, task_id: str) -> None:
         self.finish(task_id, TaskStatus.FAILED)
@@ -44,19 +290,60 @@ class DatabaseCallback(Callback):
     def on_success(self, retval: Any, task_id: str) -> None:
         self.finish(task_id, TaskStatus.COMPLETED)
 
-    def finish(self, task_id: str, status: TaskStatus) -> None:
+    def on_batch(self, events: list[Event]) -> None:
+        # Events are delivered late, so their creation time is used.
+        for event in events:
+            status = _EVENT_STATUSES.get(event.name)
+            if status is None:
+                event.dispatch(self)
+                continue
+
+            time = datetime.fromtimestamp(event.created_at)
+            if status is TaskStatus.RUNNING:
+                self.begin(event.task_id, time)
+            else:
+                self.finish(event.task_id, status, time)
+
+    def begin(self, task_id: str, start_time: datetime) -> None:
+        """Updates initial task execution attributes."""
+        self.start_times[task_id] = start_time
+        self.write(
+            task_id,
+            {"start_time": start_time, "status": TaskStatus.RUNNING.value},
+        )
+
+    def finish(
+        self,
+        task_id: str,
+        status: TaskStatus,
+        end_time: datetime | None = None,
+    ) -> None:
         """Updates final task execution attributes.
 
         Parameters
         ----------
         status : TaskStatus
             Task final status.
+
+        end_time : datetime, default=None
+            End of the task. If None, now.
         """
-        end_time = datetime.now()
-        execution = self.get_or_create_execution(task_id)
-
-        minutes = (end_time - self.start_time).total_seconds() / 60
-        execution.end_time = end_time
-        execution.duration = minutes
-        execution.status = status.value
-        self.session.commit()
+        end_time = end_time or datetime.now()
+        values = {"end_time": end_time, "status": status.value}
+
+        start_time = self.start_times.pop(task_id, None)
+        if start_time is not None:
+            minutes = (end_time - start_time).total_seconds() / 60
+            values["duration"] = minutes
+        self.write(task_id, values)
+
+    def write(self, task_id: str, values: dict[str, Any]) -> None:
+        """Writes (or buffers) column values of the task execution."""
+        if self.buffered:
+            get_status_writer().add(task_id, values)
+            return
+
+        with session_scope() as session:
+            execution = self.get_or_create_execution(session, task_id)
+            for name, value in values.items():
+                setattr(execution, name, value)
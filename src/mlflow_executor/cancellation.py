@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import threading
+import time
+from typing import Iterator
+
+from mlflow_executor import exceptions
+
+_current_token: contextvars.ContextVar[CancelToken | None] = (
+    contextvars.ContextVar("cancel_token", default=None)
+)
+
+
+def current_token() -> CancelToken | None:
+    """Returns the cancel token of the task running in this context."""
+    return _current_token.get()
+
+
+@contextlib.contextmanager
+def use_token(token: CancelToken) -> Iterator[CancelToken]:
+    """Makes ``token`` the current cancel token inside the context."""
+    reset_token = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset_token)
+
+
+class CancelToken:
+    """Cooperative cancellation and wall-clock timeout for a single task.
+
+    Long running tasks should periodically call :meth:`raise_if_cancelled`
+    (or block on :meth:`wait`) and release their resources when it raises.
+
+    Parameters
+    ----------
+    timeout : float, default=None
+        Seconds the task is allowed to run once :meth:`start` is called. If
+        None, the task never times out.
+    """
+
+    def __init__(self, timeout: float | None = None) -> None:
+        self.timeout = timeout
+        self.deadline: float | None = None
+        self._event = threading.Event()
+
+    def __reduce__(self):
+        # Events cannot be pickled. Remote copies keep the timeout and
+        # whether cancellation was already requested.
+        return _unpickle_token, (self.timeout, self._event.is_set())
+
+    def start(self) -> None:
+        """Starts the timeout clock."""
+        if self.timeout is not None:
+            self.deadline = time.monotonic() + self.timeout
+
+    def cancel(self) -> None:
+        """Requests cancellation."""
+        self._event.set()
+
+    def expired(self) -> bool:
+        """Returns True if the timeout elapsed."""
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def cancelled(self) -> bool:
+        """Returns True if cancellation was requested or the timeout elapsed."""
+        return self._event.is_set() or self.expired()
+
+    def raise_if_cancelled(self) -> None:
+        """Raises if cancellation was requested or the timeout elapsed.
+
+        Raises
+        ------
+        TaskCancelled if cancellation was requested.
+        TaskTimeout if the timeout elapsed.
+        """
+        if self._event.is_set():
+            raise exceptions.TaskCancelled()
+        if self.expired():
+            raise exceptions.TaskTimeout(timeout=self.timeout)
+
+    def wait(self, timeout: float) -> bool:
+        """Blocks up to ``timeout`` seconds or until cancelled.
+
+        Returns
+        -------
+        cancelled : bool
+        """
+        if self.deadline is not None:
+            timeout = min(timeout, max(self.deadline - time.monotonic(), 0))
+
+        self._event.wait(timeout)
+        return self.cancelled()
+
+
+def _unpickle_token(timeout: float | None, cancelled: bool) -> CancelToken:
+    token = CancelToken(timeout)
+    if cancelled:
+        token.cancel()
+    return token
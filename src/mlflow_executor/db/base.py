@@ -1,12 +1,36 @@
-from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from __future__ import annotations
 
-from .engine import create_db_engine
+import contextlib
+from typing import Iterator
+
+from sqlalchemy.orm import DeclarativeBase, Session
+
+from .engine import get_engine
 
 
 def sessionfactory() -> Session:
-    """Factory of SQLAlchemy sessions."""
-    engine = create_db_engine()
-    return sessionmaker(engine)()
+    """Factory of SQLAlchemy sessions.
+
+    Sessions are bound to the engine of the process (see :func:`get_engine`)
+    and must be closed, e.g., using them as context managers.
+    """
+    return Session(get_engine())
+
+
+@contextlib.contextmanager
+def session_scope() -> Iterator[Session]:
+    """Provides a transactional scope around a series of operations.
+
+    The session is committed on exit, rolled back on error, and closed
+    either way, which returns its connection to the pool.
+    """
+    with sessionfactory() as session:
+        try:
+            yield session
+            session.commit()
+        except BaseException:
+            session.rollback()
+            raise
 
 
 class Base(DeclarativeBase):
@@ -1,9 +1,89 @@
-from sqlalchemy import create_engine
+from __future__ import annotations
 
-from mlflow_executor.settings import conf
+import os
+import threading
 
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import QueuePool
 
-def create_db_engine():
-    """Creates database connection engine."""
-    db_settings = conf.get_db_settings()
-    return create_engine(db_settings.url)
+from mlflow_executor.settings import DBSettings, conf
+
+_engine: Engine | None = None
+_engine_lock = threading.Lock()
+
+
+def create_db_engine(db_settings: DBSettings | None = None) -> Engine:
+    """Creates database connection engine.
+
+    Prefer :func:`get_engine`, which shares the engine (and its connection
+    pool) within the process.
+
+    Parameters
+    ----------
+    db_settings : DBSettings, default=None
+        Connection url and pool settings. If None, the ``DB_`` settings are
+        read.
+    """
+    if db_settings is None:
+        db_settings = conf.get_db_settings()
+
+    url = make_url(db_settings.url)
+    kwargs = {
+        "pool_recycle": db_settings.pool_recycle,
+        "pool_pre_ping": db_settings.pool_pre_ping,
+    }
+
+    # e.g., in-memory SQLite databases use a pool without overflow.
+    if issubclass(url.get_dialect().get_pool_class(url), QueuePool):
+        kwargs.update(
+            pool_size=db_settings.pool_size,
+            max_overflow=db_settings.max_overflow,
+            pool_timeout=db_settings.pool_timeout,
+        )
+
+    return create_engine(url, **kwargs)
+
+
+def get_engine() -> Engine:
+    """Returns the database engine of this process.
+
+    It is created on first use from the ``DB_`` settings and shared by
+    every session of the process, so connections are pooled across tasks.
+    Use :func:`dispose_engine` after changing the settings.
+    """
+    global _engine
+
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_db_engine()
+    return _engine
+
+
+def dispose_engine() -> None:
+    """Closes the pooled connections and forgets the engine of this process.
+
+    The next :func:`get_engine` call creates a new engine from the current
+    settings.
+    """
+    global _engine
+
+    with _engine_lock:
+        engine, _engine = _engine, None
+    if engine is not None:
+        engine.dispose()
+
+
+def _reset_after_fork() -> None:
+    # Connections of the parent must not be shared with forked workers
+    # (e.g., Celery prefork or process pools). Children open their own,
+    # without closing those still used by the parent.
+    global _engine_lock
+
+    _engine_lock = threading.Lock()
+    if _engine is not None:
+        _engine.dispose(close=False)
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
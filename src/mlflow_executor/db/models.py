@@ -1,6 +1,14 @@
 import datetime
 
-from sqlalchemy import Column, DateTime, Float, Integer, String
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    Integer,
+    PickleType,
+    String,
+)
 
 from .base import Base
 
@@ -19,4 +27,38 @@ class TaskExecution(Base):
     status = Column(Integer)
     future_id = Column(String(36))
     backend_exec = Column(String(10))
-    updated_at = Column(DateTime, onupdate=datetime.datetime.now)
\ No newline at end of file
+    updated_at = Column(DateTime, onupdate=datetime.datetime.now)
+
+
+class TaskResult(Base):
+    """Stores cached task results."""
+
+    __tablename__ = "task_result"
+
+    key = Column(String(64), primary_key=True)
+    value = Column(PickleType)
+    created_at = Column(DateTime, default=datetime.datetime.now)
+    expires_at = Column(DateTime)
+
+
+class TaskJob(Base):
+    """Stores jobs of the database backend queue."""
+
+    __tablename__ = "task_job"
+
+    id = Column(String(36), primary_key=True)
+    queue = Column(String(100), index=True)
+    priority = Column(Integer, default=0)
+    status = Column(Integer, index=True)
+    runner = Column(PickleType)
+    result = Column(PickleType)
+    error = Column(PickleType)
+    attempts = Column(Integer, default=0)
+    max_attempts = Column(Integer)
+    visibility_timeout = Column(Float)
+    visible_at = Column(DateTime)
+    worker_id = Column(String(100))
+    cancel_requested = Column(Boolean, default=False)
+    created_at = Column(DateTime, default=datetime.datetime.now)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
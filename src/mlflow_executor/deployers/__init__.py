@@ -1,10 +1,23 @@
-from mlflow_executor.deployers.docker import DockerDeployer
-from mlflow_executor.deployers.local import LocalDeployer
+from typing import TYPE_CHECKING
+
+from mlflow_executor.imports import lazy_attributes
+
+if TYPE_CHECKING:
+    from mlflow_executor.deployers.docker import DockerDeployer
+    from mlflow_executor.deployers.local import LocalDeployer
+
+__getattr__ = lazy_attributes(
+    __name__,
+    {
+        "DockerDeployer": "mlflow_executor.deployers.docker",
+        "LocalDeployer": "mlflow_executor.deployers.local",
+    },
+)
 
 
 def get_deployer(name: str, **kwargs):
-    deployers = {"docker": DockerDeployer, "local": LocalDeployer}
-    return deployers[name](**kwargs)
+    deployers = {"docker": "DockerDeployer", "local": "LocalDeployer"}
+    return __getattr__(deployers[name])(**kwargs)
 
 
-__all__ = ["get_deployer"]
+__all__ = ["DockerDeployer", "LocalDeployer", "get_deployer"]
@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing.util
+import os
+import queue
+import threading
+import time
+from collections import Counter
+from typing import Any, Iterable
+
+from mlflow_executor import callback
+
+logger = logging.getLogger(__name__)
+
+#: Overflow policies of :class:`EventBus`.
+OVERFLOW_POLICIES = ("block", "drop")
+
+#: Seconds the bus of a process is given to deliver pending events on exit.
+EXIT_TIMEOUT = 10.0
+
+_STOP = object()
+
+_bus: EventBus | None = None
+_bus_lock = threading.Lock()
+
+
+class Event:
+    """Callback event of a task execution.
+
+    Parameters
+    ----------
+    name : str
+        Name of the callback method, e.g. "on_success".
+
+    task_id : str, default=None
+        Task identifier.
+
+    kwargs : dict, default=None
+        Other key-word arguments of the callback method, e.g. ``retval``.
+    """
+
+    def __init__(
+        self, name: str, task_id: str | None = None, kwargs: dict = None
+    ) -> None:
+        self.name = name
+        self.task_id = task_id
+        self.kwargs = kwargs or {}
+        self.created_at = time.time()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}: {self.name} ({self.task_id})>"
+
+    def dispatch(self, cb: callback.Callback) -> Any:
+        """Calls the ``on_...`` method of ``cb`` for this event."""
+        return getattr(cb, self.name)(task_id=self.task_id, **self.kwargs)
+
+
+def _batched(cb: callback.Callback) -> bool:
+    return type(cb).on_batch is not callback.Callback.on_batch
+
+
+class EventBus:
+    """Delivers callback events from a background thread.
+
+    Publishing only enqueues the event, so slow callbacks (e.g., database
+    commits or webhooks) do not add latency to tasks. Events are delivered
+    in publishing order. Callbacks overriding :meth:`Callback.on_batch`
+    receive all events queued since their last delivery at once, up to
+    ``batch_size``. Callbacks with ``blocking = True`` are called on the
+    publishing thread instead.
+
+    Callback failures are logged and counted per callback class (see
+    :attr:`failures`), they never fail the task.
+
+    Parameters
+    ----------
+    max_size : int, default=10000
+        Maximum number of pending events.
+
+    batch_size : int, default=100
+        Maximum number of events delivered at once.
+
+    overflow : {"block", "drop"}, default="block"
+        What to do when ``max_size`` events are pending. "block" waits for
+        the delivery thread (backpressure), "drop" discards the event.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        batch_size: int = 100,
+        overflow: str = "block",
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown overflow policy '{overflow}'. "
+                f"Choose from {OVERFLOW_POLICIES}."
+            )
+
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.overflow = overflow
+
+        self.delivered = 0
+        self.dropped = 0
+        self.failures: Counter[str] = Counter()
+
+        self._queue: queue.Queue = queue.Queue(max_size)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def publish(
+        self, callbacks: Iterable[callback.Callback], event: Event
+    ) -> None:
+        """Delivers ``event`` to ``callbacks``."""
+        queued = []
+        for cb in callbacks:
+            if getattr(cb, "blocking", False):
+                self.deliver(cb, [event])
+            else:
+                queued.append(cb)
+
+        if not queued:
+            return
+
+        self.start()
+        item = (queued, event)
+        if self.overflow == "block":
+            self._queue.put(item)
+            return
+
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            logger.warning(
+                "Event bus is full, dropped %r for %d callbacks.",
+                event,
+                len(queued),
+            )
+
+    def deliver(self, cb: callback.Callback, events: list[Event]) -> None:
+        """Calls ``cb`` with ``events``. Failures are logged and counted."""
+        if _batched(cb):
+            self._call(cb, events, cb.on_batch, events)
+        else:
+            for event in events:
+                self._call(cb, [event], event.dispatch, cb)
+
+    def _call(self, cb, events: list[Event], fun, *args) -> None:
+        try:
+            fun(*args)
+        except Exception:
+            with self._lock:
+                self.failures[type(cb).__name__] += len(events)
+            logger.exception("Callback %r failed on %s.", cb, events)
+        else:
+            with self._lock:
+                self.delivered += len(events)
+
+    def pending(self) -> int:
+        """Returns the number of events not delivered yet."""
+        return self._queue.unfinished_tasks
+
+    def start(self) -> None:
+        """Starts the delivery thread if it is not running already."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._loop, name="EventBus", daemon=True
+                )
+                self._thread.start()
+
+                # Also runs on exit of multiprocessing workers, which skip
+                # ``atexit`` handlers.
+                multiprocessing.util.Finalize(
+                    None,
+                    self.shutdown,
+                    kwargs={"timeout": EXIT_TIMEOUT},
+                    exitpriority=10,
+                )
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Waits until all published events are delivered.
+
+        Returns
+        -------
+        flushed : bool
+            False if ``timeout`` expired first.
+        """
+        if threading.current_thread() is self._thread:
+            return False
+
+        with self._queue.all_tasks_done:
+            return self._queue.all_tasks_done.wait_for(
+                lambda: not self._queue.unfinished_tasks, timeout
+            )
+
+    def shutdown(self, timeout: float | None = None) -> None:
+        """Delivers pending events and stops the delivery thread."""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+
+        if not self.flush(timeout):
+            logger.warning(
+                "Event bus shut down with %d events pending.", self.pending()
+            )
+        self._queue.put(_STOP)
+        thread.join(timeout)
+
+    def _loop(self) -> None:
+        while True:
+            items = [self._queue.get()]
+            while len(items) < self.batch_size and items[-1] is not _STOP:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = items[-1] is _STOP
+            if stop:
+                items.pop()
+
+            try:
+                self._dispatch(items)
+            finally:
+                for _ in range(len(items) + stop):
+                    self._queue.task_done()
+
+            if stop:
+                return
+
+    def _dispatch(self, items: list[tuple[list, Event]]) -> None:
+        # Group events per callback, keeping their order.
+        callbacks: dict[int, callback.Callback] = {}
+        events: dict[int, list[Event]] = {}
+        for queued, event in items:
+            for cb in queued:
+                callbacks[id(cb)] = cb
+                events.setdefault(id(cb), []).append(event)
+
+        for key, cb in callbacks.items():
+            self.deliver(cb, events[key])
+
+
+def get_event_bus() -> EventBus:
+    """Returns the event bus of this process.
+
+    It is created on first use from the ``EVENTS_`` settings.
+    """
+    global _bus
+
+    if _bus is None:
+        from mlflow_executor import settings
+
+        with _bus_lock:
+            if _bus is None:
+                conf = settings.conf.get_events_settings()
+                _bus = EventBus(conf.max_size, conf.batch_size, conf.overflow)
+    return _bus
+
+
+def publish(callbacks: Iterable[callback.Callback], event: Event) -> None:
+    """Publishes ``event`` to ``callbacks`` on the event bus."""
+    get_event_bus().publish(callbacks, event)
+
+
+def flush(timeout: float | None = None) -> bool:
+    """Waits until the event bus delivered all published events."""
+    return get_event_bus().flush(timeout)
+
+
+def _reset_after_fork() -> None:
+    # The delivery thread does not survive fork. Children start their own.
+    global _bus, _bus_lock
+
+    _bus = None
+    _bus_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
@@ -17,6 +17,9 @@ class BaseError(Exception):
         self.args = args
         self.kwargs = kwargs
 
+    def __str__(self) -> str:
+        return self.fmt.format(*self.args, **self.kwargs)
+
     def __reduce__(self):
         return _exception_from_packed_args, (
             self.__class__,
@@ -43,3 +46,27 @@ class RunningTasksDoesNotExist(BaseError):
 
 class ExecutorBackendDoesNotExist(BaseError):
     fmt = "Executor backend '{name}' does not exist. Available: {available}."
+
+
+class BackendQueueFull(BaseError):
+    fmt = "Backend submission queue is full (max_queue_size={size})."
+
+
+class TaskCancelled(BaseError):
+    fmt = "Task was cancelled."
+
+
+class TaskTimeout(BaseError):
+    fmt = "Task exceeded its timeout of {timeout} seconds."
+
+
+class JobAbandoned(BaseError):
+    fmt = "Job '{job_id}' was abandoned by its worker {attempts} times."
+
+
+class StreamingNotSupported(BaseError):
+    fmt = "Backend '{backend}' does not support streaming task output."
+
+
+class StreamNotAvailable(BaseError):
+    fmt = "Task '{task_id}' is not streamed. Execute it with stream=True."
@@ -1,5 +1,17 @@
 from mlflow_executor.execution.executor import TasksExecutor
+from mlflow_executor.execution.futures import as_completed, wait
+from mlflow_executor.execution.pipeline import Pipeline, PipelineRun
 from mlflow_executor.execution.promise import TaskPromise
 from mlflow_executor.execution.runner import TaskRunner
+from mlflow_executor.execution.singleflight import SingleFlight
 
-__all__ = ["TasksExecutor", "TaskPromise", "TaskRunner"]
+__all__ = [
+    "TasksExecutor",
+    "TaskPromise",
+    "TaskRunner",
+    "SingleFlight",
+    "Pipeline",
+    "PipelineRun",
+    "as_completed",
+    "wait",
+]
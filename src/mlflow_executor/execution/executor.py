@@ -1,8 +1,23 @@
-from kombu.utils.uuid import uuid
+import asyncio
+import uuid
+from typing import Any, Iterable
 
-from mlflow_executor import backend, backends, callback, task
-from mlflow_executor.execution.promise import TaskPromise
+from mlflow_executor import (
+    backend,
+    backends,
+    callback,
+    profiling,
+    retry,
+    streaming,
+    task,
+)
+from mlflow_executor.cache import CachedPromise, ResultCache, make_key
+from mlflow_executor.execution.promise import CachingTaskPromise, TaskPromise
 from mlflow_executor.execution.runner import TaskRunner
+from mlflow_executor.execution.singleflight import SingleFlight
+
+#: Default of cache lookups, telling misses apart from cached None results.
+_MISSING = object()
 
 
 class TasksExecutor:
@@ -28,10 +43,31 @@ class TasksExecutor:
         args: tuple = (),
         kwargs: dict = None,
         task_id: str | None = None,
+        timeout: float | None = None,
+        retry_policy: retry.RetryPolicy | None = None,
+        priority: int = 0,
+        resources: list[str] | None = None,
+        backend_options: dict | None = None,
+        profiler: profiling.Profiler | None = None,
+        channel: streaming.Channel | None = None,
+        callbacks: list[callback.Callback] = (),
     ) -> TaskRunner:
         """Creates :class:`TaskRunner` instance."""
-        task_id = task_id or uuid()
-        return TaskRunner(task, args, kwargs, task_id)
+        task_id = task_id or str(uuid.uuid4())
+        return TaskRunner(
+            task,
+            args,
+            kwargs,
+            task_id,
+            timeout,
+            retry_policy,
+            priority,
+            resources,
+            backend_options,
+            profiler,
+            channel,
+            callbacks,
+        )
 
     def execute(
         self,
@@ -40,7 +76,17 @@ class TasksExecutor:
         kwargs: dict | None = None,
         task_id: str | None = None,
         callbacks: list[callback.Callback] = (),
-        backend: backend.BackendExecutor = backends.LocalBackend(),
+        backend: backend.BackendExecutor | None = None,
+        timeout: float | None = None,
+        cache: ResultCache | None = None,
+        cache_key: str | None = None,
+        single_flight: SingleFlight | None = None,
+        retry_policy: retry.RetryPolicy | None = None,
+        priority: int = 0,
+        resources: list[str] | None = None,
+        backend_options: dict | None = None,
+        profiler: profiling.Profiler | None = None,
+        stream: bool = False,
     ) -> TaskPromise:
         """Executes tasks on the configured backend executor.
 
@@ -58,12 +104,258 @@ class TasksExecutor:
         task_id : str, default=None
             Task identifier.
 
+        backend : BackendExecutor, default=None
+            Backend executor. If None, the default backend of this process,
+            shared by every call without a backend, is used (see
+            :func:`backends.get_default_backend`).
+
+        timeout : float, default=None
+            Seconds the task is allowed to run before it is cancelled.
+
+        cache : ResultCache, default=None
+            If given, a previously cached result for the same call is
+            returned without running the task. Otherwise, the result is
+            cached once the caller gets it from the returned promise.
+
+        cache_key : str, default=None
+            Key identifying the call in ``cache`` and ``single_flight``. If
+            None, it is computed from ``name``, ``args`` and ``kwargs``,
+            which must then be JSON serializable.
+
+        single_flight : SingleFlight, default=None
+            If given and an identical call is already in flight, its promise
+            is returned instead. ``task_id`` and ``callbacks`` of the
+            coalesced call are ignored. Cannot be combined with ``stream``.
+
+        retry_policy : RetryPolicy, default=None
+            Retry policy applied on the worker. If None, the task default
+            policy is used.
+
+        priority : int, default=0
+            Scheduling priority, used by :class:`SchedulingBackend`.
+
+        resources : list of str, default=None
+            Concurrency limited resources used by the task, used by
+            :class:`SchedulingBackend`.
+
+        backend_options : dict, default=None
+            Backend specific options, e.g., Ray ``num_cpus``, ``memory`` or
+            ``placement_group`` (see :class:`RayBackend`).
+
+        profiler : Profiler, default=None
+            If given, sampled runs are profiled with cProfile and/or
+            tracemalloc where they run (see :class:`profiling.Profiler`).
+
+        stream : bool, default=False
+            If True, the task output is streamed to the caller (see
+            :meth:`TaskPromise.stream`), which must consume it. Supported by
+            :class:`LocalBackend` and :class:`RayBackend`. The stream of a
+            cache hit ends without events.
+
         Returns
         -------
         promise : TaskPromise
         """
+        if backend is None:
+            backend = backends.get_default_backend()
+
+        if single_flight is not None:
+            if stream:
+                raise ValueError(
+                    "Coalesced calls share a single promise, so they cannot "
+                    "be streamed. Use either `single_flight` or `stream`."
+                )
+            return single_flight.do(
+                key=cache_key or make_key(name, args, kwargs),
+                submit=lambda: self.execute(
+                    name,
+                    args,
+                    kwargs,
+                    task_id,
+                    callbacks,
+                    backend,
+                    timeout,
+                    cache,
+                    cache_key,
+                    retry_policy=retry_policy,
+                    priority=priority,
+                    resources=resources,
+                    backend_options=backend_options,
+                    profiler=profiler,
+                    stream=stream,
+                ),
+            )
+
+        if cache is not None:
+            cache_key = cache_key or make_key(name, args, kwargs)
+            cached = cache.get(cache_key, _MISSING)
+            if cached is not _MISSING:
+                task_id = task_id or str(uuid.uuid4())
+                channel = streaming.closed_channel() if stream else None
+                return TaskPromise(
+                    task_id, CachedPromise(cached), channel=channel
+                )
+
         task = self.get_task(name)
-        task.set_callbacks(callbacks)
-        runner = self.create_task_runner(task, args, kwargs, task_id)
+        channel = backend.open_channel() if stream else None
+        runner = self.create_task_runner(
+            task,
+            args,
+            kwargs,
+            task_id,
+            timeout,
+            retry_policy,
+            priority,
+            resources,
+            backend_options,
+            profiler,
+            channel,
+            callbacks,
+        )
         backend_promise = backend.run(runner)
-        return TaskPromise(runner.task_id, backend_promise)
+        if cache is not None:
+            return CachingTaskPromise(
+                runner.task_id,
+                backend_promise,
+                runner.timings,
+                channel,
+                cache=cache,
+                cache_key=cache_key,
+            )
+        return TaskPromise(
+            runner.task_id, backend_promise, runner.timings, channel
+        )
+
+    async def execute_async(
+        self,
+        name: str,
+        args: tuple = (),
+        kwargs: dict | None = None,
+        task_id: str | None = None,
+        callbacks: list[callback.Callback] = (),
+        backend: backend.BackendExecutor | None = None,
+        timeout: float | None = None,
+        cache: ResultCache | None = None,
+        cache_key: str | None = None,
+        single_flight: SingleFlight | None = None,
+        retry_policy: retry.RetryPolicy | None = None,
+        priority: int = 0,
+        resources: list[str] | None = None,
+        backend_options: dict | None = None,
+        profiler: profiling.Profiler | None = None,
+    ) -> Any:
+        """Asynchronous version of :meth:`execute`.
+
+        Submits the task and awaits its result without blocking the event
+        loop. Submission runs in a thread, since backends may block until
+        they admit the task (e.g., :class:`LocalBackend` with a full queue).
+
+        Returns
+        -------
+        result : object
+            The value returned by the task.
+        """
+        promise = await asyncio.to_thread(
+            self.execute,
+            name,
+            args,
+            kwargs,
+            task_id,
+            callbacks,
+            backend,
+            timeout,
+            cache,
+            cache_key,
+            single_flight,
+            retry_policy,
+            priority,
+            resources,
+            backend_options,
+            profiler,
+        )
+        return await promise
+
+    def map(
+        self,
+        name: str,
+        kwargs_iterable: Iterable[dict],
+        args: tuple = (),
+        callbacks: list[callback.Callback] = (),
+        backend: backend.BackendExecutor | None = None,
+        timeout: float | None = None,
+        retry_policy: retry.RetryPolicy | None = None,
+        priority: int = 0,
+        resources: list[str] | None = None,
+        backend_options: dict | None = None,
+        profiler: profiling.Profiler | None = None,
+    ) -> list[TaskPromise]:
+        """Executes the same task once per kwargs in a single submission.
+
+        The task is resolved only once and all runners are handed to
+        :meth:`BackendExecutor.run_many`, so backends can batch them.
+
+        Parameters
+        ----------
+        name : str
+            Name of the task to execute.
+
+        kwargs_iterable : iterable of dict
+            Task key-word arguments, one dict per run.
+
+        args : tuple, default=()
+            Task positional arguments shared by all runs.
+
+        backend : BackendExecutor, default=None
+            Backend executor. If None, the default backend of this process,
+            shared by every call without a backend, is used (see
+            :func:`backends.get_default_backend`).
+
+        timeout : float, default=None
+            Seconds each task is allowed to run before it is cancelled.
+
+        retry_policy : RetryPolicy, default=None
+            Retry policy applied on the worker. If None, the task default
+            policy is used.
+
+        priority : int, default=0
+            Scheduling priority of every run.
+
+        resources : list of str, default=None
+            Concurrency limited resources used by every run.
+
+        backend_options : dict, default=None
+            Backend specific options of every run.
+
+        profiler : Profiler, default=None
+            Profiling of the runs (see :class:`profiling.Profiler`).
+
+        Returns
+        -------
+        promises : list of TaskPromise
+            One promise per kwargs, in the same order.
+        """
+        if backend is None:
+            backend = backends.get_default_backend()
+
+        task = self.get_task(name)
+        runners = [
+            self.create_task_runner(
+                task,
+                args,
+                kwargs,
+                timeout=timeout,
+                retry_policy=retry_policy,
+                priority=priority,
+                resources=resources,
+                backend_options=backend_options,
+                profiler=profiler,
+                callbacks=callbacks,
+            )
+            for kwargs in kwargs_iterable
+        ]
+        backend_promises = backend.run_many(runners)
+
+        return [
+            TaskPromise(runner.task_id, backend_promise, runner.timings)
+            for runner, backend_promise in zip(runners, backend_promises)
+        ]
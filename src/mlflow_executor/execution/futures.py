@@ -0,0 +1,93 @@
+import time
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED
+from typing import Iterable, Iterator, NamedTuple
+
+from mlflow_executor import backend
+from mlflow_executor.execution.promise import TaskPromise
+
+
+class DoneAndNotDonePromises(NamedTuple):
+    """Finished and unfinished promises returned by :func:`wait`."""
+
+    done: set[TaskPromise]
+    not_done: set[TaskPromise]
+
+
+def wait(
+    promises: Iterable[TaskPromise],
+    timeout: float | None = None,
+    return_when: str = ALL_COMPLETED,
+) -> DoneAndNotDonePromises:
+    """Waits for the given task promises to complete.
+
+    Promises coming from the same backend are multiplexed with the backend
+    native primitive (e.g., ``concurrent.futures.wait`` or ``ray.wait``).
+    Promises from mixed backends are polled.
+
+    Parameters
+    ----------
+    promises : iterable of TaskPromise
+        Promises to wait for.
+
+    timeout : float, default=None
+        Maximum number of seconds to wait. If None, waits forever.
+
+    return_when : str {"FIRST_COMPLETED", "FIRST_EXCEPTION", "ALL_COMPLETED"}, \
+            default="ALL_COMPLETED"
+        When this function should return.
+
+    Returns
+    -------
+    done_and_not_done : DoneAndNotDonePromises
+    """
+    # Task promises may share a backend promise (e.g., coalesced or cached
+    # calls), so they are grouped by backend promise.
+    promises_of: dict[backend.Promise, list[TaskPromise]] = {}
+    for p in promises:
+        promises_of.setdefault(p.backend_promise, []).append(p)
+    promise_types = {type(p) for p in promises_of}
+
+    promise_cls = backend.Promise
+    if len(promise_types) == 1:
+        promise_cls = promise_types.pop()
+
+    done, not_done = promise_cls.wait(promises_of, timeout, return_when)
+
+    return DoneAndNotDonePromises(
+        done={p for bp in done for p in promises_of[bp]},
+        not_done={p for bp in not_done for p in promises_of[bp]},
+    )
+
+
+def as_completed(
+    promises: Iterable[TaskPromise], timeout: float | None = None
+) -> Iterator[TaskPromise]:
+    """Yields task promises as they complete.
+
+    Parameters
+    ----------
+    promises : iterable of TaskPromise
+        Promises to iterate over.
+
+    timeout : float, default=None
+        Maximum number of seconds to wait. If None, waits forever.
+
+    Raises
+    ------
+    TimeoutError if not all promises complete within ``timeout`` seconds.
+    """
+    pending = set(promises)
+    total = len(pending)
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    while pending:
+        remaining = None
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"{len(pending)} (of {total}) promises unfinished."
+                )
+
+        done, pending = wait(pending, remaining, FIRST_COMPLETED)
+        yield from done
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED
+from typing import Any, Iterator
+
+from mlflow_executor import backend, callback
+from mlflow_executor.execution.executor import TasksExecutor
+from mlflow_executor.execution.futures import wait
+from mlflow_executor.execution.promise import TaskPromise
+
+
+class Output:
+    """Reference to the result of a pipeline node.
+
+    Parameters
+    ----------
+    node : str
+        Name of the node.
+
+    key : str, default=None
+        If given, the result is indexed with it (e.g., "model_uri" of an
+        MLflow run summary).
+    """
+
+    def __init__(self, node: str, key: str | None = None) -> None:
+        self.node = node
+        self.key = key
+
+    def __repr__(self) -> str:
+        key = "" if self.key is None else f"[{self.key!r}]"
+        return f"<{type(self).__name__}: {self.node}{key}>"
+
+    def resolve(self, results: dict[str, Any]) -> Any:
+        """Returns the referenced value from the node results."""
+        result = results[self.node]
+        return result if self.key is None else result[self.key]
+
+
+def find_outputs(value: Any) -> Iterator[Output]:
+    """Yields the references in ``value``, including nested containers."""
+    if isinstance(value, Output):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from find_outputs(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from find_outputs(item)
+
+
+def resolve(value: Any, results: dict[str, Any]) -> Any:
+    """Returns ``value`` with the (nested) references replaced by values."""
+    if isinstance(value, Output):
+        return value.resolve(results)
+    if isinstance(value, dict):
+        return {k: resolve(v, results) for k, v in value.items()}
+    if isinstance(value, list):
+        return [resolve(v, results) for v in value]
+    if isinstance(value, tuple):
+        return tuple(resolve(v, results) for v in value)
+    return value
+
+
+class Node(Output):
+    """Pipeline node running a registered task.
+
+    Index a node to reference a key of its result, e.g., ``node["run_id"]``.
+
+    Parameters
+    ----------
+    name : str
+        Name of the node, unique within the pipeline.
+
+    task : str
+        Name of the registered task to run.
+
+    kwargs : dict
+        Task key-word arguments. Values may be :class:`Output` references,
+        also inside dicts, lists and tuples.
+
+    options : dict
+        Extra :meth:`TasksExecutor.execute` arguments (e.g., ``timeout``).
+    """
+
+    def __init__(
+        self, name: str, task: str, kwargs: dict, options: dict
+    ) -> None:
+        super().__init__(name)
+        self.task = task
+        self.kwargs = kwargs
+        self.options = options
+
+    def __getitem__(self, key: str) -> Output:
+        return Output(self.node, key)
+
+    @property
+    def name(self) -> str:
+        return self.node
+
+    @property
+    def upstream(self) -> set[str]:
+        """Names of the nodes this node depends on."""
+        return {output.node for output in find_outputs(self.kwargs)}
+
+    def resolve_kwargs(self, results: dict[str, Any]) -> dict:
+        """Returns the task kwargs with references replaced by values."""
+        return resolve(self.kwargs, results)
+
+
+class PipelineRun:
+    """Outcome of a pipeline run.
+
+    Attributes
+    ----------
+    results : dict, str -> object
+        Results of the nodes that succeeded.
+
+    errors : dict, str -> Exception
+        Exceptions of the nodes that failed.
+
+    skipped : set of str
+        Nodes not run because an upstream node failed.
+    """
+
+    def __init__(self) -> None:
+        self.results: dict[str, Any] = {}
+        self.errors: dict[str, BaseException] = {}
+        self.skipped: set[str] = set()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__}: {len(self.results)} succeeded, "
+            f"{len(self.errors)} failed, {len(self.skipped)} skipped>"
+        )
+
+    @property
+    def succeeded(self) -> bool:
+        return not self.errors and not self.skipped
+
+
+class Pipeline:
+    """Dependency-aware pipeline of registered tasks.
+
+    Nodes run as soon as all the nodes they reference are done, so
+    independent branches run concurrently on the backend. When a node
+    fails, only the nodes downstream of it are skipped, and passing the
+    failed run to :meth:`run` as ``previous`` re-runs just those.
+
+    Example
+    -------
+    pipeline = Pipeline()
+    train = pipeline.add("train", RUN_MLFLOW, uri=uri, parameters=params)
+    pipeline.add("deploy", "my.tasks.deploy", model_uri=train["model_uri"])
+    run = pipeline.run(backend=backends.RayBackend())
+
+    Parameters
+    ----------
+    executor : TasksExecutor, default=None
+        Executor used to submit the nodes.
+    """
+
+    def __init__(self, executor: TasksExecutor | None = None) -> None:
+        self.executor = executor or TasksExecutor()
+        self.nodes: dict[str, Node] = {}
+
+    def add(
+        self,
+        name: str,
+        task: str,
+        options: dict | None = None,
+        **kwargs,
+    ) -> Node:
+        """Adds a node to the pipeline.
+
+        Parameters
+        ----------
+        name : str
+            Name of the node.
+
+        task : str
+            Name of the registered task to run.
+
+        options : dict, default=None
+            Extra :meth:`TasksExecutor.execute` arguments.
+
+        **kwargs
+            Task key-word arguments. Use :class:`Output` references (e.g.,
+            nodes or ``node["key"]``) to feed results of other nodes. They
+            may be nested in dicts, lists and tuples, e.g.,
+            ``parameters={"model_uri": train["model_uri"]}``.
+
+        Returns
+        -------
+        node : Node
+        """
+        if name in self.nodes:
+            raise ValueError(f"Node '{name}' already exists.")
+
+        node = Node(name, task, kwargs, options or {})
+        missing = node.upstream - set(self.nodes)
+        if missing:
+            raise ValueError(
+                f"Node '{name}' references unknown nodes: {sorted(missing)}."
+            )
+
+        self.nodes[name] = node
+        return node
+
+    def downstream(self, name: str) -> set[str]:
+        """Returns the names of all the nodes depending on ``name``."""
+        found = set()
+        stack = [name]
+        while stack:
+            current = stack.pop()
+            for node in self.nodes.values():
+                if current in node.upstream and node.name not in found:
+                    found.add(node.name)
+                    stack.append(node.name)
+        return found
+
+    def run(
+        self,
+        callbacks: list[callback.Callback] = (),
+        backend: backend.BackendExecutor | None = None,
+        previous: PipelineRun | None = None,
+    ) -> PipelineRun:
+        """Runs the pipeline and blocks until all nodes are done.
+
+        Parameters
+        ----------
+        callbacks : list of callbacks.Callback, default=()
+            Callbacks enabled for every node.
+
+        backend : backend.BackendExecutor, default=None
+            Backend executor. If None, the default backend of this process,
+            shared by every call without a backend, is used (see
+            :func:`backends.get_default_backend`).
+
+        previous : PipelineRun, default=None
+            Previous run of this pipeline. Nodes which succeeded in it are
+            not run again.
+
+        Returns
+        -------
+        pipeline_run : PipelineRun
+
+        Raises
+        ------
+        Errors submitting a node (e.g., an unknown task) are raised once the
+        nodes already submitted are cancelled.
+        """
+        pipeline_run = PipelineRun()
+        if previous is not None:
+            pipeline_run.results.update(previous.results)
+
+        pending = {
+            name: node
+            for name, node in self.nodes.items()
+            if name not in pipeline_run.results
+        }
+        running: dict[TaskPromise, str] = {}
+
+        try:
+            while pending or running:
+                for name, node in list(pending.items()):
+                    if node.upstream <= set(pipeline_run.results):
+                        del pending[name]
+                        promise = self.executor.execute(
+                            node.task,
+                            kwargs=node.resolve_kwargs(pipeline_run.results),
+                            callbacks=callbacks,
+                            backend=backend,
+                            **node.options,
+                        )
+                        running[promise] = name
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for promise in done:
+                    name = running.pop(promise)
+                    try:
+                        pipeline_run.results[name] = promise.result()
+                    except Exception as exc:
+                        pipeline_run.errors[name] = exc
+                        for skipped in self.downstream(name):
+                            pending.pop(skipped, None)
+                            pipeline_run.skipped.add(skipped)
+        except BaseException:
+            # E.g., an unknown task or a rejected submission. Nodes already
+            # submitted are not left running unattended.
+            for promise in running:
+                promise.cancel()
+            raise
+
+        return pipeline_run
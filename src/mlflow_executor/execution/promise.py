@@ -1,6 +1,7 @@
 from typing import Any
 
-from mlflow_executor import backend
+from mlflow_executor import backend, exceptions, streaming, timing
+from mlflow_executor.cache import ResultCache
 
 
 class TaskPromise:
@@ -10,21 +11,128 @@ class TaskPromise:
     ----------
     task_id : str
         The task's UUID.
+
+    backend_promise : backend.Promise, default=None
+        Promise of the backend running the task.
+
+    timings : timing.Timings, default=None
+        Phase timings of the task. Backends running tasks in this process
+        (e.g., :class:`LocalBackend`) fill them as the task runs. Remote
+        backends only record the submission here, the remaining phases are
+        exported by the workers (see :func:`exporter.add_exporter`).
+
+    channel : streaming.Channel, default=None
+        Channel of the task output, if streamed.
     """
 
     def __init__(
-        self, task_id: str, backend_promise: backend.Promise | None = None
+        self,
+        task_id: str,
+        backend_promise: backend.Promise | None = None,
+        timings: timing.Timings | None = None,
+        channel: streaming.Channel | None = None,
     ):
         self.task_id = task_id
         self.backend_promise = backend_promise
+        self.timings = timings
+        self.channel = channel
 
     def __repr__(self) -> str:
         return f"<{type(self).__name__}: {self.task_id}>"
 
-    def result(self) -> Any:
-        """Return the result of the call that the future represents."""
-        return self.backend_promise.result()
+    def __await__(self):
+        return self.backend_promise.__await__()
+
+    def result(self, timeout: float | None = None) -> Any:
+        """Return the result of the call that the future represents.
+
+        Parameters
+        ----------
+        timeout : float, default=None
+            Seconds to wait for the result. If None, waits forever.
+        """
+        return self.backend_promise.result(timeout=timeout)
+
+    def stream(self, timeout: float | None = None) -> streaming.OutputStream:
+        """Returns an iterator over the output of the running task.
+
+        Yields :class:`streaming.StreamEvent` instances (stdout and stderr
+        lines of MLflow runs and progress events) until the task finishes.
+        Supports ``for`` and ``async for``.
+
+        Parameters
+        ----------
+        timeout : float, default=None
+            Seconds to wait for each event before raising
+            :class:`TimeoutError`. If None, waits forever.
+
+        Raises
+        ------
+        StreamNotAvailable if the task was not executed with ``stream=True``.
+        """
+        if self.channel is None:
+            raise exceptions.StreamNotAvailable(task_id=self.task_id)
+        return streaming.OutputStream(self.channel, timeout)
+
+    def cancel(self) -> bool:
+        """Attempts to cancel the task.
+
+        Running tasks are cancelled cooperatively, e.g., MLflow runs are
+        stopped through :meth:`mlflow.projects.SubmittedRun.cancel`.
+
+        Returns
+        -------
+        requested : bool
+            True if cancellation was requested.
+        """
+        return self.backend_promise.cancel()
 
     def done(self) -> bool:
         """Return True if the future was cancelled or finished executing."""
         return self.backend_promise.done()
+
+
+class CachingTaskPromise(TaskPromise):
+    """Task promise caching the result once the caller gets it.
+
+    Results are stored by the caller rather than the worker, so the store
+    does not need to be reachable from remote workers. Results nobody gets
+    are not cached.
+
+    Parameters
+    ----------
+    cache : ResultCache
+        Cache to store the result in.
+
+    cache_key : str
+        Cache key of the task call.
+    """
+
+    def __init__(
+        self,
+        task_id: str,
+        backend_promise: backend.Promise | None = None,
+        timings: timing.Timings | None = None,
+        channel: streaming.Channel | None = None,
+        cache: ResultCache | None = None,
+        cache_key: str | None = None,
+    ):
+        super().__init__(task_id, backend_promise, timings, channel)
+        self.cache = cache
+        self.cache_key = cache_key
+        self._cached = False
+
+    def __await__(self):
+        value = yield from super().__await__()
+        self._set(value)
+        return value
+
+    def result(self, timeout: float | None = None) -> Any:
+        value = super().result(timeout)
+        self._set(value)
+        return value
+
+    def _set(self, value: Any) -> None:
+        if not self._cached:
+            self.cache.set(self.cache_key, value)
+            self._cached = True
@@ -1,6 +1,20 @@
+import logging
+import time
 from typing import Any
 
-from mlflow_executor import task
+from mlflow_executor import (
+    callback,
+    cancellation,
+    events,
+    exporter,
+    profiling,
+    retry,
+    streaming,
+    task,
+    timing,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class TaskRunner:
@@ -19,6 +33,37 @@ class TaskRunner:
 
     task_id : str, default=None
         Task identifier.
+
+    timeout : float, default=None
+        Seconds the task is allowed to run, including retries. Tasks are
+        cancelled cooperatively (see :class:`cancellation.CancelToken`).
+
+    retry_policy : RetryPolicy, default=None
+        Retry policy. If None, the task default policy is used.
+
+    priority : int, default=0
+        Scheduling priority. Higher runs first (see
+        :class:`SchedulingBackend`).
+
+    resources : list of str, default=None
+        Names of the concurrency limited resources the task uses (see
+        :class:`SchedulingBackend`).
+
+    backend_options : dict, default=None
+        Backend specific options, e.g., Ray ``num_cpus`` (see
+        :class:`RayBackend`).
+
+    profiler : Profiler, default=None
+        If given, sampled runs are profiled where they run.
+
+    channel : streaming.Channel, default=None
+        If given, the task output is streamed through it and the channel is
+        closed when the run finishes.
+
+    callbacks : list of Callback, default=()
+        Callbacks of this run. They travel with the runner, so they are
+        also called on remote workers (on :class:`CeleryBackend`, only with
+        the "pickle" serializer).
     """
 
     def __init__(
@@ -27,30 +72,150 @@ class TaskRunner:
         args: tuple = (),
         kwargs: dict = None,
         task_id: str | None = None,
+        timeout: float | None = None,
+        retry_policy: retry.RetryPolicy | None = None,
+        priority: int = 0,
+        resources: list[str] | None = None,
+        backend_options: dict | None = None,
+        profiler: profiling.Profiler | None = None,
+        channel: streaming.Channel | None = None,
+        callbacks: list[callback.Callback] = (),
     ):
         self.task = task
         self.args = args
         self.kwargs = kwargs or {}
         self.task_id = task_id
+        self.token = cancellation.CancelToken(timeout)
+        self.retry_policy = retry_policy
+        self.attempts = 0
+        self.priority = priority
+        self.resources = resources or []
+        self.backend_options = backend_options or {}
+        self.profiler = profiler
+        self.channel = channel
+        self.callbacks = list(callbacks)
+        self.timings = timing.Timings(task.name, task_id)
+        self.timings.mark("submit")
 
     def run(self) -> Any:
         """Runs the actual task"""
-        self.notify_on_begin()
+        self.timings.mark("dequeue")
+        if self.timings.submitted_at is not None:
+            self.timings.add("queue", time.time() - self.timings.submitted_at)
+
+        session = None
+        if self.profiler is not None and self.profiler.sample():
+            session = self.start_profile()
 
+        retval = error = None
         try:
-            retval = self.task(*self.args, **self.kwargs)
-        except Exception as exc:
-            self.notify_on_failure(exc)
-            raise exc
+            with (
+                timing.use_timings(self.timings),
+                streaming.use_channel(self.channel),
+            ):
+                retval = self._run()
+        except BaseException as exc:
+            error = exc
+            self.timings.status = "failed"
+            raise
+        else:
+            self.timings.status = "succeeded"
+            return retval
+        finally:
+            if session is not None:
+                self.save_profile(session, retval, error)
+            self.timings.mark("finish")
+            exporter.export(self.timings)
+            if self.channel is not None:
+                self.close_channel()
+
+    def _run(self) -> Any:
+        self.notify_on_begin()
+        self.token.start()
+        policy = self.retry_policy or self.task.retry_policy
+
+        while True:
+            self.attempts += 1
+            try:
+                self.token.raise_if_cancelled()
+                with cancellation.use_token(self.token):
+                    with self.timings.phase("task"):
+                        retval = self.task(*self.args, **self.kwargs)
+                break
+            except BaseException as exc:
+                # Also catches KeyboardInterrupt, used by Ray and Celery
+                # workers to interrupt cancelled tasks.
+                if policy is None or not policy.should_retry(
+                    exc, self.attempts
+                ):
+                    self.notify_on_failure(exc)
+                    raise exc
+
+                self.notify_on_retry(exc)
+                self.token.wait(policy.get_delay(self.attempts))
 
         self.notify_on_success(retval)
         return retval
 
+    def start_profile(self) -> profiling.ProfileSession | None:
+        """Starts profiling, unless disabled for the task.
+
+        Failures are only logged.
+        """
+        reason = self.task.profiling_disabled
+        if reason is not None:
+            logger.info("Task %s is not profiled: %s", self.task_id, reason)
+            return None
+
+        try:
+            return self.profiler.start()
+        except Exception:
+            logger.exception("Could not profile task %s.", self.task_id)
+            return None
+
+    def save_profile(
+        self,
+        session: profiling.ProfileSession,
+        retval: Any = None,
+        exc: BaseException | None = None,
+    ) -> None:
+        """Saves the profiling reports. Failures are only logged."""
+        try:
+            run_id = profiling.get_run_id(retval, exc)
+            session.stop(self.task_id, run_id)
+        except Exception:
+            logger.exception(
+                "Could not save profile of task %s.", self.task_id
+            )
+
+    def close_channel(self) -> None:
+        """Ends the output stream. Failures are only logged."""
+        try:
+            self.channel.close()
+        except Exception:
+            logger.exception(
+                "Could not close the stream of task %s.", self.task_id
+            )
+
+    def cancel(self) -> None:
+        """Requests cancellation of the task."""
+        self.token.cancel()
+
+    def notify(self, method_name: str, **kwargs) -> None:
+        callbacks = [*self.task.callbacks, *self.callbacks]
+        with self.timings.phase("callbacks"):
+            if callbacks:
+                event = events.Event(method_name, self.task_id, kwargs)
+                events.publish(callbacks, event)
+
     def notify_on_begin(self) -> None:
-        self.task.notify("on_begin", task_id=self.task_id)
+        self.notify("on_begin")
 
     def notify_on_success(self, retval: Any) -> None:
-        self.task.notify("on_success", retval=retval, task_id=self.task_id)
+        self.notify("on_success", retval=retval)
 
     def notify_on_failure(self, exc: Exception) -> None:
-        self.task.notify("on_failure", exc=exc, task_id=self.task_id)
+        self.notify("on_failure", exc=exc)
+
+    def notify_on_retry(self, exc: Exception) -> None:
+        self.notify("on_retry", exc=exc, attempt=self.attempts)
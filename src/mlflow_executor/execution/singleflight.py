@@ -0,0 +1,88 @@
+import threading
+from concurrent.futures import Future
+from typing import Callable
+
+from mlflow_executor.execution.promise import TaskPromise
+
+
+class SingleFlight:
+    """Coalesces identical in-flight task submissions.
+
+    While a submission is running, later submissions with the same key
+    receive its promise instead of running the task again. Share one
+    instance between all the callers that should be deduplicated.
+
+    Attributes
+    ----------
+    submitted : int
+        Number of submissions that actually ran.
+
+    coalesced : int
+        Number of submissions attached to an in-flight promise.
+    """
+
+    def __init__(self) -> None:
+        self.submitted = 0
+        self.coalesced = 0
+        self._submissions: dict[str, Future] = {}
+        self._prune_at = 64
+        self._lock = threading.Lock()
+
+    def do(self, key: str, submit: Callable[[], TaskPromise]) -> TaskPromise:
+        """Returns the in-flight promise for ``key`` or calls ``submit``.
+
+        ``submit`` is called outside the lock, so slow submissions (e.g.,
+        to a full backend) do not block callers with other keys. Callers
+        with the same key wait for the submission and get its promise.
+
+        Parameters
+        ----------
+        key : str
+            Identifies the submission (see :func:`cache.make_key`).
+
+        submit : callable
+            Submits the task and returns its promise.
+        """
+        with self._lock:
+            submission = self._submissions.get(key)
+            if submission is not None and _in_flight(submission):
+                self.coalesced += 1
+                owner = False
+            else:
+                submission = Future()
+                self._submissions[key] = submission
+                self.submitted += 1
+                self._prune()
+                owner = True
+
+        if not owner:
+            return submission.result()
+
+        try:
+            promise = submit()
+        except BaseException as exc:
+            submission.set_exception(exc)
+            raise
+
+        submission.set_result(promise)
+        return promise
+
+    def _prune(self) -> None:
+        # Forget finished submissions once the map doubles in size, so
+        # checking them is amortized over many submissions.
+        if len(self._submissions) < self._prune_at:
+            return
+
+        self._submissions = {
+            k: s for k, s in self._submissions.items() if _in_flight(s)
+        }
+        self._prune_at = max(64, 2 * len(self._submissions))
+
+
+def _in_flight(submission: Future) -> bool:
+    """Returns True if the submission or its task is still running."""
+    if not submission.done():
+        return True
+    if submission.exception() is not None:
+        return False
+    return not submission.result().done()
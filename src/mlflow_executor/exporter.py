@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import abc
+import logging
+
+from mlflow_executor.timing import Timings
+
+logger = logging.getLogger(__name__)
+
+_exporters: list[MetricsExporter] = []
+
+
+class MetricsExporter(abc.ABC):
+    """Base class to inherit for concrete metrics exporters.
+
+    . note::
+        This class should not be used directly. Use derived classes instead.
+    """
+
+    @abc.abstractmethod
+    def export(self, timings: Timings) -> None:
+        """Exports the timings of a finished task execution."""
+
+
+def add_exporter(exporter: MetricsExporter) -> None:
+    """Exports the timings of every task run in this process to ``exporter``.
+
+    Exporters are per process: remote workers (Ray, process pools, Celery,
+    database workers) must add their own, e.g., from an included module.
+    """
+    if exporter not in _exporters:
+        _exporters.append(exporter)
+
+
+def remove_exporter(exporter: MetricsExporter) -> None:
+    """Stops exporting to ``exporter``."""
+    if exporter in _exporters:
+        _exporters.remove(exporter)
+
+
+def export(timings: Timings) -> None:
+    """Exports ``timings`` to every exporter. Failures are only logged."""
+    for exporter in list(_exporters):
+        try:
+            exporter.export(timings)
+        except Exception:
+            logger.exception("Metrics exporter %r failed.", exporter)
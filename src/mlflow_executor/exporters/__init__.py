@@ -0,0 +1,4 @@
+from mlflow_executor.exporters.memory import InMemoryExporter
+from mlflow_executor.exporters.prometheus import PrometheusExporter
+
+__all__ = ["InMemoryExporter", "PrometheusExporter"]
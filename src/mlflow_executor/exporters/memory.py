@@ -0,0 +1,20 @@
+import threading
+
+from mlflow_executor.exporter import MetricsExporter
+from mlflow_executor.timing import Timings
+
+
+class InMemoryExporter(MetricsExporter):
+    """Keeps the exported timings in memory (e.g., for tests)."""
+
+    def __init__(self) -> None:
+        self.timings: list[Timings] = []
+        self._lock = threading.Lock()
+
+    def export(self, timings: Timings) -> None:
+        with self._lock:
+            self.timings.append(timings)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.timings.clear()
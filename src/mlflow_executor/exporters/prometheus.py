@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import bisect
+import os
+import tempfile
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from mlflow_executor.exporter import MetricsExporter
+from mlflow_executor.timing import Timings
+
+#: Histogram buckets in seconds, from sub-second callbacks to long trainings.
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+    900.0,
+    3600.0,
+    float("inf"),
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _labels(**labels) -> str:
+    pairs = ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items())
+    return "{" + pairs + "}"
+
+
+class _Histogram:
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, buckets: tuple[float, ...], value: float) -> None:
+        self.counts[bisect.bisect_left(buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class PrometheusExporter(MetricsExporter):
+    """Aggregates timings as Prometheus histograms per task name and phase.
+
+    Metrics are rendered in the Prometheus text format and can be written
+    to a file (e.g., for the node exporter textfile collector) and/or served
+    over HTTP with :meth:`serve`.
+
+    Parameters
+    ----------
+    path : str, default=None
+        If given, the metrics are written to this file after each export.
+
+    buckets : tuple of float, default=DEFAULT_BUCKETS
+        Upper bounds of the histogram buckets in seconds.
+
+    prefix : str, default="mlflow_executor"
+        Prefix of the metric names.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        prefix: str = "mlflow_executor",
+    ):
+        buckets = tuple(sorted(buckets))
+        if buckets[-1] != float("inf"):
+            buckets = (*buckets, float("inf"))
+
+        self.path = path
+        self.buckets = buckets
+        self.prefix = prefix
+
+        self._histograms: dict[tuple[str, str], _Histogram] = {}
+        self._tasks: Counter[tuple[str, str]] = Counter()
+        self._lock = threading.Lock()
+
+    def export(self, timings: Timings) -> None:
+        task_name = timings.task_name or ""
+        with self._lock:
+            self._tasks[task_name, timings.status or "unknown"] += 1
+            for phase, seconds in timings.phases.items():
+                key = (task_name, phase)
+                if key not in self._histograms:
+                    self._histograms[key] = _Histogram(self.buckets)
+                self._histograms[key].observe(self.buckets, seconds)
+
+        if self.path is not None:
+            self.write(self.path)
+
+    def render(self) -> str:
+        """Returns the metrics in the Prometheus text format."""
+        tasks = f"{self.prefix}_tasks_total"
+        phases = f"{self.prefix}_phase_seconds"
+        lines = [
+            f"# HELP {tasks} Finished task executions.",
+            f"# TYPE {tasks} counter",
+        ]
+
+        with self._lock:
+            for (task, status), count in sorted(self._tasks.items()):
+                lines.append(
+                    f"{tasks}{_labels(task=task, status=status)} {count}"
+                )
+
+            lines += [
+                f"# HELP {phases} Duration of task execution phases.",
+                f"# TYPE {phases} histogram",
+            ]
+            for (task, phase), hist in sorted(self._histograms.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, hist.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    labels = _labels(task=task, phase=phase, le=le)
+                    lines.append(f"{phases}_bucket{labels} {cumulative}")
+
+                labels = _labels(task=task, phase=phase)
+                lines.append(f"{phases}_sum{labels} {hist.sum}")
+                lines.append(f"{phases}_count{labels} {hist.count}")
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str) -> None:
+        """Atomically writes the metrics to ``path``."""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(self.render())
+        os.replace(tmp, path)
+
+    def serve(self, port: int = 9464, addr: str = "") -> ThreadingHTTPServer:
+        """Serves the metrics over HTTP from a daemon thread.
+
+        Returns
+        -------
+        server : ThreadingHTTPServer
+            Running server. Call ``shutdown()`` to stop it.
+        """
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = exporter.render().encode()
+                self.send_response(200)
+                self.send_header(
+                    "Content-Type", "text/plain; version=0.0.4; charset=utf-8"
+                )
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((addr, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Any, Callable
+
+
+def lazy_attributes(
+    module_name: str, attributes: dict[str, str]
+) -> Callable[[str], Any]:
+    """Returns a module ``__getattr__`` importing attributes on first use.
+
+    Packages exporting implementations with heavy dependencies (e.g.,
+    ``ray``, ``celery`` or ``sqlalchemy``) use it, so only what is used is
+    imported.
+
+    Parameters
+    ----------
+    module_name : str
+        Name of the module defining ``__getattr__``.
+
+    attributes : dict, str -> str
+        Module each attribute is imported from.
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in attributes:
+            raise AttributeError(
+                f"module '{module_name}' has no attribute '{name}'"
+            )
+
+        value = getattr(importlib.import_module(attributes[name]), name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return __getattr__
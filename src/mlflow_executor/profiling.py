@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import random
+import tempfile
+import tracemalloc
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+def get_run_id(
+    retval: Any = None, exc: BaseException | None = None
+) -> str | None:
+    """Returns the MLflow run id of a task outcome or the active run, if any.
+
+    Parameters
+    ----------
+    retval : object, default=None
+        Task result, e.g., an MLflow run summary.
+
+    exc : BaseException, default=None
+        Task exception, e.g., :class:`RunFailed`.
+    """
+    if isinstance(retval, dict) and isinstance(retval.get("run_id"), str):
+        return retval["run_id"]
+
+    if isinstance(getattr(exc, "run_id", None), str):
+        return exc.run_id
+
+    import mlflow
+
+    run = mlflow.active_run()
+    return None if run is None else run.info.run_id
+
+
+def no_profiling(reason: str) -> Callable:
+    """Disables profiling of a registered task.
+
+    Use it for tasks whose work runs in a subprocess (e.g., MLflow entry
+    points), where cProfile and tracemalloc only see the thread waiting
+    for it. Sampled executions are logged and not profiled.
+
+    Example
+    -------
+    @registry()
+    @no_profiling("The script runs in a subprocess.")
+    def run_script():
+        ...
+    """
+
+    def inner(fun: Callable) -> Callable:
+        fun.profiling_disabled = reason
+        return fun
+
+    return inner
+
+
+class Profiler:
+    """Opt-in profiling of task executions.
+
+    Sampled executions are profiled where they run (including Ray, Celery
+    and database workers). Reports are logged as artifacts of the MLflow run
+    of the task, if known, under ``artifact_path``. Otherwise, they are
+    written to ``output_dir``.
+
+    . note::
+        tracemalloc traces the whole process, so allocations of tasks
+        running concurrently in the same process are included.
+
+    . note::
+        Only the worker process is profiled. Tasks running their work in a
+        subprocess, such as ``run_mlflow``, are not profiled (see
+        :func:`no_profiling`).
+
+    Parameters
+    ----------
+    cpu : bool, default=True
+        Whether to profile with cProfile. Writes a "<task_id>.pstats" file
+        and a "<task_id>.cpu.txt" summary.
+
+    memory : bool, default=False
+        Whether to trace allocations with tracemalloc. Writes a
+        "<task_id>.memory.txt" report with the top allocations.
+
+    sample_rate : float, default=1.0
+        Fraction of executions profiled.
+
+    output_dir : str, default=None
+        Directory of the reports of tasks without MLflow run. If None, the
+        ``output_dir`` profiling setting is used.
+
+    top : int, default=30
+        Number of entries in the text reports.
+
+    memory_frames : int, default=1
+        Frames stored per allocation traceback.
+
+    artifact_path : str, default="profiles"
+        MLflow artifact directory of the reports.
+    """
+
+    def __init__(
+        self,
+        cpu: bool = True,
+        memory: bool = False,
+        sample_rate: float = 1.0,
+        output_dir: str | None = None,
+        top: int = 30,
+        memory_frames: int = 1,
+        artifact_path: str = "profiles",
+    ):
+        self.cpu = cpu
+        self.memory = memory
+        self.sample_rate = sample_rate
+        self.output_dir = output_dir
+        self.top = top
+        self.memory_frames = memory_frames
+        self.artifact_path = artifact_path
+
+    def sample(self) -> bool:
+        """Returns True if the next execution should be profiled."""
+        return random.random() < self.sample_rate
+
+    def start(self) -> ProfileSession:
+        """Starts profiling the current thread."""
+        return ProfileSession(self)
+
+
+class ProfileSession:
+    """Profiling of a single task execution (see :class:`Profiler`)."""
+
+    def __init__(self, profiler: Profiler) -> None:
+        self.profiler = profiler
+        self.cpu_profile: cProfile.Profile | None = None
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self._started_tracemalloc = False
+
+        if profiler.memory and not tracemalloc.is_tracing():
+            tracemalloc.start(profiler.memory_frames)
+            self._started_tracemalloc = True
+
+        if profiler.cpu:
+            self.cpu_profile = cProfile.Profile()
+            self.cpu_profile.enable()
+
+    def stop(self, task_id: str, run_id: str | None = None) -> list[str]:
+        """Stops profiling and saves the reports.
+
+        Parameters
+        ----------
+        task_id : str
+            Task identifier, used to name the reports.
+
+        run_id : str, default=None
+            MLflow run to log the reports to.
+
+        Returns
+        -------
+        paths : list of str
+            Reports written to the output directory. Empty when logged as
+            MLflow artifacts.
+        """
+        if self.cpu_profile is not None:
+            self.cpu_profile.disable()
+
+        if tracemalloc.is_tracing() and self.profiler.memory:
+            self.snapshot = tracemalloc.take_snapshot()
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+
+        if run_id is not None:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                paths = self.write(tmpdir, task_id)
+                if self._log_artifacts(run_id, paths):
+                    return []
+
+        output_dir = self.profiler.output_dir
+        if output_dir is None:
+            from mlflow_executor import settings
+
+            output_dir = settings.conf.get_profiling_settings().output_dir
+
+        os.makedirs(output_dir, exist_ok=True)
+        return self.write(output_dir, task_id)
+
+    def write(self, directory: str, task_id: str) -> list[str]:
+        """Writes the reports to ``directory``."""
+        paths = []
+        if self.cpu_profile is not None:
+            path = os.path.join(directory, f"{task_id}.pstats")
+            self.cpu_profile.dump_stats(path)
+            paths.append(path)
+
+            path = os.path.join(directory, f"{task_id}.cpu.txt")
+            with open(path, "w") as f:
+                f.write(self.cpu_report())
+            paths.append(path)
+
+        if self.snapshot is not None:
+            path = os.path.join(directory, f"{task_id}.memory.txt")
+            with open(path, "w") as f:
+                f.write(self.memory_report())
+            paths.append(path)
+
+        return paths
+
+    def cpu_report(self) -> str:
+        """Returns the top functions by cumulative time."""
+        stream = io.StringIO()
+        stats = pstats.Stats(self.cpu_profile, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(
+            self.profiler.top
+        )
+        return stream.getvalue()
+
+    def memory_report(self) -> str:
+        """Returns the top allocation sites by size."""
+        stats = self.snapshot.statistics("lineno")
+        total = sum(stat.size for stat in stats)
+        lines = [f"Total allocated size: {total / 1024:.1f} KiB"]
+        lines += [str(stat) for stat in stats[: self.profiler.top]]
+        return "\n".join(lines) + "\n"
+
+    def _log_artifacts(self, run_id: str, paths: list[str]) -> bool:
+        from mlflow.tracking import MlflowClient
+
+        try:
+            client = MlflowClient()
+            for path in paths:
+                client.log_artifact(run_id, path, self.profiler.artifact_path)
+        except Exception:
+            logger.exception(
+                "Could not log profiles to MLflow run %s, writing them to "
+                "the output directory instead.",
+                run_id,
+            )
+            return False
+        return True
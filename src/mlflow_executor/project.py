@@ -1,17 +1,26 @@
-from typing import Any, Literal, TypedDict
+from __future__ import annotations
 
-from mlflow import projects
+import os
+import re
+from typing import TYPE_CHECKING, Any, Literal, TypedDict
 
 from mlflow_executor import (
     backend,
-    backends,
+    cache,
     callback,
-    deployer,
     deployers,
     execution,
-    predictor,
+    retry,
 )
 
+if TYPE_CHECKING:
+    from mlflow import projects
+
+    from mlflow_executor import deployer, predictor
+
+#: Name of the registered task running MLflow projects.
+RUN_MLFLOW = "mlflow_executor.tasks.mlflow.run_mlflow"
+
 
 class ProjectKwargs(TypedDict):
     uri: str | None
@@ -24,6 +33,61 @@ class ProjectKwargs(TypedDict):
     run_name: str | None
     env_manager: Literal["local", "virtualenv", "conda"] | None
     environment: dict[str, Any] | None
+    raise_on_failure: bool
+
+
+def resolve_git_commit(uri: str, version: str | None = None) -> str | None:
+    """Resolves the git commit a project run would use.
+
+    Parameters
+    ----------
+    uri : str
+        Project uri. Either a local directory or a git repository url.
+
+    version : str, default=None
+        Branch, tag or commit. If None, the default branch is used.
+
+    Returns
+    -------
+    commit : str or None
+        Commit hash or None when it cannot be determined (e.g., local
+        directories which are not clean git repositories).
+    """
+    import git
+
+    uri = uri.split("#")[0]
+
+    if os.path.isdir(uri):
+        try:
+            repo = git.Repo(uri, search_parent_directories=True)
+        except git.InvalidGitRepositoryError:
+            return None
+        return None if repo.is_dirty() else repo.head.commit.hexsha
+
+    ref = version or "HEAD"
+    if re.fullmatch("[0-9a-f]{40}", ref):
+        return ref
+
+    try:
+        refs = git.cmd.Git().ls_remote(uri, ref)
+    except git.GitCommandError:
+        return None
+
+    return refs.split()[0] if refs else None
+
+
+def make_cache_key(kwargs: ProjectKwargs) -> str | None:
+    """Returns the cache key of a project run.
+
+    The key is computed from the run kwargs with ``version`` replaced by the
+    resolved git commit. Returns None when the commit cannot be resolved, in
+    which case the run should not be cached.
+    """
+    commit = resolve_git_commit(kwargs["uri"], kwargs["version"])
+    if commit is None:
+        return None
+
+    return cache.make_key(RUN_MLFLOW, kwargs={**kwargs, "version": commit})
 
 
 class SubmittedRun:
@@ -52,10 +116,11 @@ class SubmittedRun:
         return self.submitted_run.get_status()
 
     def deploy(
-        self, deployer: deployer.Deployer = deployers.LocalDeployer()
+        self, deployer: deployer.Deployer | None = None
     ) -> predictor.Predictor:
         self.check_is_done()
 
+        deployer = deployer or deployers.LocalDeployer()
         return deployer.deploy(self.model_uri)
 
     def wait(self) -> bool:
@@ -80,7 +145,7 @@ def run(
     uri: str,
     parameters: dict[str, Any],
     callbacks: list[callback.Callback] = (),
-    backend: backend.BackendExecutor = backends.LocalBackend(),
+    backend: backend.BackendExecutor | None = None,
     entry_point: str = "main",
     experiment_name: str | None = None,
     experiment_id: str | None = None,
@@ -88,6 +153,16 @@ def run(
     run_name: str | None = None,
     env_manager: Literal["local", "virtualenv", "conda"] | None = None,
     environment: dict | None = None,
+    timeout: float | None = None,
+    version: str | None = None,
+    cache: cache.ResultCache | None = None,
+    single_flight: execution.SingleFlight | None = None,
+    retry_policy: retry.RetryPolicy | None = None,
+    priority: int = 0,
+    resources: list[str] | None = None,
+    backend_options: dict | None = None,
+    stream: bool = False,
+    raise_on_failure: bool = False,
 ) -> SubmittedRun:
     """Runs MLflow project on the configured backend executor.
 
@@ -96,8 +171,10 @@ def run(
     callbacks : list of callbacks.Callback, default=()
         Which callbacks to enable.
 
-    backend : backend.BackendExecutor, default=LocalExecutor()
-        Backend executor. Default local.
+    backend : backend.BackendExecutor, default=None
+        Backend executor. If None, the default backend of this process,
+        shared by every call without a backend, is used (see
+        :func:`backends.get_default_backend`).
 
     entry_point : str, default="main"
         MLflow project entrypoint.
@@ -113,10 +190,53 @@ def run(
 
     enviroment : dict
         Enviroment variables to set for the run.
+
+    timeout : float, default=None
+        Seconds the run is allowed to take before it is cancelled.
+
+    version : str, default=None
+        Git branch, tag or commit of the project.
+
+    cache : cache.ResultCache, default=None
+        If given, the summary of an identical finished run (same kwargs and
+        git commit) is returned without running the project again.
+
+    single_flight : execution.SingleFlight, default=None
+        If given, identical runs submitted while one is in flight attach
+        to it instead of starting a new MLflow run.
+
+    retry_policy : retry.RetryPolicy, default=None
+        Retry policy for failed runs. Use ``exit_codes`` to only retry
+        some exit codes.
+
+    priority : int, default=0
+        Scheduling priority, used by :class:`backends.SchedulingBackend`.
+
+    resources : list of str, default=None
+        Concurrency limited resources used by the run. Runs with an
+        ``experiment_name`` also use the "experiment:<experiment_name>"
+        resource, so ``{"experiment:*": n}`` limits runs per experiment.
+
+    backend_options : dict, default=None
+        Backend specific options, e.g., ``{"num_cpus": 8}`` to reserve the
+        cores of a multi-core training on :class:`backends.RayBackend`.
+
+    stream : bool, default=False
+        If True, the stdout and stderr lines of the run and its progress
+        events (see :func:`streaming.report_progress`) are streamed to
+        ``promise.stream()``, which must be consumed. Cannot be combined
+        with ``single_flight``.
+
+    raise_on_failure : bool, default=False
+        If True, failed runs raise :class:`tasks.mlflow.RunFailed` instead
+        of returning a summary with a "FAILED" status. Implied by
+        ``retry_policy``, which retries raised failures, and by ``cache``,
+        so failed runs are not cached.
     """
     kwargs = ProjectKwargs(
         uri=uri,
         entry_point=entry_point,
+        version=version,
         parameters=parameters,
         environment=environment,
         experiment_name=experiment_name,
@@ -124,14 +244,89 @@ def run(
         storage_dir=storage_dir,
         env_manager=env_manager,
         run_name=run_name,
+        raise_on_failure=(
+            raise_on_failure or retry_policy is not None or cache is not None
+        ),
     )
 
+    resources = list(resources or [])
+    if experiment_name is not None:
+        resources.append(f"experiment:{experiment_name}")
+
+    cache_key = None
+    if cache is not None:
+        cache_key = make_cache_key(kwargs)
+        if cache_key is None:
+            cache = None
+
     executor = execution.TasksExecutor()
     promise = executor.execute(
-        name="mlflow_executor.tasks.mlflow.run_mlflow",
+        name=RUN_MLFLOW,
         kwargs=kwargs,
         callbacks=callbacks,
         backend=backend,
+        timeout=timeout,
+        cache=cache,
+        cache_key=cache_key,
+        single_flight=single_flight,
+        retry_policy=retry_policy,
+        priority=priority,
+        resources=resources,
+        backend_options=backend_options,
+        stream=stream,
     )
 
     return promise
+
+
+async def run_async(
+    uri: str,
+    parameters: dict[str, Any],
+    callbacks: list[callback.Callback] = (),
+    backend: backend.BackendExecutor | None = None,
+    entry_point: str = "main",
+    experiment_name: str | None = None,
+    experiment_id: str | None = None,
+    storage_dir: str | None = None,
+    run_name: str | None = None,
+    env_manager: Literal["local", "virtualenv", "conda"] | None = None,
+    environment: dict | None = None,
+    timeout: float | None = None,
+    version: str | None = None,
+    cache: cache.ResultCache | None = None,
+    single_flight: execution.SingleFlight | None = None,
+    retry_policy: retry.RetryPolicy | None = None,
+    priority: int = 0,
+    resources: list[str] | None = None,
+    backend_options: dict | None = None,
+    raise_on_failure: bool = False,
+) -> dict:
+    """Asynchronous version of :func:`run`.
+
+    Awaits the MLflow run without blocking the event loop and returns its
+    summary.
+    """
+    promise = run(
+        uri=uri,
+        parameters=parameters,
+        callbacks=callbacks,
+        backend=backend,
+        entry_point=entry_point,
+        experiment_name=experiment_name,
+        experiment_id=experiment_id,
+        storage_dir=storage_dir,
+        run_name=run_name,
+        env_manager=env_manager,
+        environment=environment,
+        timeout=timeout,
+        version=version,
+        cache=cache,
+        single_flight=single_flight,
+        retry_policy=retry_policy,
+        priority=priority,
+        resources=resources,
+        backend_options=backend_options,
+        raise_on_failure=raise_on_failure,
+    )
+
+    return await promise
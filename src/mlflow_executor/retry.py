@@ -0,0 +1,112 @@
+import random
+from typing import Callable
+
+from mlflow_executor import exceptions
+
+#: Exceptions never retried.
+NON_RETRYABLE = (
+    exceptions.TaskCancelled,
+    exceptions.TaskTimeout,
+    KeyboardInterrupt,
+    SystemExit,
+)
+
+
+class RetryPolicy:
+    """Declarative retry policy.
+
+    Delays grow exponentially with the attempt number and, by default,
+    "full jitter" is applied (each delay is drawn uniformly from
+    ``[0, delay]``) so retries of concurrent tasks do not synchronize.
+
+    Parameters
+    ----------
+    max_attempts : int, default=3
+        Maximum number of attempts, including the first one.
+
+    backoff : float, default=1.0
+        Seconds to wait before the first retry.
+
+    backoff_factor : float, default=2.0
+        Multiplier applied to the delay after each retry.
+
+    max_backoff : float, default=60.0
+        Upper bound for the delay in seconds.
+
+    jitter : bool, default=True
+        Whether to randomize delays.
+
+    retry_on : tuple of exception classes, default=(Exception,)
+        Exceptions that trigger a retry. Cancellations and timeouts are
+        never retried.
+
+    exit_codes : list of int, default=None
+        If given, only exceptions with an ``exit_code`` attribute in this
+        list are retried (e.g., failed MLflow runs).
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff: float = 1.0,
+        backoff_factor: float = 2.0,
+        max_backoff: float = 60.0,
+        jitter: bool = True,
+        retry_on: tuple[type[BaseException], ...] = (Exception,),
+        exit_codes: list[int] | None = None,
+    ):
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_on = retry_on
+        self.exit_codes = exit_codes
+
+    def should_retry(self, exc: BaseException, attempt: int) -> bool:
+        """Returns True if the task should run again after failing.
+
+        Parameters
+        ----------
+        exc : BaseException
+            Exception raised by the attempt.
+
+        attempt : int
+            Number of the failed attempt, starting at 1.
+        """
+        if attempt >= self.max_attempts:
+            return False
+
+        if isinstance(exc, NON_RETRYABLE) or not isinstance(
+            exc, self.retry_on
+        ):
+            return False
+
+        if self.exit_codes is not None:
+            return getattr(exc, "exit_code", None) in self.exit_codes
+
+        return True
+
+    def get_delay(self, attempt: int) -> float:
+        """Returns the seconds to wait after the given failed attempt."""
+        delay = self.backoff * self.backoff_factor ** (attempt - 1)
+        delay = min(delay, self.max_backoff)
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+def retry(policy: RetryPolicy) -> Callable:
+    """Sets the default retry policy of a registered task.
+
+    Example
+    -------
+    @registry()
+    @retry(RetryPolicy(max_attempts=5))
+    def flaky_task():
+        ...
+    """
+
+    def inner(fun: Callable) -> Callable:
+        fun.retry_policy = policy
+        return fun
+
+    return inner
@@ -1,8 +1,8 @@
 import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import numpy as np
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class JSONSerializer:
@@ -20,6 +20,8 @@ class JSONSerializer:
         -------
         The data serialized as a JSON string.
         """
+        import numpy as np
+
         if isinstance(data, dict):
             return json.dumps(
                 {
@@ -45,5 +47,5 @@ class IdentitySerializer:
 
 
 class PandasSerializer:
-    def serialize(self, data: pd.DataFrame) -> dict:
+    def serialize(self, data: "pd.DataFrame") -> dict:
         return data.to_dict(orient="split")
@@ -26,9 +26,31 @@ class DBSettings(BaseSettings):
     ----------
     url : str
         Database connection url.
+
+    pool_size : int, default=5
+        Connections kept open by the engine of each process.
+
+    max_overflow : int, default=10
+        Connections opened on top of ``pool_size`` under load, closed once
+        returned.
+
+    pool_timeout : float, default=30.0
+        Seconds to wait for a connection when the pool is exhausted.
+
+    pool_recycle : int, default=1800
+        Seconds after which connections are replaced, before the database
+        or a proxy drops them. -1 disables recycling.
+
+    pool_pre_ping : bool, default=True
+        Whether to test connections when they are checked out.
     """
 
     url: str | None = None
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
 
     model_config = SettingsConfigDict(env_prefix="DB_")
 
@@ -50,16 +72,107 @@ class RaySettings(BaseSettings):
 
 
 class CelerySettings(BaseSettings):
-    """Celery settings."""
+    """Celery settings.
+
+    Parameters
+    ----------
+    accept_content : list of str, default=["msgpack", "json", "pickle"]
+        Content types accepted by workers. "pickle" is required by runners
+        other than :class:`TaskRunner`, per-call retry policies and
+        callbacks, which are always pickled.
+
+    task_serializer : str, default="msgpack"
+        Serializer of task messages.
+
+    task_compression : str, default=None
+        Compression of task messages (e.g., "gzip", "zlib", "bzip2").
+
+    task_default_queue : str, default="mlflow-executor"
+        Queue of tasks not matching any route.
+
+    worker_prefetch_multiplier : int, default=1
+        Messages reserved per worker process. Keep it low for long-running
+        trainings so queued tasks are not held by busy workers.
+
+    task_acks_late : bool, default=True
+        Acknowledge messages after the task finishes, so tasks of lost
+        workers are redelivered.
+    """
 
     broker_url: str = "amqp://rabbitmq:5672"
     result_backend: str = "redis://redis:6379/0"
-    accept_content: list[str] = ["json"]
+    accept_content: list[str] = ["msgpack", "json", "pickle"]
     event_serializer: str = "json"
+    task_serializer: str = "msgpack"
+    result_serializer: str = "msgpack"
+    result_accept_content: list[str] = ["msgpack", "json", "pickle"]
+    task_compression: str | None = None
+    result_compression: str | None = None
+    task_default_queue: str = "mlflow-executor"
+    worker_prefetch_multiplier: int = 1
+    task_acks_late: bool = True
 
     model_config = SettingsConfigDict(env_prefix="CELERY_")
 
 
+class ProfilingSettings(BaseSettings):
+    """Profiling settings.
+
+    Parameters
+    ----------
+    output_dir : str
+        Directory of the profiling reports of tasks without MLflow run.
+    """
+
+    output_dir: str = "profiles"
+
+    model_config = SettingsConfigDict(env_prefix="PROFILING_")
+
+
+class EventsSettings(BaseSettings):
+    """Callback event bus settings (see :class:`EventBus`).
+
+    Parameters
+    ----------
+    max_size : int, default=10000
+        Maximum number of pending events.
+
+    batch_size : int, default=100
+        Maximum number of events delivered at once.
+
+    overflow : str, default="block"
+        "block" publishers or "drop" events when the bus is full.
+    """
+
+    max_size: int = 10000
+    batch_size: int = 100
+    overflow: str = "block"
+
+    model_config = SettingsConfigDict(env_prefix="EVENTS_")
+
+
+class StatusSettings(BaseSettings):
+    """Buffered task status settings (see :class:`StatusWriter`).
+
+    Parameters
+    ----------
+    batch_size : int, default=500
+        Buffered updates triggering a write.
+
+    flush_interval : float, default=1.0
+        Maximum seconds an update stays buffered.
+
+    max_size : int, default=10000
+        Maximum number of buffered tasks.
+    """
+
+    batch_size: int = 500
+    flush_interval: float = 1.0
+    max_size: int = 10000
+
+    model_config = SettingsConfigDict(env_prefix="DB_STATUS_")
+
+
 def get_dotenv() -> str:
     """Returns dotenv filename."""
     return find_dotenv(EnvFile().env_file)
@@ -89,6 +202,15 @@ class AnyForecastConfigParser:
     def get_mlflow_settings(self) -> MLflowSettings:
         return MLflowSettings(_env_file=self._env_file)
 
+    def get_profiling_settings(self) -> ProfilingSettings:
+        return ProfilingSettings(_env_file=self._env_file)
+
+    def get_events_settings(self) -> EventsSettings:
+        return EventsSettings(_env_file=self._env_file)
+
+    def get_status_settings(self) -> StatusSettings:
+        return StatusSettings(_env_file=self._env_file)
+
 
 conf: AnyForecastConfigParser = AnyForecastConfigParser()
 
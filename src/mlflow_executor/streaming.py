@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import abc
+import asyncio
+import contextlib
+import contextvars
+import json
+import logging
+import queue
+import time
+from typing import Any, AsyncIterator, Iterator
+
+logger = logging.getLogger(__name__)
+
+#: Default maximum number of buffered stream events.
+BUFFER_SIZE = 1000
+
+#: Seconds :meth:`Channel.close` waits for free space in the buffer.
+CLOSE_TIMEOUT = 5.0
+
+#: Prefix of the output lines parsed as progress events.
+PROGRESS_PREFIX = "@@mlflow-executor-progress "
+
+_current_channel: contextvars.ContextVar[Channel | None] = (
+    contextvars.ContextVar("channel", default=None)
+)
+
+
+def current_channel() -> Channel | None:
+    """Returns the stream channel of the task running in this context."""
+    return _current_channel.get()
+
+
+@contextlib.contextmanager
+def use_channel(channel: Channel | None) -> Iterator[Channel | None]:
+    """Makes ``channel`` the current stream channel inside the context."""
+    reset_channel = _current_channel.set(channel)
+    try:
+        yield channel
+    finally:
+        _current_channel.reset(reset_channel)
+
+
+def report_progress(**data) -> None:
+    """Reports structured progress (e.g., epoch and metrics) of a task.
+
+    Inside a streamed task, the progress event is sent to the caller
+    directly. Elsewhere (e.g., the training script of an MLflow project), it
+    is printed as a :data:`PROGRESS_PREFIX` line followed by the JSON encoded
+    ``data``, which streamed MLflow runs turn into progress events. Scripts
+    without ``mlflow_executor`` installed may print such lines themselves.
+    """
+    channel = current_channel()
+    if channel is not None:
+        channel.put(StreamEvent("progress", data))
+        return
+
+    print(PROGRESS_PREFIX + json.dumps(data), flush=True)
+
+
+def parse_line(kind: str, line: str) -> StreamEvent:
+    """Returns the stream event of an output line of kind ``kind``."""
+    line = line.rstrip("\r\n")
+    if line.startswith(PROGRESS_PREFIX):
+        try:
+            return StreamEvent(
+                "progress", json.loads(line[len(PROGRESS_PREFIX) :])
+            )
+        except ValueError:
+            pass
+    return StreamEvent(kind, line)
+
+
+class StreamEvent:
+    """Event streamed from a running task to its caller.
+
+    Parameters
+    ----------
+    kind : str
+        "stdout" or "stderr" (``data`` is the line without line break),
+        "progress" (``data`` is a dict) or "end" (closes the stream).
+
+    data : object, default=None
+        Event payload.
+    """
+
+    def __init__(self, kind: str, data: Any = None) -> None:
+        self.kind = kind
+        self.data = data
+        self.created_at = time.time()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}: {self.kind} {self.data!r}>"
+
+
+class Channel(abc.ABC):
+    """Bounded buffer of stream events from a task to its caller.
+
+    Producers block while the buffer is full, which in turn blocks the
+    output of streamed MLflow runs (backpressure). Streamed tasks must be
+    consumed (see :meth:`TaskPromise.stream`), otherwise they stall once
+    the buffer is full.
+
+    . note::
+        This class should not be used directly. Use derived classes instead.
+    """
+
+    @abc.abstractmethod
+    def put(self, event: StreamEvent, timeout: float | None = None) -> None:
+        """Adds ``event``, waiting for free space up to ``timeout``."""
+
+    @abc.abstractmethod
+    def get(self, timeout: float | None = None) -> StreamEvent:
+        """Removes and returns the next event.
+
+        Raises
+        ------
+        queue.Empty if no event is available within ``timeout``.
+        """
+
+    def close(self, timeout: float | None = CLOSE_TIMEOUT) -> None:
+        """Ends the stream.
+
+        If the buffer is still full after ``timeout`` seconds, the caller is
+        not consuming the stream and the end event is dropped rather than
+        blocking the worker.
+        """
+        try:
+            self.put(StreamEvent("end"), timeout=timeout)
+        except queue.Full:
+            logger.warning("Dropped the end of a stream nobody consumes.")
+
+
+class LocalChannel(Channel):
+    """Stream channel of tasks running in this process.
+
+    Parameters
+    ----------
+    max_size : int, default=BUFFER_SIZE
+        Maximum number of buffered events.
+    """
+
+    def __init__(self, max_size: int = BUFFER_SIZE) -> None:
+        self.queue: queue.Queue = queue.Queue(max_size)
+
+    def put(self, event: StreamEvent, timeout: float | None = None) -> None:
+        self.queue.put(event, timeout=timeout)
+
+    def get(self, timeout: float | None = None) -> StreamEvent:
+        return self.queue.get(timeout=timeout)
+
+
+def closed_channel() -> LocalChannel:
+    """Returns a channel whose stream already ended.
+
+    Streamed calls that do not run (e.g., cache hits) return it, so their
+    stream yields no events.
+    """
+    channel = LocalChannel(max_size=1)
+    channel.close()
+    return channel
+
+
+class OutputStream:
+    """Iterator over the stream events of a task, until the task finishes.
+
+    Supports both ``for`` and ``async for``. Events are consumed, so a task
+    is streamed once.
+
+    Parameters
+    ----------
+    channel : Channel
+        Channel of the task.
+
+    timeout : float, default=None
+        Seconds to wait for each event. If None, waits forever.
+    """
+
+    def __init__(self, channel: Channel, timeout: float | None = None):
+        self.channel = channel
+        self.timeout = timeout
+        self.closed = False
+
+    def __iter__(self) -> Iterator[StreamEvent]:
+        while not self.closed:
+            event = self._get()
+            if event is not None:
+                yield event
+
+    async def __aiter__(self) -> AsyncIterator[StreamEvent]:
+        while not self.closed:
+            event = await asyncio.to_thread(self._get)
+            if event is not None:
+                yield event
+
+    def _get(self) -> StreamEvent | None:
+        try:
+            event = self.channel.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError(
+                f"No stream event within {self.timeout} seconds."
+            ) from None
+
+        if event.kind == "end":
+            self.closed = True
+            return None
+        return event
@@ -0,0 +1,402 @@
+from __future__ import annotations
+
+import abc
+import itertools
+import random
+import statistics
+import uuid
+from concurrent.futures import FIRST_COMPLETED
+from typing import Any, Literal
+
+from mlflow.tracking import MlflowClient
+
+from mlflow_executor import backend, callback, execution, project
+
+
+def grid_search(space: dict[str, list]) -> list[dict[str, Any]]:
+    """Returns every combination of the given parameter values.
+
+    Example
+    -------
+    grid_search({"alpha": [0.1, 0.5], "l1_ratio": [0.01, 0.1]})
+    """
+    names = list(space)
+    return [
+        dict(zip(names, values))
+        for values in itertools.product(*(space[n] for n in names))
+    ]
+
+
+def random_search(
+    space: dict[str, list], n_samples: int, seed: int | None = None
+) -> list[dict[str, Any]]:
+    """Returns ``n_samples`` random combinations of the parameter values."""
+    rng = random.Random(seed)
+    return [
+        {name: rng.choice(values) for name, values in space.items()}
+        for _ in range(n_samples)
+    ]
+
+
+class Trial:
+    """Single run of a sweep.
+
+    Attributes
+    ----------
+    status : str {"pending", "running", "finished", "failed", "stopped"}
+        Trial status.
+
+    history : list of (step, value)
+        Values of the sweep metric logged so far.
+    """
+
+    def __init__(self, index: int, parameters: dict, run_name: str) -> None:
+        self.index = index
+        self.parameters = parameters
+        self.run_name = run_name
+        self.promise: execution.TaskPromise | None = None
+        self.run_id: str | None = None
+        self.history: list[tuple[int, float]] = []
+        self.status = "pending"
+        self.summary: dict | None = None
+        self.error: BaseException | None = None
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}: {self.run_name} ({self.status})>"
+
+    @property
+    def step(self) -> int | None:
+        """Last step the metric was logged at."""
+        return self.history[-1][0] if self.history else None
+
+    def value_at(self, step: int) -> float | None:
+        """Returns the last metric value logged at or before ``step``."""
+        values = [v for s, v in self.history if s <= step]
+        return values[-1] if values else None
+
+    def value_from(self, step: int) -> float | None:
+        """Returns the first metric value logged at or after ``step``."""
+        values = [v for s, v in self.history if s >= step]
+        return values[0] if values else None
+
+
+class Stopper(abc.ABC):
+    """Base class to inherit for early stopping rules.
+
+    . note::
+        This class should not be used directly. Use derived classes instead.
+    """
+
+    def reset(self) -> None:
+        """Forgets the state of a previous sweep.
+
+        Called at the start of every :meth:`Sweep.run`.
+        """
+
+    @abc.abstractmethod
+    def should_stop(
+        self, trial: Trial, trials: list[Trial], mode: Literal["min", "max"]
+    ) -> bool:
+        """Returns True if the running ``trial`` should be cancelled.
+
+        Parameters
+        ----------
+        trial : Trial
+            Running trial to evaluate.
+
+        trials : list of Trial
+            All trials of the sweep.
+
+        mode : str {"min", "max"}
+            Whether the metric is minimized or maximized.
+        """
+
+
+class MedianStopper(Stopper):
+    """Median stopping rule.
+
+    Stops a trial whose value at its current step is worse than the median
+    of the other trials' values at the same step.
+
+    Parameters
+    ----------
+    grace_steps : int, default=1
+        Trials are never stopped before this step.
+
+    min_trials : int, default=3
+        Minimum number of other trials with values required to decide.
+    """
+
+    def __init__(self, grace_steps: int = 1, min_trials: int = 3):
+        self.grace_steps = grace_steps
+        self.min_trials = min_trials
+
+    def should_stop(self, trial, trials, mode) -> bool:
+        step = trial.step
+        if step is None or step < self.grace_steps:
+            return False
+
+        others = [
+            value
+            for other in trials
+            if other is not trial
+            and (value := other.value_at(step)) is not None
+        ]
+        if len(others) < self.min_trials:
+            return False
+
+        value = trial.value_at(step)
+        median = statistics.median(others)
+        return value > median if mode == "min" else value < median
+
+
+class SuccessiveHalvingStopper(Stopper):
+    """Asynchronous successive halving.
+
+    At each rung (a metric step), a trial continues only if its value is
+    among the best ``1 / reduction_factor`` of the values recorded at that
+    rung so far. Trials not logging at a rung are compared with their first
+    value after it. Stopped trials are skipped afterwards, so they are not
+    ranked at later rungs.
+
+    Parameters
+    ----------
+    rungs : list of int
+        Steps at which trials are compared, in increasing order.
+
+    reduction_factor : int, default=2
+        Inverse of the fraction of trials kept at each rung.
+    """
+
+    def __init__(self, rungs: list[int], reduction_factor: int = 2):
+        self.rungs = sorted(rungs)
+        self.reduction_factor = reduction_factor
+        self.reset()
+
+    def reset(self) -> None:
+        self._recorded: dict[int, dict[int, float]] = {
+            rung: {} for rung in self.rungs
+        }
+        self._stopped: set[int] = set()
+
+    def should_stop(self, trial, trials, mode) -> bool:
+        step = trial.step
+        if step is None:
+            return False
+        if trial.index in self._stopped:
+            return False
+
+        for rung in self.rungs:
+            if rung > step:
+                break
+
+            recorded = self._recorded[rung]
+            if trial.index in recorded:
+                continue
+
+            value = trial.value_at(rung)
+            if value is None:
+                value = trial.value_from(rung)
+            recorded[trial.index] = value
+            if not self._in_top(trial.index, recorded, mode):
+                self._stopped.add(trial.index)
+                return True
+
+        return False
+
+    def _in_top(self, index: int, recorded: dict, mode: str) -> bool:
+        ranked = sorted(recorded, key=recorded.get, reverse=mode == "max")
+        keep = max(1, len(ranked) // self.reduction_factor)
+        return index in ranked[:keep]
+
+
+class SweepResult:
+    """Outcome of a sweep."""
+
+    def __init__(self, trials: list[Trial], metric: str, mode: str) -> None:
+        self.trials = trials
+        self.metric = metric
+        self.mode = mode
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}: {len(self.trials)} trials>"
+
+    @property
+    def best(self) -> Trial | None:
+        """Finished trial with the best final metric value."""
+        finished = [
+            t for t in self.trials if t.status == "finished" and t.history
+        ]
+        if not finished:
+            return None
+
+        pick = min if self.mode == "min" else max
+        return pick(finished, key=lambda t: t.history[-1][1])
+
+
+class Sweep:
+    """Parallel hyperparameter sweep over an MLflow project.
+
+    Trials run through :func:`project.run` on any backend, with at most
+    ``max_concurrent`` of them in flight. While they run, the sweep metric
+    is read back from the tracking server and, if a ``stopper`` is given,
+    poorly performing trials are cancelled early.
+
+    Parameters
+    ----------
+    uri : str
+        Project uri.
+
+    trials : list of dict
+        Parameters of each trial (see :func:`grid_search` and
+        :func:`random_search`).
+
+    metric : str
+        Name of the MLflow metric to optimize.
+
+    experiment_name : str
+        MLflow experiment the trials are logged to.
+
+    mode : str {"min", "max"}, default="min"
+        Whether ``metric`` is minimized or maximized.
+
+    max_concurrent : int, default=4
+        Maximum number of trials running at the same time.
+
+    stopper : Stopper, default=None
+        Early stopping rule. If None, all trials run to completion.
+
+    poll_interval : float, default=10.0
+        Seconds between metric reads.
+
+    **run_kwargs
+        Extra :func:`project.run` arguments (e.g., ``env_manager``).
+    """
+
+    def __init__(
+        self,
+        uri: str,
+        trials: list[dict[str, Any]],
+        metric: str,
+        experiment_name: str,
+        mode: Literal["min", "max"] = "min",
+        max_concurrent: int = 4,
+        stopper: Stopper | None = None,
+        poll_interval: float = 10.0,
+        **run_kwargs,
+    ):
+        self.uri = uri
+        self.trials = trials
+        self.metric = metric
+        self.experiment_name = experiment_name
+        self.mode = mode
+        self.max_concurrent = max_concurrent
+        self.stopper = stopper
+        self.poll_interval = poll_interval
+        self.run_kwargs = run_kwargs
+
+    def run(
+        self,
+        callbacks: list[callback.Callback] = (),
+        backend: backend.BackendExecutor | None = None,
+    ) -> SweepResult:
+        """Runs the sweep and blocks until all trials are done.
+
+        Parameters
+        ----------
+        callbacks : list of callbacks.Callback, default=()
+            Callbacks enabled for every trial.
+
+        backend : backend.BackendExecutor, default=None
+            Backend executor. If None, the default backend of this process,
+            shared by every call without a backend, is used (see
+            :func:`backends.get_default_backend`).
+        """
+        if self.stopper is not None:
+            self.stopper.reset()
+
+        client = MlflowClient()
+        experiment_id = self._get_or_create_experiment(client)
+        prefix = f"sweep-{uuid.uuid4().hex[:8]}"
+        trials = [
+            Trial(i, parameters, f"{prefix}-{i}")
+            for i, parameters in enumerate(self.trials)
+        ]
+        pending = list(trials)
+        running: dict[execution.TaskPromise, Trial] = {}
+
+        while pending or running:
+            while pending and len(running) < self.max_concurrent:
+                trial = pending.pop(0)
+                trial.promise = project.run(
+                    uri=self.uri,
+                    parameters=trial.parameters,
+                    callbacks=callbacks,
+                    backend=backend,
+                    experiment_name=self.experiment_name,
+                    run_name=trial.run_name,
+                    **self.run_kwargs,
+                )
+                trial.status = "running"
+                running[trial.promise] = trial
+
+            done, _ = execution.wait(
+                running, self.poll_interval, FIRST_COMPLETED
+            )
+
+            for promise in done:
+                self._finish(running.pop(promise))
+
+            for trial in running.values():
+                if trial.status == "stopped":
+                    # Cancelled already, waiting for the run to end.
+                    continue
+
+                self._update_history(client, experiment_id, trial)
+                if self.stopper is not None and self.stopper.should_stop(
+                    trial, trials, self.mode
+                ):
+                    trial.status = "stopped"
+                    trial.promise.cancel()
+
+        for trial in trials:
+            self._update_history(client, experiment_id, trial)
+
+        return SweepResult(trials, self.metric, self.mode)
+
+    def _finish(self, trial: Trial) -> None:
+        try:
+            trial.summary = trial.promise.result()
+        except BaseException as exc:
+            trial.error = exc
+            if trial.status != "stopped":
+                trial.status = "failed"
+        else:
+            trial.run_id = trial.summary["run_id"]
+            if trial.summary["status"] == "FINISHED":
+                trial.status = "finished"
+            else:
+                trial.status = "failed"
+
+    def _get_or_create_experiment(self, client: MlflowClient) -> str:
+        # Created up front: concurrent runs racing to create it fail.
+        experiment = client.get_experiment_by_name(self.experiment_name)
+        if experiment is not None:
+            return experiment.experiment_id
+        return client.create_experiment(self.experiment_name)
+
+    def _update_history(
+        self, client: MlflowClient, experiment_id: str, trial: Trial
+    ) -> None:
+        if trial.run_id is None:
+            runs = client.search_runs(
+                [experiment_id],
+                filter_string=f"tags.`mlflow.runName` = '{trial.run_name}'",
+                max_results=1,
+            )
+            if not runs:
+                return
+            trial.run_id = runs[0].info.run_id
+
+        metrics = client.get_metric_history(trial.run_id, self.metric)
+        trial.history = sorted((m.step, m.value) for m in metrics)
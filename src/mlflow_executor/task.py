@@ -1,6 +1,26 @@
 from __future__ import annotations
 
-from mlflow_executor import callback, registry
+import importlib.metadata
+import logging
+import threading
+
+from mlflow_executor import callback, registry, retry
+
+logger = logging.getLogger(__name__)
+
+#: Entry point group of the task registries of other distributions.
+ENTRY_POINT_GROUP = "mlflow_executor.tasks"
+
+#: Entry points of the tasks of this package. They are indexed like the
+#: entry points of other distributions, so their modules (and ``mlflow``)
+#: are imported once one of their tasks is requested.
+DEFAULT_ENTRY_POINTS = (
+    importlib.metadata.EntryPoint(
+        name="mlflow_executor.tasks.mlflow.run_mlflow",
+        value="mlflow_executor.tasks.mlflow:registry",
+        group=ENTRY_POINT_GROUP,
+    ),
+)
 
 
 def gen_task_name(name, module_name) -> str:
@@ -12,11 +32,10 @@ def unpickle_task(name) -> Task:
 
 
 def create_factory() -> TasksFactory:
-
-    from mlflow_executor.tasks import mlflow
-
     factory = TasksFactory()
-    factory.include_registry(mlflow.registry)
+    for entry_point in DEFAULT_ENTRY_POINTS:
+        factory.include_entry_point(entry_point)
+    factory.include_entry_points(ENTRY_POINT_GROUP)
 
     return factory
 
@@ -34,9 +53,16 @@ class Task:
     #: Name of the task.
     name: str = None
 
-    #: Run behavior. Do nothing by default,
+    #: Callbacks of every run, in addition to the per-run callbacks of
+    #: :class:`TaskRunner`. Empty by default.
     callbacks: list[callback.Callback] = ()
 
+    #: Default retry policy. Do not retry by default.
+    retry_policy: retry.RetryPolicy | None = None
+
+    #: Reason why executions are never profiled. Profiled by default.
+    profiling_disabled: str | None = None
+
     def run(self, *args, **kwargs):
         """The body of the task executed by workers."""
         raise NotImplementedError("Tasks must define the `run` method.")
@@ -47,13 +73,6 @@ class Task:
     def __reduce__(self):
         return (unpickle_task, (self.name,), None)
 
-    def notify(self, method_name: str, **kwargs) -> None:
-        for cb in self.callbacks:
-            getattr(cb, method_name)(**kwargs)
-
-    def set_callbacks(self, callbacks: list[callback.Callback]) -> Task:
-        self.callbacks = callbacks
-
     @classmethod
     def from_callable(
         cls, fun: callable, name: str | None = None, **kwargs
@@ -66,6 +85,8 @@ class Task:
             "__doc__": fun.__doc__,
             "__module__": fun.__module__,
             "__annotations__": fun.__annotations__,
+            "retry_policy": getattr(fun, "retry_policy", None),
+            "profiling_disabled": getattr(fun, "profiling_disabled", None),
             **kwargs,
         }
 
@@ -77,6 +98,21 @@ class Task:
 class TasksFactory:
     """Tasks registry.
 
+    Tasks are created once per registered name and shared by every run,
+    so they must not hold per-run state. A cached task is reused while the
+    same function is registered under its name, i.e., registering another
+    function or unregistering the name invalidates it.
+
+    Other distributions provide tasks through entry points (see
+    :meth:`include_entry_points`). Each entry point is named after a task
+    and refers to the module defining it, or its registry:
+
+    .. code-block:: toml
+
+        [project.entry-points."mlflow_executor.tasks"]
+        "mypackage.tasks.train" = "mypackage.tasks"
+        "mypackage.tasks.evaluate" = "mypackage.tasks:registry"
+
     Example
     -------
     registry = TasksRegistry()
@@ -88,13 +124,91 @@ class TasksFactory:
 
     registry: registry.Registry = registry.Registry()
 
+    def __init__(self) -> None:
+        self._tasks: dict[str, tuple[callable, Task]] = {}
+        self._groups: list[str] = []
+        self._entry_points: dict[str, importlib.metadata.EntryPoint] = {}
+        self._lock = threading.RLock()
+
     def include_registry(self, registry: registry.Registry) -> None:
         self.registry.update(registry)
 
+    def include_entry_point(
+        self, entry_point: importlib.metadata.EntryPoint
+    ) -> None:
+        """Includes the tasks of a single entry point.
+
+        The entry point is loaded when its task is requested.
+        """
+        with self._lock:
+            self._entry_points.setdefault(entry_point.name, entry_point)
+
+    def include_entry_points(self, group: str = ENTRY_POINT_GROUP) -> None:
+        """Includes the tasks of the entry points in ``group``.
+
+        Entry points are indexed by task name when a task which is not
+        registered yet is requested, or when tasks are listed. Only the
+        module providing a requested task is imported.
+        """
+        with self._lock:
+            self._groups.append(group)
+
+    def index_entry_points(self) -> dict[str, importlib.metadata.EntryPoint]:
+        """Returns the entry points of the included groups, by task name.
+
+        Entry point metadata is read once per group, nothing is imported.
+        """
+        with self._lock:
+            while self._groups:
+                group = self._groups.pop(0)
+                for entry_point in importlib.metadata.entry_points(
+                    group=group
+                ):
+                    self._entry_points.setdefault(
+                        entry_point.name, entry_point
+                    )
+            return self._entry_points
+
+    def load_entry_point(self, name: str) -> None:
+        """Imports the entry point of task ``name`` and includes its tasks.
+
+        Does nothing if no entry point provides ``name``.
+        """
+        with self._lock:
+            entry_point = self.index_entry_points().get(name)
+            if entry_point is None:
+                return
+
+            provider = entry_point.load()
+            if not isinstance(provider, registry.Registry):
+                provider = provider.registry
+            self.include_registry(provider)
+
+            # Other names of the same registry are provided now too.
+            del self._entry_points[name]
+            for other in list(self._entry_points):
+                if other in self.registry:
+                    del self._entry_points[other]
+
+    def load_entry_points(self) -> None:
+        """Imports all the entry points.
+
+        Entry points failing to load are logged and skipped.
+        """
+        for name in list(self.index_entry_points()):
+            try:
+                self.load_entry_point(name)
+            except Exception:
+                logger.exception(
+                    "Could not load the tasks entry point %s.", name
+                )
+
     def list(self) -> list[str]:
-        return list(self.registry)
+        """Returns the task names, without importing entry points."""
+        return list({**self.registry, **self.index_entry_points()})
 
     def get_registry(self) -> registry.Registry:
+        self.load_entry_points()
         return self.registry
 
     def create(self, name: str) -> Task:
@@ -110,8 +224,17 @@ class TasksFactory:
         task : Task
             An instance of the task that is created.
         """
+        if name not in self.registry:
+            self.load_entry_point(name)
+
         fun = self.registry[name]
-        return Task.from_callable(fun, name)
+        cached = self._tasks.get(name)
+        if cached is not None and cached[0] is fun:
+            return cached[1]
+
+        task = Task.from_callable(fun, name)
+        self._tasks[name] = (fun, task)
+        return task
 
 
 #: Tasks factory
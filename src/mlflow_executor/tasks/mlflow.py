@@ -1,11 +1,134 @@
-from typing import Any, Literal, TypedDict
+import logging
+import os
+import subprocess
+import sys
+import threading
+import types
+from typing import IO, Any, Literal, TypedDict
 
+import mlflow
 from mlflow import projects
+from mlflow.entities import RunStatus
+from mlflow.exceptions import ExecutionException
+from mlflow.tracking import MlflowClient
+from mlflow.utils.mlflow_tags import MLFLOW_PROJECT_BACKEND, MLFLOW_RUN_NAME
+from packaging.specifiers import SpecifierSet
 
+from mlflow_executor import cancellation, profiling, streaming, timing
 from mlflow_executor.registry import Registry
 
+#: MLflow versions whose local backend internals are used by
+#: :func:`launch_run`. Keep in sync with requirements.txt.
+MLFLOW_REQUIREMENT = ">=2.9,<4"
+
+
+def _unsupported_mlflow() -> ImportError:
+    return ImportError(
+        f"run_mlflow requires mlflow{MLFLOW_REQUIREMENT}, but mlflow "
+        f"{mlflow.__version__} is installed."
+    )
+
+
+if not SpecifierSet(MLFLOW_REQUIREMENT).contains(
+    mlflow.__version__, prereleases=True
+):
+    raise _unsupported_mlflow()
+
+try:
+    from mlflow.projects import _resolve_experiment_id
+    from mlflow.projects.backend import local as local_backend
+    from mlflow.projects.submitted_run import LocalSubmittedRun
+    from mlflow.projects.utils import (
+        MLFLOW_LOCAL_BACKEND_RUN_ID_CONFIG,
+        PROJECT_BUILD_IMAGE,
+        PROJECT_DOCKER_ARGS,
+        PROJECT_DOCKER_AUTH,
+        PROJECT_ENV_MANAGER,
+        PROJECT_STORAGE_DIR,
+        PROJECT_SYNCHRONOUS,
+        fetch_and_validate_project,
+        get_or_create_run,
+        get_run_env_vars,
+        load_project,
+    )
+    from mlflow.utils.databricks_utils import get_databricks_env_vars
+except ImportError as exc:
+    raise _unsupported_mlflow() from exc
+
+if "_run_entry_point" not in local_backend.LocalBackend.run.__code__.co_names:
+    raise _unsupported_mlflow()
+
+logger = logging.getLogger(__name__)
+
 registry = Registry()
 
+#: Seconds between MLflow run status checks.
+POLL_INTERVAL = 1.0
+
+
+def _run_entry_point_grouped(
+    command: str, work_dir: str, experiment_id: str, run_id: str
+) -> projects.SubmittedRun:
+    """Launches the entry point command in its own process group.
+
+    Replaces the MLflow launcher, whose command processes share the group
+    of the worker, so cancelling a run leaves the entry point running once
+    an environment is activated before it. The output is piped if the task
+    is streamed.
+    """
+    env = {
+        **os.environ,
+        **get_run_env_vars(run_id, experiment_id),
+        **get_databricks_env_vars(tracking_uri=mlflow.get_tracking_uri()),
+    }
+    if sys.platform == "win32":
+        args = ["cmd", "/c", command]
+        group = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    else:
+        args = ["bash", "-c", command]
+        group = {"start_new_session": True}
+
+    if streaming.current_channel() is not None:
+        env["PYTHONUNBUFFERED"] = "1"
+        pipes = {
+            "text": True,
+            "bufsize": 1,
+            "stdout": subprocess.PIPE,
+            "stderr": subprocess.PIPE,
+        }
+    else:
+        pipes = {}
+
+    process = subprocess.Popen(
+        args, close_fds=True, cwd=work_dir, env=env, **group, **pipes
+    )
+    return LocalSubmittedRun(run_id, process)
+
+
+def _with_launcher(run: types.FunctionType) -> types.FunctionType:
+    """Returns a copy of ``run`` launching entry points with our launcher.
+
+    The MLflow local backend offers no launcher option. The copy looks up
+    ``_run_entry_point`` in its own globals, so the MLflow module, shared
+    with other callers of :func:`mlflow.projects.run`, is left untouched.
+    """
+    namespace = {
+        **run.__globals__,
+        "_run_entry_point": _run_entry_point_grouped,
+    }
+    copy = types.FunctionType(
+        run.__code__,
+        namespace,
+        run.__name__,
+        run.__defaults__,
+        run.__closure__,
+    )
+    copy.__kwdefaults__ = run.__kwdefaults__
+    return copy
+
+
+_local_backend_run = _with_launcher(local_backend.LocalBackend.run)
+
 
 def set_environmet(
     enviroment: dict[str, Any], upper_case: bool = False
@@ -44,10 +167,193 @@ class MLflowDictSummary(TypedDict):
     model_uri: str
 
 
+class RunFailed(ExecutionException):
+    """Raised when an MLflow run does not finish successfully.
+
+    Only raised by :func:`run_mlflow` with ``raise_on_failure=True``.
+
+    Parameters
+    ----------
+    run_id : str
+        Run id associated to the MLflow run.
+
+    exit_code : int
+        Exit code of the entry point process, see :func:`get_exit_code`.
+    """
+
+    def __init__(self, run_id: str, exit_code: int | None = None):
+        super().__init__(f"Run (ID '{run_id}') failed")
+        self.run_id = run_id
+        self.exit_code = exit_code
+
+    def __reduce__(self):
+        return type(self), (self.run_id, self.exit_code)
+
+
+def set_run_terminated(run_id: str, status: str) -> None:
+    """Marks the MLflow run as terminated, unless its code already did.
+
+    Failures to reach the tracking server are logged, so they do not mask
+    the outcome of the run.
+    """
+    client = MlflowClient()
+    try:
+        run = client.get_run(run_id)
+        if not RunStatus.is_terminated(RunStatus.from_string(run.info.status)):
+            client.set_terminated(run_id, status)
+    except Exception:
+        logger.exception("Could not set the status of run %s.", run_id)
+
+
+def cancel_run(submitted_run: projects.SubmittedRun) -> None:
+    """Cancels the MLflow run, unless it already terminated."""
+    if not RunStatus.is_terminated(
+        RunStatus.from_string(submitted_run.get_status())
+    ):
+        submitted_run.cancel()
+        set_run_terminated(submitted_run.run_id, "KILLED")
+
+
+def wait_for_run(
+    submitted_run: projects.SubmittedRun, poll_interval: float = POLL_INTERVAL
+) -> str:
+    """Waits for the MLflow run to finish and records its status.
+
+    The run is cancelled if the current task is cancelled, times out or is
+    interrupted.
+
+    Returns
+    -------
+    status : str
+        Final status of the run, e.g., "FINISHED" or "FAILED".
+    """
+    token = cancellation.current_token() or cancellation.CancelToken()
+
+    try:
+        while not RunStatus.is_terminated(
+            RunStatus.from_string(submitted_run.get_status())
+        ):
+            if token.wait(poll_interval):
+                token.raise_if_cancelled()
+    except BaseException:
+        cancel_run(submitted_run)
+        raise
+
+    status = submitted_run.get_status()
+    set_run_terminated(submitted_run.run_id, status)
+    return status
+
+
+def get_exit_code(submitted_run: projects.SubmittedRun) -> int | None:
+    """Returns the exit code of the entry point process of the run.
+
+    Entry points killed by a signal get the shell exit code ``128 +
+    signal`` (e.g., 137 for SIGKILL), whether or not the shell that runs
+    them replaced itself with the command.
+    """
+    command_proc = getattr(submitted_run, "command_proc", None)
+    exit_code = getattr(command_proc, "returncode", None)
+    if exit_code is not None and exit_code < 0:
+        return 128 - exit_code
+    return exit_code
+
+
+def _forward_lines(
+    pipe: IO[str], kind: str, channel: streaming.Channel
+) -> None:
+    with pipe:
+        for line in pipe:
+            channel.put(streaming.parse_line(kind, line))
+
+
+def stream_output(submitted_run: projects.SubmittedRun) -> list:
+    """Forwards the piped output of the run to the current stream channel.
+
+    Returns
+    -------
+    threads : list of threading.Thread
+        Forwarding threads, which end once the run process exits.
+    """
+    channel = streaming.current_channel()
+    command_proc = getattr(submitted_run, "command_proc", None)
+    if channel is None or command_proc is None:
+        return []
+
+    threads = []
+    for kind in ("stdout", "stderr"):
+        pipe = getattr(command_proc, kind)
+        if pipe is not None:
+            thread = threading.Thread(
+                target=_forward_lines, args=(pipe, kind, channel), daemon=True
+            )
+            thread.start()
+            threads.append(thread)
+    return threads
+
+
+def launch_run(
+    uri: str,
+    work_dir: str,
+    entry_point: str = "main",
+    version: str | None = None,
+    parameters: dict[str, Any] | None = None,
+    experiment_id: str | None = None,
+    storage_dir: str | None = None,
+    run_name: str | None = None,
+    env_manager: Literal["local", "virtualenv", "conda"] | None = None,
+) -> projects.SubmittedRun:
+    """Launches the entry point of a fetched project without waiting for it.
+
+    The run is created for ``uri`` and launched from ``work_dir`` by the
+    local MLflow backend in synchronous mode, which sets up the environment
+    and starts the entry point command itself rather than ``mlflow run``.
+    The submitted run therefore tracks the entry point process, whose exit
+    code and process group it exposes.
+
+    The public :func:`mlflow.projects.run` only exposes the ``mlflow run``
+    process, hence the internals guarded by :data:`MLFLOW_REQUIREMENT`.
+    """
+    active_run = get_or_create_run(
+        None, uri, experiment_id, work_dir, version, entry_point, parameters
+    )
+    run_id = active_run.info.run_id
+    client = MlflowClient()
+    client.set_tag(run_id, MLFLOW_PROJECT_BACKEND, "local")
+    if run_name is not None:
+        client.set_tag(run_id, MLFLOW_RUN_NAME, run_name)
+
+    backend_config = {
+        MLFLOW_LOCAL_BACKEND_RUN_ID_CONFIG: run_id,
+        PROJECT_ENV_MANAGER: env_manager,
+        PROJECT_SYNCHRONOUS: True,
+        PROJECT_DOCKER_ARGS: None,
+        PROJECT_STORAGE_DIR: storage_dir,
+        PROJECT_BUILD_IMAGE: False,
+        PROJECT_DOCKER_AUTH: None,
+    }
+    try:
+        return _local_backend_run(
+            local_backend.LocalBackend(),
+            work_dir,
+            entry_point,
+            parameters,
+            None,
+            backend_config,
+            mlflow.get_tracking_uri(),
+            experiment_id,
+        )
+    except BaseException:
+        set_run_terminated(run_id, "FAILED")
+        raise
+
+
 class MLflowRunSummary:
 
-    def __init__(self, submitted_run: projects.SubmittedRun) -> None:
+    def __init__(
+        self, submitted_run: projects.SubmittedRun, run_cmd: str | None = None
+    ) -> None:
         self.submitted_run = submitted_run
+        self._run_cmd = run_cmd
 
     def dict(self) -> MLflowDictSummary:
         """Returns dictionary containing all the summary properties."""
@@ -71,12 +377,14 @@ class MLflowRunSummary:
     @property
     def run_cmd(self) -> str:
         """Returns the command ran by MLFlow."""
+        if self._run_cmd is not None:
+            return self._run_cmd
         return self.submitted_run.command_proc.args[-1].split("&& ")[-1]
 
     @property
     def exit_code(self) -> int:
         """Returns exit code from MLFlow run."""
-        return self.submitted_run.command_proc.returncode
+        return get_exit_code(self.submitted_run)
 
     @property
     def status(self) -> str:
@@ -85,6 +393,10 @@ class MLflowRunSummary:
 
 
 @registry()
+@profiling.no_profiling(
+    "The entry point runs in a subprocess, cProfile would only see the "
+    "thread waiting for it."
+)
 def run_mlflow(
     uri: str | None = None,
     entry_point: str = "main",
@@ -96,22 +408,55 @@ def run_mlflow(
     run_name: str | None = None,
     env_manager: Literal["local", "virtualenv", "conda"] | None = None,
     environment: dict[str, Any] | None = None,
-) -> projects.SubmittedRun:
+    raise_on_failure: bool = False,
+) -> MLflowDictSummary:
+    """Runs an MLflow project and returns the summary of its run.
+
+    Failed runs are summarized like finished ones, with their status and
+    exit code, unless ``raise_on_failure`` is True, in which case they
+    raise :class:`RunFailed` (e.g., so a retry policy can retry them).
+    """
     if environment is not None:
         set_environmet(environment, upper_case=True)
 
-    submitted_run = projects.run(
-        uri=uri,
-        entry_point=entry_point,
-        version=version,
-        parameters=parameters,
-        experiment_name=experiment_name,
-        experiment_id=experiment_id,
-        storage_dir=storage_dir,
-        run_name=run_name,
-        env_manager=env_manager,
-    )
+    parameters = parameters or {}
+    experiment_id = _resolve_experiment_id(experiment_name, experiment_id)
 
-    submitted_run.wait()
+    with timing.phase("project_fetch"):
+        work_dir = fetch_and_validate_project(
+            uri, version, entry_point, parameters
+        )
+    with timing.phase("env_setup"):
+        submitted_run = launch_run(
+            uri,
+            work_dir,
+            entry_point=entry_point,
+            version=version,
+            parameters=parameters,
+            experiment_id=experiment_id,
+            storage_dir=storage_dir,
+            run_name=run_name,
+            env_manager=env_manager,
+        )
+
+    threads = []
+    try:
+        threads = stream_output(submitted_run)
+        with timing.phase("subprocess"):
+            status = wait_for_run(submitted_run)
+    except BaseException:
+        cancel_run(submitted_run)
+        raise
+    finally:
+        # Every line is streamed before the run finishes.
+        for thread in threads:
+            thread.join()
 
-    return MLflowRunSummary(submitted_run).dict()
+    if raise_on_failure and status != "FINISHED":
+        raise RunFailed(submitted_run.run_id, get_exit_code(submitted_run))
+
+    project = load_project(work_dir)
+    run_cmd = project.get_entry_point(entry_point).compute_command(
+        parameters, storage_dir
+    )
+    return MLflowRunSummary(submitted_run, run_cmd).dict()
@@ -0,0 +1,583 @@
+"""Offline benchmarks of the task execution overhead.
+
+Measures, per backend, the per-submission overhead, throughput at varying
+concurrency, ``result()`` latency and driver memory per outstanding
+promise, the cost of creating and unpickling tasks and the cold-start
+import time of the package entry points, using the
+:mod:`mlflow_executor.testing.tasks` registry (no MLflow server or network
+needed). Results are written as JSON so runs of two commits can be
+compared::
+
+    python -m mlflow_executor.testing.benchmark run -o base.json
+    git checkout <other>
+    python -m mlflow_executor.testing.benchmark run --compare base.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import gc
+import json
+import pickle
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+from mlflow_executor import backend, backends, execution, task
+from mlflow_executor.testing import tasks
+
+ADD = "mlflow_executor.testing.tasks.add"
+SLEEP = "mlflow_executor.testing.tasks.sleep"
+
+#: Names of the benchmarked backends.
+BACKENDS = ("local", "process", "ray")
+
+#: Metric name suffixes where higher values are better.
+HIGHER_IS_BETTER = ("_tps",)
+
+#: Cold-start import budget in milliseconds of the package entry points.
+IMPORT_BUDGETS_MS = {
+    "mlflow_executor.execution": 500.0,
+    "mlflow_executor.project": 500.0,
+}
+
+#: Cold-start budget in milliseconds of listing the tasks and creating a
+#: task provided through an entry point, import included.
+FACTORY_BUDGET_MS = 500.0
+
+#: Optional dependencies only imported when their feature is used.
+HEAVY_MODULES = (
+    "celery",
+    "docker",
+    "git",
+    "mlflow",
+    "numpy",
+    "pandas",
+    "ray",
+    "requests",
+    "sqlalchemy",
+)
+
+
+def include_registry() -> None:
+    """Includes the testing registry in the tasks factory.
+
+    Also used as Ray worker setup hook, since Ray workers do not inherit
+    the registries of the driver.
+    """
+    if ADD not in task.factory.list():
+        task.factory.include_registry(tasks.registry)
+
+
+def _init_ray(num_cpus: int) -> None:
+    import ray
+
+    if not ray.is_initialized():
+        ray.init(
+            num_cpus=num_cpus,
+            include_dashboard=False,
+            log_to_driver=False,
+            runtime_env={
+                "worker_process_setup_hook": (
+                    "mlflow_executor.testing.benchmark.include_registry"
+                )
+            },
+        )
+
+
+def make_backend(name: str, concurrency: int) -> backend.BackendExecutor:
+    """Returns the backend ``name`` running ``concurrency`` tasks at once.
+
+    Ray runs a local single node cluster (local mode is no longer supported
+    by Ray), with ``concurrency`` limited through the CPUs per task.
+    """
+    if name == "local":
+        return backends.LocalBackend(max_workers=concurrency)
+
+    if name == "process":
+        # Forked workers inherit the registries of this process.
+        return backends.ProcessPoolBackend(
+            max_workers=concurrency, mp_context="fork"
+        )
+
+    if name == "ray":
+        import ray
+
+        return backends.RayBackend(
+            num_cpus=ray.cluster_resources()["CPU"] / concurrency
+        )
+
+    raise ValueError(f"Unknown backend '{name}'. Choose from {BACKENDS}.")
+
+
+def _submit(executor, backend_, name: str, n: int, **kwargs) -> list:
+    return [
+        executor.execute(name, kwargs=kwargs, backend=backend_)
+        for _ in range(n)
+    ]
+
+
+def _wait(promises: list) -> None:
+    for promise in promises:
+        promise.result()
+
+
+def submission_overhead(backend_, n: int) -> dict:
+    """Mean microseconds spent in :meth:`TasksExecutor.execute` per task."""
+    executor = execution.TasksExecutor()
+    _wait(_submit(executor, backend_, ADD, n, x=1, y=2))  # Warm up.
+
+    start = time.perf_counter()
+    promises = _submit(executor, backend_, ADD, n, x=1, y=2)
+    elapsed = time.perf_counter() - start
+    _wait(promises)
+    return {"submit_overhead_us": elapsed / n * 1e6}
+
+
+def throughput(backend_, n: int, concurrency: int, seconds: float) -> dict:
+    """Tasks per second of ``n`` sleep tasks, from submission to results."""
+    executor = execution.TasksExecutor()
+    _wait(_submit(executor, backend_, SLEEP, concurrency))  # Warm up.
+
+    start = time.perf_counter()
+    _wait(_submit(executor, backend_, SLEEP, n, seconds=seconds))
+    elapsed = time.perf_counter() - start
+    return {f"throughput_c{concurrency}_tps": n / elapsed}
+
+
+def result_latency(backend_, n: int) -> dict:
+    """Milliseconds from submission to ``result()`` returning, one at once."""
+    executor = execution.TasksExecutor()
+    _wait(_submit(executor, backend_, ADD, 1, x=1, y=2))  # Warm up.
+
+    latencies = []
+    for _ in range(n):
+        start = time.perf_counter()
+        executor.execute(
+            ADD, kwargs={"x": 1, "y": 2}, backend=backend_
+        ).result()
+        latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    return {
+        "result_latency_p50_ms": statistics.median(latencies) * 1e3,
+        "result_latency_p95_ms": latencies[int(0.95 * (n - 1))] * 1e3,
+    }
+
+
+def promise_memory(backend_, n: int) -> dict:
+    """Driver bytes retained per promise held by the caller.
+
+    Only allocations of this process are traced, i.e., the promise, runner
+    and timings kept until the caller drops the promise.
+    """
+    executor = execution.TasksExecutor()
+    _wait(_submit(executor, backend_, ADD, n, x=1, y=2))  # Warm up.
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        promises = _submit(executor, backend_, ADD, n, x=1, y=2)
+        _wait(promises)
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    return {"promise_memory_bytes": (after - before) / n}
+
+
+def _mean_us(fun: Callable[[], object], n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        fun()
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def run_factory(n: int = 10000) -> dict[str, float]:
+    """Mean microseconds to create, unpickle and round trip tasks.
+
+    Unpickling is what workers do for every received runner (see
+    :meth:`Task.__reduce__`).
+    """
+    include_registry()
+    executor = execution.TasksExecutor()
+    pickled_task = pickle.dumps(task.factory.create(ADD))
+    runner = executor.create_task_runner(
+        task.factory.create(ADD), kwargs={"x": 1, "y": 2}
+    )
+
+    metrics = {
+        "create_us": _mean_us(lambda: task.factory.create(ADD), n),
+        "unpickle_us": _mean_us(lambda: pickle.loads(pickled_task), n),
+        "runner_pickle_us": _mean_us(
+            lambda: pickle.loads(pickle.dumps(runner)), n
+        ),
+    }
+    return {f"factory.{metric}": value for metric, value in metrics.items()}
+
+
+def import_time(module: str, repeat: int = 3) -> tuple[float, set[str]]:
+    """Measures the cold-start import of ``module`` with ``-X importtime``.
+
+    Returns
+    -------
+    milliseconds : float
+        Best cumulative import time over ``repeat`` fresh interpreters.
+
+    modules : set of str
+        Every module imported along with ``module``.
+    """
+    best, modules = float("inf"), set()
+    for _ in range(repeat):
+        stderr = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stderr
+
+        for line in stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _, cumulative, name = line.split("|")
+            if name.strip() == "imported package":
+                continue
+            modules.add(name.strip())
+            if name.strip() == module and cumulative.strip().isdigit():
+                best = min(best, int(cumulative) / 1e3)
+
+    return best, modules
+
+
+#: Lists the tasks and creates one through an entry point, then prints the
+#: elapsed milliseconds and the modules imported after each step.
+_FACTORY_LOOKUP = f"""
+import importlib.metadata, json, sys, time
+start = time.perf_counter()
+from mlflow_executor import task
+modules = {{}}
+task.factory.include_entry_point(
+    importlib.metadata.EntryPoint(
+        name={ADD!r},
+        value="mlflow_executor.testing.tasks:registry",
+        group=task.ENTRY_POINT_GROUP,
+    )
+)
+task.factory.list()
+modules["list"] = sorted(sys.modules)
+task.factory.create({ADD!r})
+modules["create"] = sorted(sys.modules)
+elapsed = (time.perf_counter() - start) * 1e3
+print(json.dumps({{"ms": elapsed, "modules": modules}}))
+"""
+
+
+def factory_lookup_time(
+    repeat: int = 3,
+) -> tuple[float, dict[str, set[str]]]:
+    """Measures a cold-start task listing and entry point lookup.
+
+    Returns
+    -------
+    milliseconds : float
+        Best time over ``repeat`` fresh interpreters, from importing
+        :mod:`mlflow_executor.task` to the created task.
+
+    modules : dict of str to set of str
+        Modules imported after :meth:`TasksFactory.list` (``"list"``) and
+        after :meth:`TasksFactory.create` (``"create"``).
+    """
+    best, modules = float("inf"), {}
+    for _ in range(repeat):
+        stdout = subprocess.run(
+            [sys.executable, "-c", _FACTORY_LOOKUP],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        output = json.loads(stdout.splitlines()[-1])
+        best = min(best, output["ms"])
+        for step, names in output["modules"].items():
+            modules.setdefault(step, set()).update(names)
+    return best, modules
+
+
+def run_imports(
+    budgets: dict[str, float] = IMPORT_BUDGETS_MS,
+) -> dict[str, float]:
+    """Cold-start import milliseconds of the modules in ``budgets``.
+
+    Also includes the cold-start milliseconds of a factory lookup.
+    """
+    metrics = {
+        f"import.{module}_ms": import_time(module)[0] for module in budgets
+    }
+    metrics["import.factory_lookup_ms"] = factory_lookup_time()[0]
+    return metrics
+
+
+def _heavy_roots(modules: set[str]) -> list[str]:
+    return sorted(
+        {name.split(".")[0] for name in modules} & set(HEAVY_MODULES)
+    )
+
+
+def check_imports(
+    budgets: dict[str, float] = IMPORT_BUDGETS_MS,
+    factory_budget: float = FACTORY_BUDGET_MS,
+) -> list[str]:
+    """Returns the violations of the cold-start budget.
+
+    Modules must import within their budget and without any of the
+    :data:`HEAVY_MODULES`. So must the tasks factory list the tasks and
+    create a task provided through an entry point.
+    """
+    violations = []
+    for module, budget in budgets.items():
+        milliseconds, modules = import_time(module)
+        if milliseconds > budget:
+            violations.append(
+                f"{module} imports in {milliseconds:.0f} ms "
+                f"(budget {budget:.0f} ms)."
+            )
+
+        roots = _heavy_roots(modules)
+        if roots:
+            violations.append(f"{module} imports {', '.join(roots)}.")
+
+    milliseconds, modules = factory_lookup_time()
+    if milliseconds > factory_budget:
+        violations.append(
+            f"Factory lookup takes {milliseconds:.0f} ms "
+            f"(budget {factory_budget:.0f} ms)."
+        )
+    for step, names in modules.items():
+        roots = _heavy_roots(names)
+        if roots:
+            violations.append(f"Factory {step}() imports {', '.join(roots)}.")
+    return violations
+
+
+def run_backend(
+    name: str,
+    n: int = 1000,
+    concurrency: tuple[int, ...] = (1, 2, 4, 8),
+    seconds: float = 0.005,
+) -> dict[str, float]:
+    """Runs all benchmarks on backend ``name``.
+
+    Parameters
+    ----------
+    name : str
+        One of :data:`BACKENDS`.
+
+    n : int, default=1000
+        Tasks per benchmark. Throughput and latency use a fifth of them.
+
+    concurrency : tuple of int, default=(1, 2, 4, 8)
+        Concurrency levels of the throughput benchmark.
+
+    seconds : float, default=0.005
+        Duration of the sleep tasks of the throughput benchmark.
+    """
+    include_registry()
+    if name == "ray":
+        _init_ray(max(concurrency))
+
+    results = {}
+    benchmarks: list[tuple[int, Callable[..., dict]]] = [
+        (max(concurrency), lambda b: submission_overhead(b, n)),
+        (1, lambda b: result_latency(b, max(n // 5, 1))),
+        (max(concurrency), lambda b: promise_memory(b, n)),
+    ]
+    for c in concurrency:
+        benchmarks.append(
+            (c, lambda b, c=c: throughput(b, max(n // 5, c), c, seconds))
+        )
+
+    for c, benchmark in benchmarks:
+        backend_ = make_backend(name, c)
+        try:
+            results.update(benchmark(backend_))
+        finally:
+            backend_.shutdown()
+
+    return {f"{name}.{metric}": value for metric, value in results.items()}
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(
+    backend_names: tuple[str, ...] = BACKENDS,
+    n: int = 1000,
+    concurrency: tuple[int, ...] = (1, 2, 4, 8),
+    seconds: float = 0.005,
+) -> dict:
+    """Runs the import, task factory and given backends benchmarks.
+
+    Returns
+    -------
+    report : dict
+        "meta" (commit, python, platform, parameters) and "metrics", a
+        flat mapping of "<backend>.<metric>" to value.
+    """
+    metrics = run_imports()
+    metrics.update(run_factory(n * 10))
+    for name in backend_names:
+        metrics.update(run_backend(name, n, concurrency, seconds))
+
+    meta = {
+        "commit": _git_commit(),
+        "created_at": datetime.datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "n": n,
+        "concurrency": list(concurrency),
+        "seconds": seconds,
+    }
+    return {"meta": meta, "metrics": metrics}
+
+
+def compare(
+    baseline: dict, current: dict, threshold: float = 0.2
+) -> list[dict]:
+    """Compares the metrics of two reports.
+
+    Parameters
+    ----------
+    baseline, current : dict
+        Reports returned by :func:`run`.
+
+    threshold : float, default=0.2
+        Relative change beyond which a worse metric is a regression.
+
+    Returns
+    -------
+    rows : list of dict
+        One row per metric in both reports with "metric", "baseline",
+        "current", "change" (relative) and "regression".
+    """
+    rows = []
+    for metric, old in baseline["metrics"].items():
+        new = current["metrics"].get(metric)
+        if new is None:
+            continue
+
+        change = (new - old) / old if old else 0.0
+        worse = -change if metric.endswith(HIGHER_IS_BETTER) else change
+        rows.append(
+            {
+                "metric": metric,
+                "baseline": old,
+                "current": new,
+                "change": change,
+                "regression": worse > threshold,
+            }
+        )
+    return rows
+
+
+def format_comparison(rows: list[dict]) -> str:
+    """Returns the comparison rows as a text table."""
+    width = max([len(row["metric"]) for row in rows] + [len("metric")])
+    lines = [f"{'metric':<{width}} {'baseline':>12} {'current':>12} change"]
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        lines.append(
+            f"{row['metric']:<{width}} {row['baseline']:>12.3f} "
+            f"{row['current']:>12.3f} {row['change']:+7.1%}{flag}"
+        )
+    return "\n".join(lines)
+
+
+def _load(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def _print_comparison(baseline: dict, current: dict, threshold) -> int:
+    rows = compare(baseline, current, threshold)
+    print(format_comparison(rows))
+    return int(any(row["regression"] for row in rows))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m mlflow_executor.testing.benchmark",
+        description=__doc__.splitlines()[0],
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks.")
+    run_parser.add_argument(
+        "-b", "--backend", action="append", choices=BACKENDS, dest="backends"
+    )
+    run_parser.add_argument("-n", type=int, default=1000)
+    run_parser.add_argument(
+        "-c", "--concurrency", type=int, nargs="+", default=[1, 2, 4, 8]
+    )
+    run_parser.add_argument("--seconds", type=float, default=0.005)
+    run_parser.add_argument("-o", "--output", help="JSON report path.")
+    run_parser.add_argument(
+        "--compare", metavar="BASELINE", help="Compare with a JSON report."
+    )
+    run_parser.add_argument("--threshold", type=float, default=0.2)
+
+    compare_parser = commands.add_parser(
+        "compare", help="Compare two JSON reports."
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.2)
+
+    commands.add_parser("imports", help="Check the cold-start import budget.")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "imports":
+        violations = check_imports()
+        print("\n".join(violations or ["Import budget met."]))
+        return int(bool(violations))
+
+    if args.command == "compare":
+        return _print_comparison(
+            _load(args.baseline), _load(args.current), args.threshold
+        )
+
+    report = run(
+        tuple(args.backends or BACKENDS),
+        args.n,
+        tuple(args.concurrency),
+        args.seconds,
+    )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        return _print_comparison(_load(args.compare), report, args.threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
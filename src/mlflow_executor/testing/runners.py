@@ -1,3 +1,4 @@
+import os
 import time
 import urllib
 
@@ -15,3 +16,50 @@ class URLLoader:
         time.sleep(self.sleep)
         with urllib.request.urlopen(url=self.url) as conn:
             return conn.read()
+
+
+class Sleeper:
+    """Sleeps for the given number of seconds and returns them."""
+
+    def __init__(self, seconds: float = 0.1) -> None:
+        self.seconds = seconds
+
+    def run(self):
+        time.sleep(self.seconds)
+        return self.seconds
+
+
+class Pid:
+    """Returns the id of the process running it."""
+
+    def run(self):
+        return os.getpid()
+
+
+class Summer:
+    """Returns the sum of its arguments. Lists are summed first."""
+
+    def __init__(self, args: tuple = (), kwargs: dict | None = None) -> None:
+        self.args = args
+        self.kwargs = kwargs or {}
+
+    def run(self):
+        values = (*self.args, *self.kwargs.values())
+        return sum(sum(v) if isinstance(v, list) else v for v in values)
+
+
+class Reporter:
+    """Reports ``steps`` progress events through ``channel`` and closes it."""
+
+    def __init__(self, channel, steps: int = 3) -> None:
+        self.channel = channel
+        self.steps = steps
+
+    def run(self):
+        from mlflow_executor import streaming
+
+        with streaming.use_channel(self.channel):
+            for step in range(self.steps):
+                streaming.report_progress(step=step)
+        self.channel.close()
+        return self.steps
@@ -1,3 +1,6 @@
+import time
+
+from mlflow_executor import cancellation, streaming
 from mlflow_executor.registry import Registry
 
 registry = Registry()
@@ -6,3 +9,34 @@ registry = Registry()
 @registry()
 def add(x, y):
     return x + y
+
+
+@registry()
+def sleep(seconds: float = 0.0):
+    """Sleeps for ``seconds`` unless the task is cancelled or times out."""
+    token = cancellation.current_token()
+    if token is None:
+        time.sleep(seconds)
+    elif token.wait(seconds):
+        token.raise_if_cancelled()
+    return seconds
+
+
+@registry()
+def progress(steps: int = 3):
+    """Reports ``steps`` progress events and returns the number of steps."""
+    for step in range(steps):
+        streaming.report_progress(step=step)
+    return steps
+
+
+_flaky_attempts: dict[str, int] = {}
+
+
+@registry()
+def flaky(key: str, failures: int = 1):
+    """Fails ``failures`` times for the given key, then returns the attempts."""
+    attempts = _flaky_attempts[key] = _flaky_attempts.get(key, 0) + 1
+    if attempts <= failures:
+        raise RuntimeError(f"Attempt {attempts} failed.")
+    return attempts
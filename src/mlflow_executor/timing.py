@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import time
+from typing import Iterator
+
+_current_timings: contextvars.ContextVar[Timings | None] = (
+    contextvars.ContextVar("timings", default=None)
+)
+
+
+def current_timings() -> Timings | None:
+    """Returns the timings of the task running in this context."""
+    return _current_timings.get()
+
+
+@contextlib.contextmanager
+def use_timings(timings: Timings) -> Iterator[Timings]:
+    """Makes ``timings`` the current timings inside the context."""
+    reset_timings = _current_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _current_timings.reset(reset_timings)
+
+
+@contextlib.contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Times the context as phase ``name`` of the current task, if any."""
+    timings = current_timings()
+    if timings is None:
+        yield
+        return
+
+    with timings.phase(name):
+        yield
+
+
+class Timings:
+    """Phase timings of a single task execution.
+
+    Events are :func:`time.monotonic` timestamps of the process recording
+    them. Phases are durations in seconds; a phase timed more than once
+    (e.g., "callbacks") accumulates.
+
+    Phases recorded by :class:`TaskRunner` are "queue" (submit to dequeue,
+    measured with the wall clock as both may happen in different processes),
+    "task" and "callbacks". MLflow runs add "project_fetch", "env_setup" and
+    "subprocess".
+
+    Parameters
+    ----------
+    task_name : str, default=None
+        Name of the task.
+
+    task_id : str, default=None
+        Task identifier.
+    """
+
+    def __init__(
+        self, task_name: str | None = None, task_id: str | None = None
+    ) -> None:
+        self.task_name = task_name
+        self.task_id = task_id
+        self.status: str | None = None
+        self.submitted_at: float | None = None
+        self.events: dict[str, float] = {}
+        self.phases: dict[str, float] = {}
+
+    def __repr__(self) -> str:
+        phases = ", ".join(f"{k}={v:.3f}s" for k, v in self.phases.items())
+        return f"<{type(self).__name__}: {self.task_name} ({phases})>"
+
+    def mark(self, event: str) -> None:
+        """Records the current time as ``event``."""
+        self.events[event] = time.monotonic()
+        if event == "submit":
+            self.submitted_at = time.time()
+
+    def add(self, name: str, seconds: float) -> None:
+        """Adds ``seconds`` to phase ``name``."""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Times the context as phase ``name``."""
+        start = time.monotonic()
+        self.events.setdefault(f"{name}_start", start)
+        try:
+            yield
+        finally:
+            end = time.monotonic()
+            self.events[f"{name}_end"] = end
+            self.add(name, end - start)
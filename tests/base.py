@@ -0,0 +1,53 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from mlflow_executor import backends, execution, task
+from mlflow_executor.testing import tasks
+
+ADD = "mlflow_executor.testing.tasks.add"
+SLEEP = "mlflow_executor.testing.tasks.sleep"
+FLAKY = "mlflow_executor.testing.tasks.flaky"
+PROGRESS = "mlflow_executor.testing.tasks.progress"
+
+#: MLproject of a project running the Python code it is given.
+MLPROJECT = """
+name: python
+entry_points:
+  main:
+    parameters:
+      code: {type: string, default: "pass"}
+    command: "python -c {code}"
+"""
+
+
+def make_project(test: unittest.TestCase) -> str:
+    """Returns the directory of a :data:`MLPROJECT`, removed after ``test``."""
+    work_dir = tempfile.mkdtemp()
+    test.addCleanup(shutil.rmtree, work_dir, ignore_errors=True)
+    with open(os.path.join(work_dir, "MLproject"), "w") as f:
+        f.write(MLPROJECT)
+    return work_dir
+
+
+class ExecutorTestCase(unittest.TestCase):
+    """Runs the testing tasks on a local backend shut down after each test.
+
+    Mix it into :class:`unittest.IsolatedAsyncioTestCase` subclasses by
+    listing it first.
+    """
+
+    #: Maximum number of threads of :attr:`backend`.
+    max_workers: int | None = None
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        task.factory.include_registry(tasks.registry)
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.executor = execution.TasksExecutor()
+        self.backend = backends.LocalBackend(max_workers=self.max_workers)
+        self.addCleanup(self.backend.shutdown)
@@ -1,7 +1,37 @@
+import os
+import pickle
+import tempfile
+import threading
+import time
 import unittest
+from unittest import mock
 
-from mlflow_executor import backend, backends
-from mlflow_executor.testing.runners import URLLoader
+import ray
+from celery import Celery
+from celery.contrib.testing.worker import start_worker
+
+from mlflow_executor import (
+    backend,
+    backends,
+    callback,
+    exceptions,
+    execution,
+    streaming,
+    task,
+)
+from mlflow_executor.backends.celery import CeleryPromise, celery_app
+from mlflow_executor.backends.database import DatabasePromise, DatabaseWorker
+from mlflow_executor.db.engine import dispose_engine
+from mlflow_executor.testing import tasks
+from mlflow_executor.testing.runners import (
+    Pid,
+    Reporter,
+    Sleeper,
+    Summer,
+    URLLoader,
+)
+
+ADD = "mlflow_executor.testing.tasks.add"
 
 
 class BackendTest:
@@ -20,3 +50,402 @@ class TestLocalBackend(BackendTest, unittest.TestCase):
 
 class TestrRayBackend(BackendTest, unittest.TestCase):
     _backend = backends.RayBackend()
+
+    def test_options(self):
+        backend = backends.RayBackend(num_cpus=2, max_retries=0)
+        runner = Summer()
+        runner.backend_options = {"num_cpus": 1, "memory": 10**6}
+
+        options = backend.get_options(runner)
+        assert options == {"num_cpus": 1, "max_retries": 0, "memory": 10**6}
+        assert backend.run(runner).result(timeout=30) == 0
+
+    def test_placement_group(self):
+        pg = ray.util.placement_group([{"CPU": 1}])
+        self.addCleanup(ray.util.remove_placement_group, pg)
+        backend = backends.RayBackend(num_cpus=1, placement_group=pg)
+
+        options = backend.get_options(Summer())
+        assert "placement_group" not in options
+        assert options["scheduling_strategy"].placement_group is pg
+        assert backend.run(Summer(args=(1, 2))).result(timeout=30) == 3
+
+    def test_run_many(self):
+        promises = self._backend.run_many(
+            [Summer(args=(i, 1)) for i in range(5)]
+        )
+        assert [p.result(timeout=30) for p in promises] == [1, 2, 3, 4, 5]
+
+    def test_object_refs(self):
+        data = ray.put(list(range(10)))
+        runner = Summer(args=(data,), kwargs={"offset": 1})
+
+        promises = [self._backend.run(runner) for _ in range(3)]
+        assert [p.result(timeout=30) for p in promises] == [46] * 3
+        assert runner.args == (data,)
+
+    def test_channel(self):
+        # Fewer slots than events, so the worker waits for the consumer.
+        channel = self._backend.open_channel(max_size=2)
+        promise = self._backend.run(Reporter(channel, steps=5))
+
+        events = list(streaming.OutputStream(channel, timeout=30))
+        assert [event.data for event in events] == [
+            {"step": step} for step in range(5)
+        ]
+        assert promise.result(timeout=30) == 5
+
+
+class TestLocalBackendAdmission(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.backend = backends.LocalBackend(
+            max_workers=1, max_queue_size=1, on_full="reject"
+        )
+        self.addCleanup(self.backend.shutdown)
+
+    def test_pool_is_reused(self):
+        self.backend.run(Sleeper(0)).result()
+        pool = self.backend._executor
+        self.backend.run(Sleeper(0)).result()
+        assert self.backend._executor is pool
+
+    def test_reject_when_full(self):
+        running = self.backend.run(Sleeper(0.2))
+        queued = self.backend.run(Sleeper(0))
+
+        with self.assertRaises(exceptions.BackendQueueFull):
+            self.backend.run(Sleeper(0))
+
+        running.result()
+        queued.result()
+        assert self.backend.queue_depth == 0
+        assert self.backend.active_workers == 0
+
+    def test_shutdown_waits(self):
+        promise = self.backend.run(Sleeper(0.1))
+        self.backend.shutdown(wait=True)
+        assert promise.future.done()
+        assert self.backend._executor is None
+
+    def test_shutdown_while_submitting(self):
+        # Shut down between starting the pool and submitting to it.
+        acquire = self.backend._acquire_slot
+
+        def acquire_and_shutdown(slots):
+            acquire(slots)
+            self.backend.shutdown()
+
+        with mock.patch.object(
+            self.backend, "_acquire_slot", side_effect=acquire_and_shutdown
+        ):
+            with self.assertRaises(RuntimeError):
+                self.backend.run(Sleeper(0))
+        assert self.backend.queue_depth == 0
+
+
+class TestDefaultBackend(unittest.TestCase):
+
+    def test_shared(self):
+        task.factory.include_registry(tasks.registry)
+        default = backends.get_default_backend()
+        assert backends.get_default_backend() is default
+
+        promise = execution.TasksExecutor().execute(ADD, (1, 2))
+        assert promise.result(timeout=5) == 3
+        assert default._executor is not None
+
+        backends.shutdown_default_backend()
+        assert default._executor is None
+        assert backends.get_default_backend() is not default
+
+
+class TestProcessPoolBackend(BackendTest, unittest.TestCase):
+    _backend = backends.ProcessPoolBackend(max_workers=2)
+
+    def test_worker_recycling(self):
+        backend = backends.ProcessPoolBackend(
+            max_workers=1, max_tasks_per_child=1, warm_start=True
+        )
+        self.addCleanup(backend.shutdown)
+
+        # Run one at a time, so each task gets the worker of the previous
+        # one unless it was replaced.
+        pids = [backend.run(Pid()).result() for _ in range(3)]
+        assert len(set(pids)) == 3
+        assert os.getpid() not in pids
+
+    def test_registered_task(self):
+        task.factory.include_registry(tasks.registry)
+        backend = backends.ProcessPoolBackend(max_workers=1, mp_context="fork")
+        self.addCleanup(backend.shutdown)
+
+        add = task.factory.create(ADD)
+        payload = pickle.dumps(add)
+        assert ADD.encode() in payload and b"unpickle_task" in payload
+        assert pickle.loads(payload) is add
+
+        runner = execution.TasksExecutor().create_task_runner(add, (1, 2))
+        assert backend.run(runner).result(timeout=30) == 3
+
+
+class Recorder:
+    """Runner appending its name to a shared list when it runs."""
+
+    def __init__(self, name, log, priority=0, resources=(), seconds=0.05):
+        self.name = name
+        self.log = log
+        self.priority = priority
+        self.resources = resources
+        self.seconds = seconds
+
+    def run(self):
+        self.log.append(self.name)
+        time.sleep(self.seconds)
+        return self.name
+
+
+class TestSchedulingBackend(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.local = backends.LocalBackend(max_workers=4)
+        self.addCleanup(self.local.shutdown)
+
+    def test_priority(self):
+        backend = backends.SchedulingBackend(self.local, max_running=1)
+        self.addCleanup(backend.shutdown)
+
+        log = []
+        promises = [backend.run(Recorder("first", log, seconds=0.2))]
+        while not log:
+            time.sleep(0.01)
+
+        promises += [
+            backend.run(Recorder("low", log, priority=0)),
+            backend.run(Recorder("high", log, priority=10)),
+        ]
+        assert [p.result() for p in promises] == ["first", "low", "high"]
+        assert log == ["first", "high", "low"]
+
+    def test_limits(self):
+        backend = backends.SchedulingBackend(
+            self.local, limits={"gpu": 1, "experiment:*": 2}
+        )
+        self.addCleanup(backend.shutdown)
+
+        log = []
+        gpu = [
+            backend.run(Recorder(i, log, resources=["gpu"], seconds=0.3))
+            for i in "ab"
+        ]
+        exp = [
+            backend.run(
+                Recorder(i, log, resources=["experiment:x"], seconds=0.3)
+            )
+            for i in "cde"
+        ]
+        time.sleep(0.1)
+
+        assert backend.usage == {"gpu": 1, "experiment:x": 2}
+        assert backend.queue_depth == 2
+
+        for promise in gpu + exp:
+            promise.result()
+        backend.shutdown()
+        assert backend.running == 0
+
+    def test_shutdown_cancels_queued(self):
+        backend = backends.SchedulingBackend(self.local, max_running=1)
+        log = []
+        running = backend.run(Recorder("running", log, seconds=0.2))
+        while not log:
+            time.sleep(0.01)
+        queued = backend.run(Recorder("queued", log))
+
+        backend.shutdown(shutdown_backend=True)
+        assert running.result(timeout=1) == "running"
+        with self.assertRaises(exceptions.TaskCancelled):
+            queued.result(timeout=1)
+        assert log == ["running"]
+        assert self.local._executor is None
+
+    def test_submit_outside_lock(self):
+        release = threading.Event()
+        run_many = self.local.run_many
+
+        def blocking_run_many(runners):
+            release.wait(5)
+            return run_many(runners)
+
+        backend = backends.SchedulingBackend(self.local)
+        self.addCleanup(backend.shutdown)
+        with mock.patch.object(self.local, "run_many", blocking_run_many):
+            first = backend.run(Sleeper(0))
+            time.sleep(0.1)
+
+            # The dispatcher is blocked submitting the first runner.
+            start = time.monotonic()
+            second = backend.run(Sleeper(0))
+            assert time.monotonic() - start < 1
+            assert backend.queue_depth == 1
+
+            release.set()
+            assert first.result(timeout=5) == 0
+            assert second.result(timeout=5) == 0
+
+
+class TestDatabaseBackend(unittest.TestCase):
+
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        url = f"sqlite:///{tmpdir.name}/queue.db"
+        patcher = mock.patch.dict(os.environ, {"DB_URL": url})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(dispose_engine)
+
+        self.backend = backends.DatabaseBackend(
+            visibility_timeout=0.2, max_attempts=2, poll_interval=0.05
+        )
+        self.worker = DatabaseWorker(poll_interval=0.05)
+
+    def test_run(self):
+        promises = self.backend.run_many([Sleeper(0), Sleeper(0.01)])
+        assert not promises[0].done()
+
+        self.worker.run(burst=True)
+        assert [p.result(timeout=1) for p in promises] == [0, 0.01]
+
+        # Jobs are durable: any process can read the outcome back.
+        assert DatabasePromise(promises[0].job_id).result() == 0
+
+    def test_requeue_dead_worker(self):
+        promise = self.backend.run(Sleeper(0))
+        dead = DatabaseWorker()
+        assert dead.claim() is not None
+        assert self.worker.claim() is None
+
+        time.sleep(0.3)
+        job = self.worker.claim()
+        assert job.attempts == 2
+        self.worker.process(job)
+        assert promise.result(timeout=1) == 0
+
+    def test_abandoned(self):
+        promise = self.backend.run(Sleeper(0))
+        for _ in range(2):
+            DatabaseWorker().claim()
+            time.sleep(0.3)
+
+        self.worker.run(burst=True)
+        with self.assertRaises(exceptions.JobAbandoned):
+            promise.result(timeout=1)
+
+    def test_cancel_queued(self):
+        promise = self.backend.run(Sleeper(0))
+        assert promise.cancel()
+
+        self.worker.run(burst=True)
+        with self.assertRaises(exceptions.TaskCancelled):
+            promise.result(timeout=1)
+
+    def test_unpicklable_runner(self):
+        # Unpickling a task which is not registered on the worker fails.
+        unregistered = task.Task.from_callable(
+            lambda: 0, name="tests.unregistered"
+        )
+        promise = self.backend.run(unregistered)
+        self.worker.run(burst=True)
+
+        with self.assertRaises(KeyError):
+            promise.result(timeout=1)
+        assert not promise.cancel()
+
+
+class SuccessLog(callback.Callback):
+    """Records the ids of succeeded tasks, wherever they run."""
+
+    blocking = True
+    task_ids: list[str] = []
+
+    def on_success(self, retval, task_id):
+        self.task_ids.append(task_id)
+
+
+class TestCeleryBackend(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        task.factory.include_registry(tasks.registry)
+        celery_app.conf.update(
+            broker_url="memory://",
+            result_backend="cache+memory://",
+        )
+        cls.worker = start_worker(
+            celery_app,
+            pool="solo",
+            perform_ping_check=False,
+            queues=["mlflow-executor", "math"],
+        )
+        cls.worker.__enter__()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.worker.__exit__(None, None, None)
+
+    def setUp(self) -> None:
+        self.backend = backends.CeleryBackend(
+            routes={"*.add": "math"}, compression="gzip"
+        )
+
+    def test_registered_task(self):
+        promise = execution.TasksExecutor().execute(
+            "mlflow_executor.testing.tasks.add",
+            kwargs={"x": 1, "y": 2},
+            backend=self.backend,
+        )
+        assert promise.result(timeout=10) == 3
+
+    def test_callbacks(self):
+        promise = execution.TasksExecutor().execute(
+            ADD,
+            kwargs={"x": 1, "y": 2},
+            callbacks=[SuccessLog()],
+            backend=backends.CeleryBackend(serializer="pickle"),
+            priority=5,
+        )
+        assert promise.result(timeout=10) == 3
+        assert promise.task_id in SuccessLog.task_ids
+
+        with self.assertRaises(ValueError):
+            execution.TasksExecutor().execute(
+                ADD,
+                kwargs={"x": 1, "y": 2},
+                callbacks=[SuccessLog()],
+                backend=self.backend,
+            )
+
+    def test_routes(self):
+        assert self.backend.get_queue("my.tasks.add") == "math"
+        assert self.backend.get_queue("my.tasks.sub") == "mlflow-executor"
+
+    def test_run_many(self):
+        promises = execution.TasksExecutor().map(
+            ADD, [{"x": i, "y": 1} for i in range(5)], backend=self.backend
+        )
+        assert [p.result(timeout=10) for p in promises] == [1, 2, 3, 4, 5]
+
+    def test_pickled_runner(self):
+        promises = [self.backend.run(Sleeper(0.01)) for _ in range(3)]
+        done, not_done = CeleryPromise.wait(promises, timeout=10)
+        assert len(done) == 3 and not not_done
+        assert promises[0].result() == 0.01
+
+    def test_pickle_not_accepted(self):
+        app = Celery(set_as_current=False)
+        app.conf.accept_content = ["json"]
+        backend_ = backends.CeleryBackend(app=app)
+
+        with self.assertRaises(ValueError):
+            backend_.run(Sleeper(0.01))
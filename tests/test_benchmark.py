@@ -0,0 +1,51 @@
+import json
+import os
+import tempfile
+import unittest
+
+from mlflow_executor.testing import benchmark
+
+
+class BenchmarkTest(unittest.TestCase):
+
+    def test_run_local(self):
+        metrics = benchmark.run_backend("local", n=10, concurrency=(1, 2))
+
+        assert set(metrics) == {
+            "local.submit_overhead_us",
+            "local.result_latency_p50_ms",
+            "local.result_latency_p95_ms",
+            "local.promise_memory_bytes",
+            "local.throughput_c1_tps",
+            "local.throughput_c2_tps",
+        }
+        assert all(value > 0 for value in metrics.values())
+
+    def test_compare(self):
+        baseline = {
+            "metrics": {
+                "local.submit_overhead_us": 100.0,
+                "local.throughput_c1_tps": 100.0,
+                "local.promise_memory_bytes": 1000.0,
+            }
+        }
+        current = {
+            "metrics": {
+                "local.submit_overhead_us": 150.0,
+                "local.throughput_c1_tps": 150.0,
+                "local.promise_memory_bytes": 1100.0,
+            }
+        }
+
+        rows = benchmark.compare(baseline, current, threshold=0.2)
+        regressions = {row["metric"] for row in rows if row["regression"]}
+        assert regressions == {"local.submit_overhead_us"}
+
+    def test_compare_command(self):
+        report = {"metrics": {"local.throughput_c1_tps": 100.0}}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "report.json")
+            with open(path, "w") as f:
+                json.dump(report, f)
+
+            assert benchmark.main(["compare", path, path]) == 0
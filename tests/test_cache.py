@@ -0,0 +1,79 @@
+import time
+import unittest
+
+from mlflow_executor import backends, cache, caches, execution
+from tests.base import ADD, ExecutorTestCase
+
+
+class LRUStoreTest(unittest.TestCase):
+
+    def test_eviction(self):
+        store = caches.LRUStore(maxsize=2)
+        store.set("a", 1)
+        store.set("b", 2)
+        store.get("a")
+        store.set("c", 3)
+
+        assert store.get("a") == 1
+        assert store.get("b") is None
+
+    def test_expiration(self):
+        store = caches.LRUStore()
+        store.set("a", 1, expires_at=time.time() - 1)
+        assert store.get("a") is None
+
+
+class ResultCacheTest(ExecutorTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.cache = cache.ResultCache(caches.LRUStore())
+
+    def execute(self, **kwargs) -> execution.TaskPromise:
+        return self.executor.execute(
+            ADD, kwargs=kwargs, backend=self.backend, cache=self.cache
+        )
+
+    def test_key_is_order_independent(self):
+        assert cache.make_key(ADD, kwargs={"x": 1, "y": 2}) == cache.make_key(
+            ADD, kwargs={"y": 2, "x": 1}
+        )
+
+    def test_key_rejects_unserializable(self):
+        with self.assertRaises(TypeError):
+            cache.make_key(ADD, kwargs={"x": object(), "y": 2})
+
+        with self.assertRaises(TypeError):
+            self.execute(x=object(), y=2)
+
+    def test_hit(self):
+        assert self.execute(x=1, y=2).result() == 3
+
+        promise = self.execute(x=1, y=2)
+        assert isinstance(promise.backend_promise, cache.CachedPromise)
+        assert promise.result() == 3
+
+    def test_invalidate(self):
+        self.execute(x=1, y=2).result()
+        self.cache.invalidate(ADD, kwargs={"x": 1, "y": 2})
+
+        promise = self.execute(x=1, y=2)
+        assert not isinstance(promise.backend_promise, cache.CachedPromise)
+
+    def test_cached_none(self):
+        self.cache.set(cache.make_key(ADD, kwargs={"x": 1, "y": 2}), None)
+
+        promise = self.execute(x=1, y=2)
+        assert isinstance(promise.backend_promise, cache.CachedPromise)
+        assert promise.result() is None
+
+    def test_remote_worker(self):
+        backend = backends.ProcessPoolBackend(max_workers=1)
+        self.addCleanup(backend.shutdown)
+        promise = self.executor.execute(
+            ADD, kwargs={"x": 1, "y": 2}, backend=backend, cache=self.cache
+        )
+        assert promise.result() == 3
+
+        key = cache.make_key(ADD, kwargs={"x": 1, "y": 2})
+        assert self.cache.get(key) == 3
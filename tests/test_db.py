@@ -0,0 +1,212 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import sqlalchemy
+
+from mlflow_executor import backends, caches, events, execution, task
+from mlflow_executor.callbacks.db import (
+    DatabaseCallback,
+    StatusWriter,
+    TaskStatus,
+    get_status_writer,
+)
+from mlflow_executor.db.base import Base, session_scope
+from mlflow_executor.db.engine import dispose_engine, get_engine
+from mlflow_executor.db.models import TaskExecution
+from mlflow_executor.testing import tasks
+
+ADD = "mlflow_executor.testing.tasks.add"
+
+
+class EngineTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        url = f"sqlite:///{tmpdir.name}/db.db"
+        patcher = mock.patch.dict(
+            os.environ, {"DB_URL": url, "DB_POOL_SIZE": "2"}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(dispose_engine)
+
+        Base.metadata.create_all(get_engine())
+
+    def test_shared(self):
+        engine = get_engine()
+        assert get_engine() is engine
+        assert engine.pool.size() == 2
+
+        dispose_engine()
+        assert get_engine() is not engine
+
+    def test_session_scope(self):
+        with session_scope() as session:
+            session.add(TaskExecution(task_id="a"))
+
+        with self.assertRaises(ValueError):
+            with session_scope() as session:
+                session.add(TaskExecution(task_id="b"))
+                raise ValueError
+
+        with session_scope() as session:
+            ids = [e.task_id for e in session.query(TaskExecution)]
+        assert ids == ["a"]
+        assert get_engine().pool.checkedout() == 0
+
+    def test_fork(self):
+        engine = get_engine()
+        with engine.connect():
+            pass
+        pool = engine.pool
+
+        pid = os.fork()
+        if pid == 0:
+            # The child gets a new pool and keeps the parent connections.
+            os._exit(int(get_engine().pool is pool))
+
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert engine.pool is pool and pool.checkedin() == 1
+
+    def test_callback(self):
+        cb = DatabaseCallback()
+        cb.on_begin(task_id="a")
+        cb.on_success(retval=None, task_id="a")
+
+        with session_scope() as session:
+            row = session.query(TaskExecution).one()
+            assert row.status == TaskStatus.COMPLETED.value
+            assert row.duration is not None
+        assert get_engine().pool.checkedout() == 0
+
+
+class DatabaseStoreTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        url = f"sqlite:///{tmpdir.name}/db.db"
+        patcher = mock.patch.dict(os.environ, {"DB_URL": url})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(dispose_engine)
+
+    def test_creates_table(self):
+        store = caches.DatabaseStore()
+        assert store.get("a", "missing") == "missing"
+
+        store.set("a", None)
+        assert store.get("a", "missing") is None
+        assert sqlalchemy.inspect(get_engine()).has_table("task_result")
+
+
+class StatusWriterTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        url = f"sqlite:///{tmpdir.name}/db.db"
+        patcher = mock.patch.dict(os.environ, {"DB_URL": url})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(dispose_engine)
+
+        Base.metadata.create_all(get_engine())
+        self.commits = []
+        sqlalchemy.event.listen(
+            get_engine(), "commit", lambda conn: self.commits.append(conn)
+        )
+
+    def executions(self) -> dict[str, int]:
+        with session_scope() as session:
+            return {e.task_id: e.status for e in session.query(TaskExecution)}
+
+    def test_coalesced(self):
+        writer = StatusWriter(batch_size=1000, flush_interval=60)
+        self.addCleanup(writer.shutdown)
+        for i in range(10):
+            writer.add(str(i), {"status": TaskStatus.RUNNING.value})
+        for i in range(5):
+            writer.add(str(i), {"status": TaskStatus.COMPLETED.value})
+
+        assert writer.pending() == 10
+        assert self.executions() == {}
+
+        self.commits.clear()
+        writer.flush()
+        assert len(self.commits) == 1
+        assert self.executions() == {
+            str(i): 2 if i < 5 else 1 for i in range(10)
+        }
+
+        # Existing executions are updated.
+        writer.add("9", {"status": TaskStatus.FAILED.value})
+        writer.flush()
+        assert self.executions()["9"] == TaskStatus.FAILED.value
+        assert writer.written == 11
+
+    def test_batch_size(self):
+        writer = StatusWriter(batch_size=5, flush_interval=60)
+        self.addCleanup(writer.shutdown)
+        for i in range(5):
+            writer.add(str(i), {"status": TaskStatus.RUNNING.value})
+
+        deadline = time.monotonic() + 5
+        while writer.written < 5 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(self.executions()) == 5
+
+    def test_bounded(self):
+        writer = StatusWriter(batch_size=1000, flush_interval=0.1, max_size=2)
+        self.addCleanup(writer.shutdown)
+        for i in range(6):
+            writer.add(str(i), {"status": TaskStatus.RUNNING.value})
+            assert writer.pending() <= 2
+
+        writer.shutdown()
+        assert len(self.executions()) == 6
+
+    def test_full_wakes_flusher(self):
+        writer = StatusWriter(batch_size=1000, flush_interval=60, max_size=2)
+        self.addCleanup(writer.shutdown)
+
+        start = time.monotonic()
+        for i in range(3):
+            writer.add(str(i), {"status": TaskStatus.RUNNING.value})
+        assert time.monotonic() - start < 5
+
+    def test_finalizer_registered_once(self):
+        writer = StatusWriter()
+        with mock.patch("multiprocessing.util.Finalize") as finalize:
+            writer.start()
+            writer.shutdown()
+            writer.start()
+            writer.shutdown()
+        assert finalize.call_count == 1
+
+    def test_buffered_callback(self):
+        task.factory.include_registry(tasks.registry)
+        backend = backends.LocalBackend()
+        self.addCleanup(backend.shutdown)
+
+        self.commits.clear()
+        promises = execution.TasksExecutor().map(
+            ADD,
+            [{"x": i, "y": 1} for i in range(20)],
+            callbacks=[DatabaseCallback(buffered=True)],
+            backend=backend,
+        )
+        [promise.result() for promise in promises]
+        assert events.flush(timeout=5)
+        get_status_writer().flush()
+
+        statuses = self.executions()
+        assert len(statuses) == 20
+        assert set(statuses.values()) == {TaskStatus.COMPLETED.value}
+        # Far less than the 40 commits of unbuffered transitions.
+        assert len(self.commits) < 20
@@ -0,0 +1,101 @@
+import threading
+import time
+
+from mlflow_executor import callback, events, execution
+from tests.base import ADD, ExecutorTestCase
+
+
+class SlowCallback(callback.Callback):
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+        self.events = []
+
+    def on_success(self, retval, task_id):
+        time.sleep(self.seconds)
+        self.events.append(retval)
+
+
+class BatchCallback(callback.Callback):
+    def __init__(self) -> None:
+        self.batches = []
+
+    def on_batch(self, events):
+        self.batches.append([event.name for event in events])
+
+
+class FailingCallback(callback.Callback):
+    def on_begin(self, task_id):
+        raise RuntimeError("Callback failed.")
+
+
+class EventBusTest(ExecutorTestCase):
+    def test_slow_callback_does_not_block(self):
+        cb = SlowCallback(seconds=0.5)
+        start = time.monotonic()
+        promise = execution.TasksExecutor().execute(
+            ADD, kwargs={"x": 1, "y": 2}, callbacks=[cb], backend=self.backend
+        )
+
+        assert promise.result() == 3
+        assert time.monotonic() - start < 0.5
+        assert events.flush(timeout=5)
+        assert cb.events == [3]
+
+    def test_failures_are_isolated(self):
+        bus = events.get_event_bus()
+        failures = bus.failures["FailingCallback"]
+        promise = execution.TasksExecutor().execute(
+            ADD,
+            kwargs={"x": 1, "y": 2},
+            callbacks=[FailingCallback()],
+            backend=self.backend,
+        )
+
+        assert promise.result() == 3
+        assert events.flush(timeout=5)
+        assert bus.failures["FailingCallback"] == failures + 1
+
+    def test_batches(self):
+        bus = events.EventBus()
+        self.addCleanup(bus.shutdown)
+        gate = threading.Event()
+        blocker = SlowCallback(seconds=0)
+        blocker.on_begin = lambda task_id: gate.wait(5)
+
+        # Events queue up while the delivery thread is blocked.
+        cb = BatchCallback()
+        bus.publish([blocker], events.Event("on_begin", "0"))
+        for name in ("on_begin", "on_success", "on_begin"):
+            bus.publish([cb], events.Event(name, "1", {"retval": 1}))
+        gate.set()
+
+        assert bus.flush(timeout=5)
+        assert cb.batches == [["on_begin", "on_success", "on_begin"]]
+        assert bus.delivered == 4
+
+    def test_drop_when_full(self):
+        bus = events.EventBus(max_size=1, overflow="drop")
+        self.addCleanup(bus.shutdown)
+        gate = threading.Event()
+        blocker = SlowCallback(seconds=0)
+        blocker.on_begin = lambda task_id: gate.wait(5)
+
+        bus.publish([blocker], events.Event("on_begin", "0"))
+        while bus._queue.qsize():
+            time.sleep(0.01)
+        bus.publish([blocker], events.Event("on_begin", "1"))
+        bus.publish([blocker], events.Event("on_begin", "2"))
+        gate.set()
+
+        assert bus.flush(timeout=5)
+        assert bus.dropped == 1
+        assert bus.delivered == 2
+
+    def test_blocking_callback(self):
+        bus = events.EventBus()
+        cb = SlowCallback(seconds=0)
+        cb.blocking = True
+
+        bus.publish([cb], events.Event("on_success", "0", {"retval": 1}))
+        assert cb.events == [1]
+        assert bus.pending() == 0
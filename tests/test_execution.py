@@ -0,0 +1,486 @@
+import asyncio
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from mlflow_executor import (
+    backends,
+    callback,
+    events,
+    exceptions,
+    execution,
+    registry,
+    retry,
+    task,
+)
+from mlflow_executor.testing.runners import Sleeper
+from tests.base import ADD, FLAKY, SLEEP, ExecutorTestCase
+
+
+class TasksExecutorTest(ExecutorTestCase):
+
+    max_workers = 2
+
+    def test_execute(self):
+        promise = self.executor.execute(
+            ADD, kwargs={"x": 1, "y": 2}, backend=self.backend
+        )
+        assert promise.result() == 3
+
+    def test_map(self):
+        kwargs = [{"x": i, "y": 1} for i in range(5)]
+        promises = self.executor.map(ADD, kwargs, backend=self.backend)
+
+        assert [p.result() for p in promises] == [1, 2, 3, 4, 5]
+        assert len({p.task_id for p in promises}) == 5
+
+    def test_callbacks_per_run(self):
+        first, second = RecordingCallback(), RecordingCallback()
+        for cb in (first, second):
+            self.executor.execute(
+                ADD,
+                kwargs={"x": 1, "y": 2},
+                callbacks=[cb],
+                backend=self.backend,
+            ).result()
+
+        assert events.flush(timeout=5)
+        assert first.events == second.events == ["begin", "success"]
+
+    def test_callbacks_on_process_workers(self):
+        backend = backends.ProcessPoolBackend(max_workers=1)
+        self.addCleanup(backend.shutdown)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "events")
+            promise = self.executor.execute(
+                ADD,
+                kwargs={"x": 1, "y": 2},
+                callbacks=[FileCallback(path)],
+                backend=backend,
+            )
+            assert promise.result(timeout=30) == 3
+
+            # Delivered by the event bus of the worker process.
+            backend.shutdown()
+            with open(path) as f:
+                assert f.read() == f"{promise.task_id}\n"
+
+
+class TasksFactoryTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.factory = task.TasksFactory()
+        self.factory.registry = registry.Registry()
+        self.factory.registry.register("double")(lambda x: 2 * x)
+
+    def test_cached(self):
+        created = self.factory.create("double")
+        assert self.factory.create("double") is created
+        assert pickle.loads(pickle.dumps(task.factory.create(ADD))) is (
+            task.factory.create(ADD)
+        )
+
+    def test_invalidated(self):
+        created = self.factory.create("double")
+        self.factory.registry.register("double")(lambda x: 3 * x)
+
+        recreated = self.factory.create("double")
+        assert recreated is not created
+        assert recreated(1) == 3
+
+        self.factory.registry.unregister("double")
+        with self.assertRaises(KeyError):
+            self.factory.create("double")
+
+
+class EntryPointsTest(unittest.TestCase):
+
+    GROUP = "mlflow_executor_test.tasks"
+
+    def setUp(self) -> None:
+        # Installs a distribution providing two tasks of a plugin module.
+        self.tmpdir = tempfile.TemporaryDirectory()
+        path = self.tmpdir.name
+        with open(os.path.join(path, "executor_plugin.py"), "w") as f:
+            f.write(
+                "from mlflow_executor.registry import Registry\n"
+                "registry = Registry()\n"
+                "registry.register('plugin.double')(lambda x: 2 * x)\n"
+                "registry.register('plugin.triple')(lambda x: 3 * x)\n"
+            )
+
+        dist_info = os.path.join(path, "executor_plugin-1.0.dist-info")
+        os.mkdir(dist_info)
+        with open(os.path.join(dist_info, "METADATA"), "w") as f:
+            f.write("Name: executor-plugin\nVersion: 1.0\n")
+        with open(os.path.join(dist_info, "entry_points.txt"), "w") as f:
+            f.write(
+                f"[{self.GROUP}]\n"
+                "plugin.double = executor_plugin\n"
+                "plugin.triple = executor_plugin:registry\n"
+                "plugin.missing = executor_plugin_missing\n"
+            )
+        sys.path.insert(0, path)
+
+        self.factory = task.TasksFactory()
+        self.factory.registry = registry.Registry()
+        self.factory.include_entry_points(self.GROUP)
+
+    def tearDown(self) -> None:
+        sys.path.remove(self.tmpdir.name)
+        sys.modules.pop("executor_plugin", None)
+        self.tmpdir.cleanup()
+
+    def test_lazy(self):
+        assert sorted(self.factory.list()) == [
+            "plugin.double",
+            "plugin.missing",
+            "plugin.triple",
+        ]
+        assert "executor_plugin" not in sys.modules
+
+        assert self.factory.create("plugin.triple")(1) == 3
+        assert "executor_plugin" in sys.modules
+        assert self.factory.create("plugin.double")(1) == 2
+
+    def test_missing(self):
+        with self.assertRaises(ModuleNotFoundError):
+            self.factory.create("plugin.missing")
+
+        with self.assertRaises(KeyError):
+            self.factory.create("plugin.unknown")
+
+        with self.assertLogs("mlflow_executor.task", "ERROR"):
+            names = self.factory.get_registry()
+        assert sorted(names) == ["plugin.double", "plugin.triple"]
+
+    def test_default_factory_lazy(self):
+        # Runs in a fresh interpreter, other tests import mlflow.
+        code = (
+            "import sys\n"
+            "from mlflow_executor import task\n"
+            f"task.factory.include_entry_points({self.GROUP!r})\n"
+            "names = task.factory.list()\n"
+            "name = 'mlflow_executor.tasks.mlflow.run_mlflow'\n"
+            "assert name in names\n"
+            "assert task.factory.create('plugin.double')(1) == 2\n"
+            "assert 'mlflow' not in sys.modules\n"
+            "task.factory.create(name)\n"
+            "assert 'mlflow' in sys.modules\n"
+        )
+        env = {**os.environ, "PYTHONPATH": self.tmpdir.name}
+        subprocess.run(
+            [sys.executable, "-c", code], env=env, check=True, timeout=60
+        )
+
+
+class RecordingCallback(callback.Callback):
+    def __init__(self) -> None:
+        self.events = []
+
+    def on_begin(self, task_id):
+        self.events.append("begin")
+
+    def on_success(self, retval, task_id):
+        self.events.append("success")
+
+    def on_failure(self, exc, task_id):
+        self.events.append(type(exc).__name__)
+
+    def on_retry(self, exc, attempt, task_id):
+        self.events.append(f"retry{attempt}")
+
+
+class FileCallback(callback.Callback):
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def on_success(self, retval, task_id):
+        with open(self.path, "a") as f:
+            f.write(f"{task_id}\n")
+
+
+class CancelTest(ExecutorTestCase):
+
+    max_workers = 1
+
+    def test_cancel_pending(self):
+        cb = RecordingCallback()
+        running = self.executor.execute(
+            SLEEP, kwargs={"seconds": 0.2}, backend=self.backend
+        )
+        pending = self.executor.execute(
+            SLEEP, kwargs={"seconds": 10}, callbacks=[cb], backend=self.backend
+        )
+
+        assert pending.cancel()
+        with self.assertRaises(exceptions.TaskCancelled):
+            pending.result(timeout=1)
+
+        # The pending task never took the worker.
+        assert running.result() == 0.2
+        assert events.flush(timeout=5)
+        assert cb.events == []
+        assert self.backend.queue_depth == 0
+
+    def test_cancel_running(self):
+        cb = RecordingCallback()
+        running = self.executor.execute(
+            SLEEP, kwargs={"seconds": 10}, callbacks=[cb], backend=self.backend
+        )
+        while self.backend.active_workers == 0:
+            time.sleep(0.01)
+
+        assert running.cancel()
+        with self.assertRaises(exceptions.TaskCancelled):
+            running.result(timeout=1)
+
+        assert events.flush(timeout=5)
+        assert cb.events == ["begin", "TaskCancelled"]
+
+    def test_timeout(self):
+        promise = self.executor.execute(
+            SLEEP, kwargs={"seconds": 10}, timeout=0.1, backend=self.backend
+        )
+        with self.assertRaises(exceptions.TaskTimeout):
+            promise.result(timeout=5)
+
+
+class WaitTest(ExecutorTestCase):
+
+    max_workers = 3
+
+    def submit(self, seconds: float) -> execution.TaskPromise:
+        return self.executor.execute(
+            SLEEP, kwargs={"seconds": seconds}, backend=self.backend
+        )
+
+    def test_wait_first_completed(self):
+        slow, fast = self.submit(0.5), self.submit(0)
+        done, not_done = execution.wait(
+            [slow, fast], return_when="FIRST_COMPLETED"
+        )
+
+        assert done == {fast}
+        assert not_done == {slow}
+        assert fast.done()
+
+    def test_wait_shared_backend_promise(self):
+        promise = self.submit(0)
+        alias = execution.TaskPromise("alias", promise.backend_promise)
+
+        done, not_done = execution.wait([promise, alias])
+        assert done == {promise, alias}
+        assert not not_done
+
+    def test_as_completed(self):
+        promises = [self.submit(s) for s in (0.4, 0.2, 0)]
+        completed = list(execution.as_completed(promises))
+        assert completed == promises[::-1]
+
+    def test_result_timeout(self):
+        promise = self.submit(0.5)
+        with self.assertRaises(TimeoutError):
+            promise.result(timeout=0.01)
+
+
+class AsyncTest(ExecutorTestCase, unittest.IsolatedAsyncioTestCase):
+
+    max_workers = 2
+
+    async def test_await_promise(self):
+        promise = self.executor.execute(
+            ADD, kwargs={"x": 1, "y": 2}, backend=self.backend
+        )
+        assert await promise == 3
+
+    async def test_execute_async(self):
+        results = await asyncio.gather(
+            *(
+                self.executor.execute_async(
+                    ADD, kwargs={"x": i, "y": i}, backend=self.backend
+                )
+                for i in range(3)
+            )
+        )
+        assert results == [0, 2, 4]
+
+    async def test_execute_async_admission(self):
+        # The second task waits for a free worker without blocking the loop.
+        backend = backends.LocalBackend(
+            max_workers=1, max_queue_size=0, on_full="block"
+        )
+        self.addCleanup(backend.shutdown)
+        running = backend.run(Sleeper(0.3))
+
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while not running.done():
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        result, _ = await asyncio.gather(
+            self.executor.execute_async(ADD, (1, 2), backend=backend), tick()
+        )
+        assert result == 3
+        assert ticks > 5
+
+
+class SingleFlightTest(ExecutorTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.single_flight = execution.SingleFlight()
+
+    def submit(self, seconds: float) -> execution.TaskPromise:
+        return self.executor.execute(
+            SLEEP,
+            kwargs={"seconds": seconds},
+            backend=self.backend,
+            single_flight=self.single_flight,
+        )
+
+    def test_coalesce_in_flight(self):
+        first = self.submit(0.2)
+        second = self.submit(0.2)
+        other = self.submit(0.1)
+
+        assert second is first
+        assert other is not first
+        assert self.single_flight.coalesced == 1
+        assert self.single_flight.submitted == 2
+
+        first.result()
+        assert self.submit(0.2) is not first
+
+    def test_submit_outside_lock(self):
+        started, release = threading.Event(), threading.Event()
+
+        def slow_submit():
+            started.set()
+            release.wait(5)
+            return self.executor.execute(
+                SLEEP, kwargs={"seconds": 1}, backend=self.backend
+            )
+
+        with ThreadPoolExecutor(2) as pool:
+            first = pool.submit(self.single_flight.do, "slow", slow_submit)
+            assert started.wait(5)
+            # Other keys are not blocked by the pending submission.
+            start = time.monotonic()
+            self.submit(0)
+            assert time.monotonic() - start < 1
+            second = pool.submit(self.single_flight.do, "slow", slow_submit)
+            release.set()
+
+            assert first.result(5) is second.result(5)
+        assert self.single_flight.submitted == 2
+        assert self.single_flight.coalesced == 1
+
+
+class RetryTest(ExecutorTestCase):
+    def execute(self, key: str, max_attempts: int) -> tuple:
+        cb = RecordingCallback()
+        policy = retry.RetryPolicy(max_attempts=max_attempts, backoff=0)
+        promise = self.executor.execute(
+            FLAKY,
+            kwargs={"key": key, "failures": 2},
+            callbacks=[cb],
+            backend=self.backend,
+            retry_policy=policy,
+        )
+        return promise, cb.events
+
+    def test_retry_until_success(self):
+        promise, cb_events = self.execute(self.id(), max_attempts=3)
+        assert promise.result() == 3
+        assert events.flush(timeout=5)
+        assert cb_events == ["begin", "retry1", "retry2", "success"]
+
+    def test_attempts_exhausted(self):
+        promise, cb_events = self.execute(self.id(), max_attempts=2)
+        with self.assertRaises(RuntimeError):
+            promise.result()
+        assert events.flush(timeout=5)
+        assert cb_events == ["begin", "retry1", "RuntimeError"]
+
+    def test_exit_codes(self):
+        policy = retry.RetryPolicy(exit_codes=[137])
+        exc = RuntimeError()
+        assert not policy.should_retry(exc, 1)
+
+        exc.exit_code = 137
+        assert policy.should_retry(exc, 1)
+        assert not policy.should_retry(exceptions.TaskCancelled(), 1)
+
+
+class PipelineTest(ExecutorTestCase):
+    def test_diamond(self):
+        pipeline = execution.Pipeline()
+        a = pipeline.add("a", ADD, x=1, y=1)
+        b = pipeline.add("b", ADD, x=a, y=10)
+        c = pipeline.add("c", ADD, x=a, y=100)
+        pipeline.add("d", ADD, x=b, y=c)
+
+        run = pipeline.run(backend=self.backend)
+        assert run.succeeded
+        assert run.results == {"a": 2, "b": 12, "c": 102, "d": 114}
+
+    def test_rerun_downstream_of_failure(self):
+        key = self.id()
+        pipeline = execution.Pipeline()
+        a = pipeline.add("a", ADD, x=1, y=1)
+        b = pipeline.add("b", FLAKY, key=key, failures=1)
+        pipeline.add("c", ADD, x=a, y=b)
+        pipeline.add("d", ADD, x=a, y=0)
+
+        run = pipeline.run(backend=self.backend)
+        assert set(run.errors) == {"b"}
+        assert run.skipped == {"c"}
+        assert run.results == {"a": 2, "d": 2}
+
+        rerun = pipeline.run(backend=self.backend, previous=run)
+        assert rerun.succeeded
+        assert rerun.results == {"a": 2, "b": 2, "c": 4, "d": 2}
+
+    def test_submission_error_cancels(self):
+        pipeline = execution.Pipeline(self.executor)
+        pipeline.add("slow", SLEEP, seconds=10)
+        pipeline.add("unknown", "tests.unknown")
+
+        promises = []
+        execute = self.executor.execute
+
+        def record(*args, **kwargs):
+            promises.append(execute(*args, **kwargs))
+            return promises[-1]
+
+        self.executor.execute = record
+        with self.assertRaises(KeyError):
+            pipeline.run(backend=self.backend)
+
+        with self.assertRaises(exceptions.TaskCancelled):
+            promises[0].result(timeout=1)
+
+    def test_nested_references(self):
+        pipeline = execution.Pipeline()
+        a = pipeline.add("a", ADD, x=1, y=1)
+        b = pipeline.add("b", ADD, x=[a], y=[(a, 1)])
+        assert b.upstream == {"a"}
+
+        run = pipeline.run(backend=self.backend)
+        assert run.results == {"a": 2, "b": [2, (2, 1)]}
+
+        c = pipeline.add("c", ADD, x={"model_uri": a["uri"]}, y=0)
+        assert c.upstream == {"a"}
+        kwargs = c.resolve_kwargs({"a": {"uri": "runs:/1/model"}})
+        assert kwargs == {"x": {"model_uri": "runs:/1/model"}, "y": 0}
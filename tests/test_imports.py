@@ -0,0 +1,46 @@
+import unittest
+
+from mlflow_executor.testing import benchmark
+
+
+class ImportsTest(unittest.TestCase):
+
+    def test_no_heavy_imports(self):
+        for module in (
+            "mlflow_executor.backends",
+            "mlflow_executor.execution",
+            "mlflow_executor.project",
+            "mlflow_executor.task",
+        ):
+            _, modules = benchmark.import_time(module, repeat=1)
+            roots = {name.split(".")[0] for name in modules}
+
+            assert module in modules
+            assert not roots & set(benchmark.HEAVY_MODULES), module
+
+    def test_budget(self):
+        budgets = {
+            module: budget * 4
+            for module, budget in benchmark.IMPORT_BUDGETS_MS.items()
+        }
+
+        factory_budget = benchmark.FACTORY_BUDGET_MS * 4
+
+        assert benchmark.check_imports(budgets, factory_budget) == []
+
+    def test_factory_lookup(self):
+        _, modules = benchmark.factory_lookup_time(repeat=1)
+
+        assert "mlflow_executor.testing.tasks" not in modules["list"]
+        assert "mlflow_executor.testing.tasks" in modules["create"]
+        for names in modules.values():
+            assert "mlflow" not in names
+
+    def test_lazy_attributes(self):
+        from mlflow_executor import backends
+
+        assert backends.LocalBackend.__name__ == "LocalBackend"
+        assert "LocalBackend" in vars(backends)
+
+        with self.assertRaises(AttributeError):
+            backends.MissingBackend
@@ -0,0 +1,75 @@
+import os
+import pstats
+import tempfile
+
+from mlflow_executor import execution, profiling, registry, task
+from tests.base import ADD, ExecutorTestCase
+
+
+class ProfilingTest(ExecutorTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.output_dir = tmpdir.name
+
+    def execute(self, profiler: profiling.Profiler) -> execution.TaskPromise:
+        promise = execution.TasksExecutor().execute(
+            ADD,
+            kwargs={"x": 1, "y": 2},
+            backend=self.backend,
+            profiler=profiler,
+        )
+        assert promise.result() == 3
+        return promise
+
+    def test_reports(self):
+        profiler = profiling.Profiler(memory=True, output_dir=self.output_dir)
+        promise = self.execute(profiler)
+
+        files = sorted(os.listdir(self.output_dir))
+        assert files == [
+            f"{promise.task_id}.cpu.txt",
+            f"{promise.task_id}.memory.txt",
+            f"{promise.task_id}.pstats",
+        ]
+
+        path = os.path.join(self.output_dir, f"{promise.task_id}.pstats")
+        functions = {name for _, _, name in pstats.Stats(path).stats}
+        assert "add" in functions
+
+    def test_sample_rate(self):
+        profiler = profiling.Profiler(
+            sample_rate=0, output_dir=self.output_dir
+        )
+        self.execute(profiler)
+        assert os.listdir(self.output_dir) == []
+
+    def test_no_profiling(self):
+        tasks = registry.Registry()
+
+        @tasks("tests.profiling.subprocess")
+        @profiling.no_profiling("Runs in a subprocess.")
+        def subprocess_task():
+            return 1
+
+        task.factory.include_registry(tasks)
+        profiler = profiling.Profiler(output_dir=self.output_dir)
+        with self.assertLogs("mlflow_executor.execution.runner", "INFO"):
+            promise = execution.TasksExecutor().execute(
+                "tests.profiling.subprocess",
+                backend=self.backend,
+                profiler=profiler,
+            )
+            assert promise.result() == 1
+        assert os.listdir(self.output_dir) == []
+
+        run_mlflow = task.factory.create(
+            "mlflow_executor.tasks.mlflow.run_mlflow"
+        )
+        assert run_mlflow.profiling_disabled is not None
+
+    def test_get_run_id(self):
+        assert profiling.get_run_id({"run_id": "abc"}) == "abc"
+        assert profiling.get_run_id(3) is None
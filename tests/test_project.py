@@ -1,6 +1,16 @@
+import os
 import unittest
 
-from mlflow_executor import backends, project
+from mlflow_executor import backends, project, retry
+from mlflow_executor.tasks.mlflow import RunFailed
+from tests.base import make_project
+
+#: Code failing with exit code 3 on its first attempt.
+FAIL_ONCE = (
+    "import pathlib, sys; p = pathlib.Path('attempts'); "
+    "n = len(p.read_text()) if p.exists() else 0; "
+    "p.write_text('x' * (n + 1)); sys.exit(3 if n == 0 else 0)"
+)
 
 
 class RunTest:
@@ -59,3 +69,50 @@ class TestMLflowExample(unittest.TestCase):
 
         test = RunTest(result, self.expected_cmd)
         test.test_all()
+
+
+class TestLocalProject(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.work_dir = make_project(self)
+
+    def run_project(self, code, **kwargs):
+        return project.run(
+            uri=self.work_dir,
+            parameters={"code": code},
+            env_manager="local",
+            **kwargs,
+        )
+
+    def test_exit_code(self) -> None:
+        result = self.run_project("import sys; sys.exit(3)").result()
+        assert result["status"] == "FAILED"
+        assert result["exit_code"] == 3
+
+    def test_raise_on_failure(self) -> None:
+        promise = self.run_project(
+            "import sys; sys.exit(3)", raise_on_failure=True
+        )
+        with self.assertRaises(RunFailed) as cm:
+            promise.result()
+        assert cm.exception.exit_code == 3
+
+    def test_signal_exit_code(self) -> None:
+        code = "import os, signal; os.kill(os.getpid(), signal.SIGKILL)"
+        result = self.run_project(code).result()
+        assert result["exit_code"] == 137
+
+    def test_retry_exit_codes(self) -> None:
+        policy = retry.RetryPolicy(backoff=0, exit_codes=[3])
+        result = self.run_project(FAIL_ONCE, retry_policy=policy).result()
+        assert result["exit_code"] == 0
+
+        with open(os.path.join(self.work_dir, "attempts")) as f:
+            assert f.read() == "xx"
+
+    def test_phases(self) -> None:
+        promise = self.run_project("pass")
+        promise.result()
+
+        phases = {"project_fetch", "env_setup", "subprocess"}
+        assert phases <= set(promise.timings.phases)
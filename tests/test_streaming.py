@@ -0,0 +1,130 @@
+import asyncio
+import queue
+
+from mlflow.projects.backend import local as local_backend
+
+from mlflow_executor import (
+    backends,
+    cache,
+    caches,
+    exceptions,
+    execution,
+    project,
+    streaming,
+)
+from tests.base import ADD, PROGRESS, ExecutorTestCase, make_project
+
+#: Code printing to stdout and stderr and reporting progress.
+OUTPUT = (
+    "import json, sys; print('hello'); print('oops', file=sys.stderr); "
+    f"print({streaming.PROGRESS_PREFIX!r} + json.dumps({{'epoch': 1}}))"
+)
+
+
+class StreamTest(ExecutorTestCase):
+
+    def test_stream(self):
+        promise = self.executor.execute(
+            PROGRESS, kwargs={"steps": 3}, backend=self.backend, stream=True
+        )
+
+        events = list(promise.stream(timeout=5))
+        assert [event.kind for event in events] == ["progress"] * 3
+        assert [event.data for event in events] == [
+            {"step": 0},
+            {"step": 1},
+            {"step": 2},
+        ]
+        assert promise.result() == 3
+
+    def test_async_stream(self):
+        async def consume():
+            promise = self.executor.execute(
+                PROGRESS,
+                kwargs={"steps": 2},
+                backend=self.backend,
+                stream=True,
+            )
+            events = [event async for event in promise.stream(timeout=5)]
+            return events, await promise
+
+        events, result = asyncio.run(consume())
+        assert len(events) == 2
+        assert result == 2
+
+    def test_backpressure(self):
+        channel = streaming.LocalChannel(max_size=1)
+        channel.put(streaming.StreamEvent("stdout", "line"))
+
+        with self.assertRaises(queue.Full):
+            channel.put(streaming.StreamEvent("stdout", "line"), timeout=0.1)
+
+    def test_close_unconsumed(self):
+        channel = streaming.LocalChannel(max_size=1)
+        channel.put(streaming.StreamEvent("stdout", "line"))
+        channel.close(timeout=0.1)
+
+        assert channel.get(timeout=1).kind == "stdout"
+
+    def test_cached(self):
+        result_cache = cache.ResultCache(caches.LRUStore())
+        kwargs = {"x": 1, "y": 2}
+        for _ in range(2):
+            promise = self.executor.execute(
+                ADD,
+                kwargs=kwargs,
+                backend=self.backend,
+                cache=result_cache,
+                stream=True,
+            )
+            assert list(promise.stream(timeout=5)) == []
+            assert promise.result() == 3
+
+    def test_single_flight(self):
+        with self.assertRaises(ValueError):
+            self.executor.execute(
+                ADD,
+                kwargs={"x": 1, "y": 2},
+                backend=self.backend,
+                single_flight=execution.SingleFlight(),
+                stream=True,
+            )
+
+    def test_mlflow_run(self):
+        promise = project.run(
+            uri=make_project(self),
+            parameters={"code": OUTPUT},
+            env_manager="local",
+            backend=self.backend,
+            stream=True,
+        )
+
+        events = list(promise.stream(timeout=30))
+        assert promise.result()["exit_code"] == 0
+        assert ("stdout", "hello") in [(e.kind, e.data) for e in events]
+        assert ("stderr", "oops") in [(e.kind, e.data) for e in events]
+        assert ("progress", {"epoch": 1}) in [(e.kind, e.data) for e in events]
+
+        # The MLflow launcher itself is never replaced.
+        assert (
+            local_backend._run_entry_point.__module__ == local_backend.__name__
+        )
+
+    def test_not_streamed(self):
+        promise = self.executor.execute(
+            ADD, kwargs={"x": 1, "y": 2}, backend=self.backend
+        )
+        with self.assertRaises(exceptions.StreamNotAvailable):
+            promise.stream()
+
+        with self.assertRaises(exceptions.StreamingNotSupported):
+            backends.ProcessPoolBackend().open_channel()
+
+    def test_parse_line(self):
+        line = streaming.PROGRESS_PREFIX + '{"epoch": 1, "loss": 0.5}\n'
+        event = streaming.parse_line("stdout", line)
+        assert event.kind == "progress"
+        assert event.data == {"epoch": 1, "loss": 0.5}
+
+        event = streaming.parse_line("stderr", "warning\n")
+        assert (event.kind, event.data) == ("stderr", "warning")
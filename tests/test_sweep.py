@@ -0,0 +1,114 @@
+import unittest
+
+from mlflow_executor import sweep
+from tests.base import ExecutorTestCase, make_project
+
+
+def make_trial(index, history):
+    trial = sweep.Trial(index, {}, f"trial-{index}")
+    trial.history = history
+    return trial
+
+
+class SearchTest(unittest.TestCase):
+    def test_grid_search(self):
+        trials = sweep.grid_search({"a": [1, 2], "b": ["x", "y", "z"]})
+        assert len(trials) == 6
+        assert {"a": 2, "b": "z"} in trials
+
+    def test_random_search_is_seeded(self):
+        space = {"a": list(range(100)), "b": list(range(100))}
+        first = sweep.random_search(space, 5, seed=0)
+        assert len(first) == 5
+        assert first == sweep.random_search(space, 5, seed=0)
+
+
+class StopperTest(unittest.TestCase):
+    def test_median_stopper(self):
+        trials = [make_trial(i, [(0, 1.0), (1, float(i))]) for i in range(4)]
+        stopper = sweep.MedianStopper(grace_steps=1, min_trials=3)
+
+        assert not stopper.should_stop(trials[0], trials, "min")
+        assert stopper.should_stop(trials[3], trials, "min")
+        assert stopper.should_stop(trials[0], trials, "max")
+
+    def test_median_stopper_grace_steps(self):
+        trials = [make_trial(i, [(0, float(i))]) for i in range(4)]
+        stopper = sweep.MedianStopper(grace_steps=1, min_trials=3)
+        assert not stopper.should_stop(trials[3], trials, "min")
+
+    def test_successive_halving(self):
+        stopper = sweep.SuccessiveHalvingStopper(rungs=[1], reduction_factor=2)
+        values = [2.0, 3.0, 1.0, 0.5]
+        trials = [make_trial(i, [(1, v)]) for i, v in enumerate(values)]
+
+        decisions = [stopper.should_stop(t, trials, "min") for t in trials]
+        assert decisions == [False, True, False, False]
+
+        # Decisions at a rung are taken once per trial.
+        assert not stopper.should_stop(trials[1], trials, "min")
+
+    def test_successive_halving_waits_for_rung(self):
+        stopper = sweep.SuccessiveHalvingStopper(rungs=[5])
+        trial = make_trial(0, [(1, 10.0)])
+        assert not stopper.should_stop(trial, [trial], "min")
+
+    def test_successive_halving_logged_after_rung(self):
+        stopper = sweep.SuccessiveHalvingStopper(rungs=[1])
+        trials = [make_trial(0, [(2, 1.0)]), make_trial(1, [(3, 2.0)])]
+
+        decisions = [stopper.should_stop(t, trials, "min") for t in trials]
+        assert decisions == [False, True]
+
+    def test_successive_halving_keeps_stopped(self):
+        stopper = sweep.SuccessiveHalvingStopper(rungs=[1, 2])
+        trials = [make_trial(0, [(1, 1.0)]), make_trial(1, [(1, 2.0)])]
+        decisions = [stopper.should_stop(t, trials, "min") for t in trials]
+        assert decisions == [False, True]
+
+        # The stopped trial is skipped, so it is not ranked at later rungs.
+        trials[1].history.append((2, 0.0))
+        assert not stopper.should_stop(trials[1], trials, "min")
+        trials[0].history.append((2, 1.0))
+        assert not stopper.should_stop(trials[0], trials, "min")
+
+    def test_successive_halving_reset(self):
+        stopper = sweep.SuccessiveHalvingStopper(rungs=[1])
+        trials = [make_trial(0, [(1, 1.0)]), make_trial(1, [(1, 2.0)])]
+        decisions = [stopper.should_stop(t, trials, "min") for t in trials]
+        assert decisions == [False, True]
+
+        # A new sweep reuses the trial indices of the previous one.
+        stopper.reset()
+        trials = [make_trial(0, [(1, 1.0)]), make_trial(1, [(1, 2.0)])]
+        decisions = [stopper.should_stop(t, trials, "min") for t in trials]
+        assert decisions == [False, True]
+
+    def test_best(self):
+        trials = [make_trial(i, [(0, float(i))]) for i in range(3)]
+        for trial in trials:
+            trial.status = "finished"
+        trials[0].status = "stopped"
+
+        result = sweep.SweepResult(trials, "loss", "min")
+        assert result.best is trials[1]
+
+
+class SweepTest(ExecutorTestCase):
+
+    def test_run(self):
+        log = "import mlflow; mlflow.log_metric('loss', {}, step=1)"
+        trials = [{"code": log.format(loss)} for loss in (0.3, 0.1, 0.2)]
+        result = sweep.Sweep(
+            uri=make_project(self),
+            trials=trials,
+            metric="loss",
+            experiment_name=f"sweep-{self.id()}",
+            max_concurrent=2,
+            poll_interval=0.1,
+            env_manager="local",
+        ).run(backend=self.backend)
+
+        assert [t.status for t in result.trials] == ["finished"] * 3
+        assert result.best is result.trials[1]
+        assert result.best.history == [(1, 0.1)]
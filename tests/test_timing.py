@@ -0,0 +1,86 @@
+import os
+import tempfile
+import unittest
+import urllib.request
+
+from mlflow_executor import execution, exporter, exporters
+from mlflow_executor.timing import Timings
+from tests.base import ADD, FLAKY, ExecutorTestCase
+
+
+class TimingsTest(ExecutorTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.exporter = exporters.InMemoryExporter()
+        exporter.add_exporter(self.exporter)
+        self.addCleanup(exporter.remove_exporter, self.exporter)
+
+    def test_phases(self):
+        promise = execution.TasksExecutor().execute(
+            ADD, kwargs={"x": 1, "y": 2}, backend=self.backend
+        )
+        promise.result()
+
+        timings = promise.timings
+        assert timings.status == "succeeded"
+        assert {"queue", "task", "callbacks"} <= set(timings.phases)
+        for event in ("submit", "dequeue", "task_start", "finish"):
+            assert event in timings.events
+        assert timings.events["submit"] <= timings.events["dequeue"]
+        assert self.exporter.timings == [timings]
+
+    def test_failure_is_exported(self):
+        promise = execution.TasksExecutor().execute(
+            FLAKY, kwargs={"key": "timings"}, backend=self.backend
+        )
+        with self.assertRaises(RuntimeError):
+            promise.result()
+
+        assert promise.timings.status == "failed"
+        assert self.exporter.timings[0].task_name == FLAKY
+
+
+class PrometheusExporterTest(unittest.TestCase):
+
+    def make_timings(self, task_seconds: float) -> Timings:
+        timings = Timings(ADD)
+        timings.status = "succeeded"
+        timings.add("task", task_seconds)
+        return timings
+
+    def test_render(self):
+        prometheus = exporters.PrometheusExporter(buckets=(1.0, 10.0))
+        prometheus.export(self.make_timings(0.5))
+        prometheus.export(self.make_timings(5.0))
+
+        text = prometheus.render()
+        labels = f'task="{ADD}",phase="task"'
+        assert (
+            f'mlflow_executor_phase_seconds_bucket{{{labels},le="1.0"}} 1'
+            in text
+        )
+        assert (
+            f'mlflow_executor_phase_seconds_bucket{{{labels},le="+Inf"}} 2'
+            in text
+        )
+        assert f"mlflow_executor_phase_seconds_count{{{labels}}} 2" in text
+        assert (
+            f'mlflow_executor_tasks_total{{task="{ADD}",status="succeeded"}} 2'
+            in text
+        )
+
+    def test_file_and_endpoint(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "metrics.prom")
+            prometheus = exporters.PrometheusExporter(path=path)
+            prometheus.export(self.make_timings(0.1))
+
+            with open(path) as f:
+                assert f.read() == prometheus.render()
+
+        server = prometheus.serve(port=0)
+        self.addCleanup(server.shutdown)
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url) as response:
+            assert response.read().decode() == prometheus.render()